@@ -75,10 +75,11 @@ def main_menu():
         print("6. 📂 Ver archivos generados")
         print("7. 📊 Ver estadísticas de ejecución")
         print("8. ⚙️  Configuración del sistema")
-        print("9. ❌ Salir")
+        print("9. 🧠 Buscar empleos por skills")
+        print("10. ❌ Salir")
         print()
         
-        choice = input("Selecciona una opción (1-9): ").strip()
+        choice = input("Selecciona una opción (1-10): ").strip()
         
         if choice == "1":
             execute_job_search()
@@ -97,10 +98,12 @@ def main_menu():
         elif choice == "8":
             system_configuration()
         elif choice == "9":
+            query_jobs_by_skills()
+        elif choice == "10":
             print("¡Hasta luego! 👋")
             break
         else:
-            print("❌ Opción inválida. Por favor selecciona 1-9.")
+            print("❌ Opción inválida. Por favor selecciona 1-10.")
         
         input("\nPresiona Enter para continuar...")
 
@@ -201,6 +204,50 @@ def show_statistics():
     print(f"📧 Email HTML: ✅ Diseño profesional")
     print(f"📦 Compresión ZIP: ✅ Automática")
 
+def query_jobs_by_skills():
+    """Query stored jobs by skills using the skill bitmap index"""
+    print("\n🧠 BÚSQUEDA DE EMPLEOS POR SKILLS...")
+    print("="*50)
+    
+    try:
+        import json
+        from job_store import JobStore
+        from skill_index import SkillIndex
+        
+        with open('config.json', 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        store_path = config.get('job_store', {}).get('path', 'job_store.db')
+        if not os.path.exists(store_path):
+            print("⚠️  No hay historial de empleos todavía. Ejecuta primero una búsqueda.")
+            return
+        
+        job_store = JobStore(store_path)
+        try:
+            index = SkillIndex.open(config, job_store)
+            print("Ejemplo: databricks AND power bi AND NOT aws")
+            print("Operadores: AND, OR, NOT y paréntesis")
+            expression = input("Consulta: ").strip()
+            if not expression:
+                print("\n📊 Empleos por skill:")
+                for line in index.summary_lines():
+                    print(f"  {line}")
+                return
+            days = input("Últimos días (Enter = 90, 0 = todos): ").strip()
+            days = int(days) if days else 90
+            
+            jobs = index.search(job_store, expression, days=days)
+            print(f"\n✅ {len(jobs)} empleos encontrados")
+            for job in jobs[-20:]:
+                print(f"  📄 {job['title']} - {job['company']} ({job['first_seen'][:10]})")
+            if len(jobs) > 20:
+                print(f"  ... y {len(jobs)-20} más")
+        finally:
+            job_store.close()
+    except ValueError as e:
+        print(f"❌ Consulta inválida: {e}")
+    except Exception as e:
+        print(f"❌ Error al consultar el índice de skills: {e}")
+
 def system_configuration():
     """System configuration menu"""
     print("\n⚙️  CONFIGURACIÓN DEL SISTEMA...")
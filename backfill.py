@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parallel re-analysis of stored jobs for the Job Automation System
+After a keyword profile change, every stored posting (or the last --days
+days) is re-scored and its skills and experience requirement re-extracted.
+The corpus is split into chunks that run in a process pool; each worker
+builds the automation system and its compiled matchers once, and results
+are written back to the job store one bulk transaction per chunk
+"""
+
+import argparse
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime, timedelta
+
+from job_store import JobStore
+
+logger = logging.getLogger(__name__)
+
+_automation = None
+
+
+def init_worker(config_path):
+    """Build one automation system (config, keyword index, caches) per worker process"""
+    global _automation
+    from simple_automation import JobAutomationSystem
+    _automation = JobAutomationSystem(config_path)
+
+
+def analyze_chunk(chunk):
+    """Score and extract one chunk of (job_id, title, description) tuples"""
+    results = []
+    for job_id, title, description in chunk:
+        job = {'title': title or '', 'description': description or ''}
+        results.append((
+            job_id,
+            _automation.calculate_compatibility(job),
+            _automation.extract_job_skills(job),
+            _automation.get_experience_requirement(job),
+        ))
+    return results
+
+
+def iter_chunks(job_store, chunk_size, after_rowid=0):
+    """Yield lists of (job_id, title, description), reading the store chunk by chunk"""
+    while True:
+        rows = list(job_store.iter_job_rows(after_rowid=after_rowid, limit=chunk_size))
+        if not rows:
+            return
+        yield [(job['job_id'], job['title'], job['description']) for _, job in rows]
+        after_rowid = rows[-1][0]
+
+
+def run_backfill(job_store, config_path='config.json', workers=None, chunk_size=1000, days=None):
+    """Re-analyze stored jobs; returns {'jobs', 'chunks', 'seconds'}
+
+    With workers=1 everything runs in this process, without a pool.
+    """
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+
+    init_worker(config_path)
+    fingerprint = _automation.score_cache.fingerprint
+    stats = {'jobs': 0, 'chunks': 0}
+    after_rowid = 0
+    if days:
+        since = (datetime.now() - timedelta(days=days)).isoformat(timespec='seconds')
+        first_rowid = job_store.first_rowid_since(since)
+        if first_rowid is None:
+            stats['seconds'] = time.perf_counter() - start
+            return stats
+        after_rowid = first_rowid - 1
+
+    def save(results):
+        job_store.save_job_analysis(results, fingerprint)
+        stats['jobs'] += len(results)
+        stats['chunks'] += 1
+        if stats['chunks'] % 10 == 0:
+            logger.info(f"Backfill: {stats['jobs']} jobs analyzed")
+
+    if workers == 1:
+        for chunk in iter_chunks(job_store, chunk_size, after_rowid):
+            save(analyze_chunk(chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(config_path,)) as executor:
+            # Keep a couple of chunks per worker in flight so reading and writing overlap with work
+            pending = set()
+            for chunk in iter_chunks(job_store, chunk_size, after_rowid):
+                pending.add(executor.submit(analyze_chunk, chunk))
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        save(future.result())
+            for future in pending:
+                save(future.result())
+
+    stats['seconds'] = time.perf_counter() - start
+    logger.info(f"Backfill finished: {stats['jobs']} jobs in {stats['chunks']} chunks, "
+                f"{stats['seconds']:.1f}s with {workers} workers")
+    return stats
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--config', default='config.json', help='Configuration file')
+    parser.add_argument('--db', help='Job store path (default: job_store.path from the config)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores)')
+    parser.add_argument('--chunk-size', type=int, default=1000, help='Jobs per chunk and per transaction')
+    parser.add_argument('--days', type=int, default=None, help='Only jobs first seen in the last N days')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    db_path = args.db
+    if db_path is None:
+        import json
+        with open(args.config, 'r', encoding='utf-8') as f:
+            db_path = json.load(f).get('job_store', {}).get('path', 'job_store.db')
+
+    job_store = JobStore(db_path)
+    try:
+        stats = run_backfill(job_store, args.config, args.workers, args.chunk_size, args.days)
+    finally:
+        job_store.close()
+    print(f"✅ {stats['jobs']} jobs re-analyzed in {stats['seconds']:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
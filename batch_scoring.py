@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vectorized compatibility scoring for the Job Automation System
+Scores a whole batch of jobs at once: keyword hits are collected into a
+sparse jobs x keywords incidence matrix, and the base percentage, key-skill
+bonus and clamping are computed as NumPy array operations
+"""
+
+import random
+
+import numpy as np
+import pandas as pd
+
+from job_text import fold_keyword, normalize_job_text
+from score_cache import stable_variation
+
+MIN_SCORE = 35
+MAX_SCORE = 95
+RANDOM_VARIATION = 5
+
+
+def job_columns(jobs):
+    """(titles, descriptions, index) of a list of job dicts or a DataFrame"""
+    if isinstance(jobs, pd.DataFrame):
+        return jobs['title'].tolist(), jobs['description'].tolist(), jobs.index
+    jobs = list(jobs)
+    return ([job.get('title') for job in jobs], [job.get('description') for job in jobs],
+            pd.RangeIndex(len(jobs)))
+
+
+def keyword_incidence(texts, keywords):
+    """Sparse jobs x keywords incidence matrix as (rows, cols) coordinate arrays
+
+    Entry (i, j) is present when keyword j occurs in text i, with the same
+    substring semantics as `keyword in text`.
+    """
+    rows = [np.empty(0, dtype=np.int64)]
+    cols = [np.empty(0, dtype=np.int64)]
+    for col, keyword in enumerate(keywords):
+        hits = np.flatnonzero(np.fromiter((keyword in text for text in texts), dtype=bool, count=len(texts)))
+        rows.append(hits)
+        cols.append(np.full(len(hits), col, dtype=np.int64))
+    return np.concatenate(rows), np.concatenate(cols)
+
+
+def score_compatibility(jobs, keywords, key_skills, randomize=True, deterministic=False):
+    """Compatibility percentages of a batch of jobs as an int Series
+
+    Gives exactly JobAutomationSystem.calculate_compatibility's result for
+    every job. With randomize the ±5% variation is derived from each job's
+    text if deterministic, otherwise drawn from the `random` module in job
+    order, as the per-job method would.
+    """
+    titles, descriptions, index = job_columns(jobs)
+    job_texts = [normalize_job_text(title, description) for title, description in zip(titles, descriptions)]
+    texts = [job_text.text for job_text in job_texts]
+
+    # One column per distinct folded keyword, weighted by how often each list names it
+    columns = list(dict.fromkeys(keyword for keyword in map(fold_keyword, [*keywords, *key_skills]) if keyword))
+    column_index = {keyword: col for col, keyword in enumerate(columns)}
+    skill_weights = np.zeros(len(columns))
+    key_weights = np.zeros(len(columns))
+    for weights, keyword_list in ((skill_weights, keywords), (key_weights, key_skills)):
+        for keyword in map(fold_keyword, keyword_list):
+            if keyword:
+                weights[column_index[keyword]] += 1
+
+    rows, cols = keyword_incidence(texts, columns)
+    matches = np.bincount(rows, weights=skill_weights[cols], minlength=len(texts))
+    key_matches = np.bincount(rows, weights=key_weights[cols], minlength=len(texts))
+
+    total_possible = len(keywords)
+    base_percentage = (matches / total_possible) * 100 if total_possible > 0 else np.zeros(len(texts))
+    final_percentage = np.clip(base_percentage + (0.5 * key_matches) * 5, MIN_SCORE, MAX_SCORE)
+
+    if randomize:
+        if deterministic:
+            variation = np.array([stable_variation(job_text.content_hash, RANDOM_VARIATION)
+                                  for job_text in job_texts], dtype=np.int64)
+        else:
+            variation = np.array([random.randint(-RANDOM_VARIATION, RANDOM_VARIATION) for _ in texts],
+                                 dtype=np.int64)
+        final_percentage = np.clip(final_percentage + variation, MIN_SCORE, MAX_SCORE)
+
+    return pd.Series(final_percentage.astype(int), index=index, name='compatibility')
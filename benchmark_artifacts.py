@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark the document and archive stage of a run
+Renders a CV and a cover letter per job and packs them with the job summary
+into the run's ZIP archive: the old way (save every file, write the summary
+to disk, read everything back into the archive), streaming the in-memory
+documents into the archive while still writing the loose files, and with
+--no-loose-files, where only the archive is written
+"""
+
+import argparse
+import logging
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from document_renderer import DocumentRenderer
+from simple_automation import JobAutomationSystem
+
+COMPANIES = ["BBVA", "Iberdrola", "Telefónica", "Repsol", "Inditex", "Santander", "Acme & Co"]
+TITLES = ["Data Analyst", "BI Developer", "Senior Data Analyst", "Analista de Datos", "Data Scientist"]
+SKILLS = ["machine learning", "azure", "tableau", "python", "sql", "power bi"]
+
+
+def make_jobs(count, rng):
+    return [{
+        "title": f"{rng.choice(TITLES)} {i}",
+        "company": rng.choice(COMPANIES),
+        "location": "Madrid",
+        "url": f"https://example.com/jobs/{i}",
+        "description": " ".join(rng.sample(SKILLS, 3)),
+    } for i in range(count)]
+
+
+def read_io_counters():
+    """(write syscalls, bytes written) of this process, or None where /proc is not available"""
+    try:
+        with open('/proc/self/io', 'r') as f:
+            counters = dict(line.split(': ') for line in f.read().splitlines())
+        return int(counters['syscw']), int(counters['wchar'])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def run_from_disk(automation, jobs, output_dir):
+    """Save every document to its file and let the archive read them back, as before"""
+    for job in jobs:
+        automation.cvs_generated.append(automation.generate_cv_for_job(job, output_dir))
+        automation.cvs_generated.append(automation.generate_cover_letter(job, output_dir))
+    summary_path = os.path.join(output_dir, "Job_Summary.txt")
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        for job in jobs:
+            f.write(f"{job['title']} - {job['company']}\n")
+    automation.create_job_applications_zip(jobs, output_dir)
+
+
+def run_in_memory(automation, jobs, output_dir, loose_files):
+    renderer = DocumentRenderer(automation, 1, loose_files=loose_files)
+    try:
+        documents = renderer.render(jobs, output_dir)
+    finally:
+        renderer.close()
+    automation.create_job_applications_zip(jobs, output_dir, documents)
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=300, help='Jobs to render documents for')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    automation = JobAutomationSystem()
+    jobs = make_jobs(args.jobs, random.Random(args.seed))
+
+    print("ARTIFACT PIPELINE BENCHMARK")
+    print("=" * 40)
+    print(f"{args.jobs} jobs | 2 documents per job + summary | 1 worker")
+
+    for name, run in (
+        ("Disk", run_from_disk),
+        ("Memory", lambda *run_args: run_in_memory(*run_args, True)),
+        ("ZIP only", lambda *run_args: run_in_memory(*run_args, False)),
+    ):
+        automation.cvs_generated = []
+        output_dir = tempfile.mkdtemp()
+        try:
+            before = read_io_counters()
+            start = time.perf_counter()
+            run(automation, jobs, output_dir)
+            elapsed = time.perf_counter() - start
+            after = read_io_counters()
+            files = len(os.listdir(output_dir))
+        finally:
+            shutil.rmtree(output_dir)
+
+        line = f"{name:<9} {elapsed:6.2f}s  {files:4d} files"
+        if before and after:
+            line += f"  {after[0] - before[0]:7d} write calls  {(after[1] - before[1]) / 1024 / 1024:6.1f} MB written"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark the parallel backfill
+Stores a synthetic corpus once, then re-analyzes it with an increasing
+number of worker processes and reports the speedup over one worker
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from backfill import run_backfill
+from job_store import JobStore
+
+WORDS = ("datos analista python sql power bi tableau excel etl azure aws spark equipo experiencia "
+         "años madrid barcelona remoto senior junior informes dashboard negocio cliente empresa "
+         "business intelligence machine learning modelo financiero reporting análisis").split()
+
+
+def make_jobs(count, rng):
+    return [{
+        "title": " ".join(rng.choice(WORDS) for _ in range(4)).title(),
+        "company": f"Company {i % 500}",
+        "url": f"https://example.com/jobs/{i}",
+        "description": " ".join(rng.choice(WORDS) for _ in range(rng.randint(40, 120))),
+    } for i in range(count)]
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=50000, help='Jobs in the corpus')
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--workers', type=int, nargs='+', default=None,
+                        help='Worker counts to try (default: 1, 2, 4, ... up to the core count)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    worker_counts = args.workers or sorted({min(2 ** i, cores) for i in range(cores.bit_length() + 1)})
+
+    print("BACKFILL BENCHMARK")
+    print("=" * 40)
+    print(f"{args.jobs} jobs | chunks of {args.chunk_size} | {cores} cores")
+
+    directory = tempfile.mkdtemp()
+    try:
+        template = os.path.join(directory, "corpus.db")
+        store = JobStore(template)
+        store.record_seen_many(make_jobs(args.jobs, random.Random(args.seed)))
+        store.close()
+
+        baseline = None
+        for workers in worker_counts:
+            path = os.path.join(directory, f"workers_{workers}.db")
+            shutil.copyfile(template, path)
+            store = JobStore(path)
+            start = time.perf_counter()
+            run_backfill(store, workers=workers, chunk_size=args.chunk_size)
+            elapsed = time.perf_counter() - start
+            store.close()
+            baseline = baseline or elapsed
+            print(f"{workers:>3} workers {elapsed:7.2f}s ({args.jobs / elapsed:,.0f} jobs/s, "
+                  f"{baseline / elapsed:.1f}x)")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
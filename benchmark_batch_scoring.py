@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark compatibility scoring of a large backfill
+Scores the same jobs one at a time with calculate_compatibility and in one
+call to calculate_compatibility_batch, with randomness off so both results
+can be compared
+"""
+
+import argparse
+import random
+import time
+
+from simple_automation import JobAutomationSystem
+
+WORDS = ("datos analista python sql power bi tableau excel etl azure aws spark equipo experiencia "
+         "años madrid barcelona remoto senior junior informes dashboard negocio cliente empresa "
+         "business intelligence machine learning modelo financiero reporting análisis").split()
+
+
+def make_jobs(count, rng):
+    return [{
+        "title": " ".join(rng.choice(WORDS) for _ in range(4)).title(),
+        "description": " ".join(rng.choice(WORDS) for _ in range(rng.randint(40, 120))),
+    } for _ in range(count)]
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=100000, help='Jobs to score')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    automation = JobAutomationSystem()
+    jobs = make_jobs(args.jobs, random.Random(args.seed))
+
+    print("BATCH SCORING BENCHMARK")
+    print("=" * 40)
+    print(f"{args.jobs} jobs | {len(automation.config['job_search']['keywords'])} keywords")
+
+    start = time.perf_counter()
+    per_job = [automation.calculate_compatibility(job, randomize=False) for job in jobs]
+    per_job_time = time.perf_counter() - start
+    print(f"{'Per job':<8} {per_job_time:.2f}s")
+
+    start = time.perf_counter()
+    batch = automation.calculate_compatibility_batch(jobs, randomize=False).tolist()
+    batch_time = time.perf_counter() - start
+    print(f"{'Batch':<8} {batch_time:.2f}s ({per_job_time / batch_time:.1f}x)")
+
+    print("Scores identical" if batch == per_job else "WARNING: scores differ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark BM25 ranking as the job corpus grows
+For job stores of increasing size, compares recomputing the document
+frequencies from scratch with the incremental update of one run's new jobs,
+followed by ranking those jobs
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from bm25 import BM25Ranker
+from job_store import JobStore
+
+WORDS = ("datos analista python sql power bi tableau excel etl azure aws spark equipo experiencia "
+         "años madrid barcelona remoto senior junior informes dashboard negocio cliente empresa "
+         "business intelligence machine learning modelo financiero reporting databricks").split()
+CONFIG = {"job_search": {"keywords": ["python", "sql", "power bi", "databricks", "machine learning", "etl"]}}
+
+
+def make_jobs(start, count, rng):
+    return [{
+        "title": " ".join(rng.choice(WORDS) for _ in range(4)).title(),
+        "company": "Acme",
+        "url": f"https://example.com/of-{start + i}",
+        "description": " ".join(rng.choice(WORDS) for _ in range(rng.randint(40, 150))),
+    } for i in range(count)]
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 50000, 200000], help='Corpus sizes')
+    parser.add_argument('--new-jobs', type=int, default=500, help='Jobs added by one run')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print("BM25 BENCHMARK")
+    print("=" * 40)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = JobStore(os.path.join(tmp, "jobs.db"))
+        stored = 0
+        for size in args.sizes:
+            store.record_seen_many(make_jobs(stored, size - stored, rng))
+            stored = size
+
+            start = time.perf_counter()
+            rebuilt = BM25Ranker.from_config(CONFIG)
+            for _, job in store.iter_job_rows():
+                rebuilt.add_document(f"{job['title']} {job['description']}".lower().split())
+            rebuild_time = time.perf_counter() - start
+
+            BM25Ranker.open(CONFIG, store)
+            new_jobs = make_jobs(stored, args.new_jobs, rng)
+            store.record_seen_many(new_jobs)
+            stored += args.new_jobs
+
+            start = time.perf_counter()
+            BM25Ranker.open(CONFIG, store).rank(new_jobs)
+            run_time = time.perf_counter() - start
+            print(f"{size:>8} jobs | full recount {rebuild_time:6.2f}s | incremental update + rank "
+                  f"{run_time * 1000:6.1f}ms ({run_time / args.new_jobs * 1e6:.0f}us per new job)")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark CV and cover letter rendering
+Renders a CV and a cover letter per job by building each document from
+scratch with python-docx, by refilling python-docx templates, with the
+direct OOXML writer, with the writer in a pool of worker processes (pool
+start-up included), and from a warm render cache. Peak memory allocated
+while rendering one document is measured with tracemalloc
+"""
+
+import argparse
+import logging
+import os
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from document_renderer import DocumentRenderer
+from document_templates import DocumentTemplate
+from render_cache import RenderCache
+from simple_automation import JobAutomationSystem
+
+COMPANIES = ["BBVA", "Iberdrola", "Telefónica", "Repsol", "Inditex", "Santander", "Acme & Co"]
+TITLES = ["Data Analyst", "BI Developer", "Senior Data Analyst", "Analista de Datos", "Data Scientist"]
+SKILLS = ["machine learning", "azure", "tableau", "python", "sql", "power bi"]
+
+
+def make_jobs(count, rng):
+    return [{
+        "title": f"{rng.choice(TITLES)} {i}",
+        "company": rng.choice(COMPANIES),
+        "description": " ".join(rng.sample(SKILLS, 3)),
+    } for i in range(count)]
+
+
+def render_from_scratch(automation, jobs, output_dir):
+    """Build both documents from scratch, as generate_cv_for_job did before templates"""
+    start = time.perf_counter()
+    for job in jobs:
+        for kind, fields, build in (
+            ('cv', automation.get_cv_fields(job), automation.build_cv_document),
+            ('cover_letter', automation.get_cover_letter_fields(job), automation.build_cover_letter_document),
+        ):
+            build(fields).save(os.path.join(output_dir, automation.get_document_filename(kind, job)))
+    return time.perf_counter() - start
+
+
+def render_from_templates(automation, jobs, output_dir):
+    """Refill python-docx templates, as generate_cv_for_job did before the OOXML writer"""
+    templates = {'cv': DocumentTemplate(automation.build_cv_document),
+                 'cover_letter': DocumentTemplate(automation.build_cover_letter_document)}
+    start = time.perf_counter()
+    for job in jobs:
+        for kind, template in templates.items():
+            template.render(automation.get_document_fields(kind, job),
+                            os.path.join(output_dir, automation.get_document_filename(kind, job)))
+    return time.perf_counter() - start
+
+
+def render_with_writer(automation, jobs, output_dir):
+    start = time.perf_counter()
+    for job in jobs:
+        automation.generate_cv_for_job(job, output_dir)
+        automation.generate_cover_letter(job, output_dir)
+    return time.perf_counter() - start
+
+
+def render_in_pool(automation, jobs, output_dir, workers, cache=None):
+    start = time.perf_counter()
+    renderer = DocumentRenderer(automation, workers, cache)
+    try:
+        renderer.render(jobs, output_dir)
+    finally:
+        renderer.close()
+    return time.perf_counter() - start
+
+
+def render_from_cache(automation, jobs, output_dir):
+    """Fill a render cache with one pass, then time a second pass served from it"""
+    cache = RenderCache(os.path.join(output_dir, '.render_cache'))
+    os.makedirs(os.path.join(output_dir, 'warm'))
+    render_in_pool(automation, jobs, os.path.join(output_dir, 'warm'), 1, cache)
+    return render_in_pool(automation, jobs, output_dir, 1, cache)
+
+
+def peak_allocation(render, automation, jobs, output_dir):
+    """Mean peak of memory allocated while rendering one job's documents, per document"""
+    render(automation, jobs[:1], output_dir)  # Build templates outside the measurement
+    peaks = []
+    tracemalloc.start()
+    try:
+        for job in jobs:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            render(automation, [job], output_dir)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return sum(peaks) / len(peaks) / 2
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=500, help='Jobs to render documents for')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Worker processes for the pool')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    automation = JobAutomationSystem()
+    jobs = make_jobs(args.jobs, random.Random(args.seed))
+
+    print("DOCUMENT RENDERING BENCHMARK")
+    print("=" * 40)
+    print(f"{args.jobs} jobs | 2 documents per job | {os.cpu_count()} cores")
+
+    baseline = None
+    for name, render in (
+        ("Scratch", render_from_scratch),
+        ("Template", render_from_templates),
+        ("OOXML", render_with_writer),
+        (f"Pool ({args.workers})", lambda *render_args: render_in_pool(*render_args, args.workers)),
+        ("Cached", render_from_cache),
+    ):
+        output_dir = tempfile.mkdtemp()
+        try:
+            elapsed = render(automation, jobs, output_dir)
+        finally:
+            shutil.rmtree(output_dir)
+        per_document = elapsed / (2 * args.jobs) * 1000
+        baseline = baseline or per_document
+        print(f"{name:<10} {elapsed:6.2f}s  {per_document:5.1f}ms per document ({baseline / per_document:.1f}x)")
+
+    print("\nPeak allocation per document")
+    for name, render in (
+        ("Scratch", render_from_scratch),
+        ("Template", render_from_templates),
+        ("OOXML", render_with_writer),
+    ):
+        output_dir = tempfile.mkdtemp()
+        try:
+            peak = peak_allocation(render, automation, jobs[:20], output_dir)
+        finally:
+            shutil.rmtree(output_dir)
+        print(f"{name:<10} {peak / 1024:8.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark the conditional-GET feed cache across two scheduled runs
+The first run downloads and parses every feed; the second run should only
+pay one revalidation round-trip per feed and do no parse work
+"""
+
+import argparse
+import tempfile
+import time
+from unittest import mock
+
+from final_automation import JobAutomationSystem
+from http_cache import FeedHttpCache
+from local_feed_server import LocalFeedServer
+
+
+def timed_run(automation, feed_urls):
+    """Run one ingestion pass and return (elapsed_seconds, jobs, parse_calls)"""
+    with mock.patch.object(automation, 'parse_feed_entries', wraps=automation.parse_feed_entries) as parse:
+        start = time.perf_counter()
+        jobs = automation.search_jobs_real_sources(feed_urls)
+        return time.perf_counter() - start, jobs, parse.call_count
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--feeds', type=int, default=6)
+    parser.add_argument('--items', type=int, default=200, help='Entries per feed')
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--no-etags', action='store_true', help='Server ignores validators (content-hash fallback)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir, \
+            LocalFeedServer(latency=args.latency, items_per_feed=args.items, use_etags=not args.no_etags) as server:
+        feed_urls = [server.url(f"rss/ofertas-empleo/feed-{i}/") for i in range(args.feeds)]
+
+        print("FEED CACHE BENCHMARK")
+        print("=" * 40)
+        for run in ("09:00 run", "19:00 run"):
+            automation = JobAutomationSystem()
+            automation.feed_cache = FeedHttpCache(cache_dir=cache_dir)
+            elapsed, jobs, parses = timed_run(automation, feed_urls)
+            print(f"{run}: {elapsed:.3f}s | {len(jobs)} jobs | {parses} feed parses")
+            print(f"  {automation.feed_cache.summary()}")
+
+        print(f"Requests served: {server.request_count} ({server.not_modified_count} answered 304)")
+
+
+if __name__ == "__main__":
+    main()
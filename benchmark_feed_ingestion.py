@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark serial vs concurrent feed ingestion
+Uses local stand-in feed servers so no internet connection is needed
+"""
+
+import argparse
+import time
+
+from final_automation import JobAutomationSystem
+from local_feed_server import LocalFeedServer
+
+
+def run_ingestion(automation, feed_urls, concurrent):
+    """Run one ingestion pass and return (elapsed_seconds, jobs)"""
+    automation.config.setdefault('ingestion', {})['concurrent'] = concurrent
+    start = time.perf_counter()
+    jobs = automation.search_jobs_real_sources(feed_urls)
+    return time.perf_counter() - start, jobs
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--latency', type=float, default=0.3, help='Simulated latency per feed (seconds)')
+    parser.add_argument('--feeds', type=int, default=6, help='Number of feeds per run')
+    parser.add_argument('--max-workers', type=int, default=6)
+    parser.add_argument('--per-host-limit', type=int, default=4)
+    args = parser.parse_args()
+
+    # Two servers stand in for infojobs.net and tecnoempleo.com
+    with LocalFeedServer(latency=args.latency) as infojobs, LocalFeedServer(latency=args.latency) as tecnoempleo:
+        feed_urls = []
+        for i in range(args.feeds):
+            server = infojobs if i % 3 != 2 else tecnoempleo
+            feed_urls.append(server.url(f"rss/ofertas-empleo/feed-{i}/"))
+
+        automation = JobAutomationSystem()
+        automation.feed_cache = None  # Measure real downloads on every pass
+        automation.http.rate_limiter = None  # Both passes hit the same stand-in hosts back to back
+        automation.config['ingestion'] = {
+            'max_workers': args.max_workers,
+            'per_host_limit': args.per_host_limit,
+        }
+
+        serial_time, serial_jobs = run_ingestion(automation, feed_urls, concurrent=False)
+        concurrent_time, concurrent_jobs = run_ingestion(automation, feed_urls, concurrent=True)
+
+    same_result = [job['url'] for job in serial_jobs] == [job['url'] for job in concurrent_jobs]
+
+    print("FEED INGESTION BENCHMARK")
+    print("=" * 40)
+    print(f"Feeds: {len(feed_urls)} | Latency per feed: {args.latency:.2f}s")
+    print(f"Max workers: {args.max_workers} | Per-host limit: {args.per_host_limit}")
+    print(f"Serial:     {serial_time:.3f}s ({len(serial_jobs)} jobs)")
+    print(f"Concurrent: {concurrent_time:.3f}s ({len(concurrent_jobs)} jobs)")
+    print(f"Speedup:    {serial_time / concurrent_time:.1f}x")
+    print(f"Same job list: {'yes' if same_result else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark full feedparser parsing vs the streaming parser with an entry budget
+Feeds are generated in memory; the streaming path should cost the same
+whatever the feed size, because it stops once the budget is met
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from feed_parser import iter_chunks
+from final_automation import JobAutomationSystem
+from http_cache import BodyReader
+from local_feed_server import build_rss_feed
+
+FEED_URL = "https://jobs.example.com/rss/ofertas-empleo/data-analyst/"
+
+
+def measure(automation, parser_name, data, max_entries):
+    """Parse one feed and return (seconds, peak_bytes, bytes_read, entries)"""
+    automation.config.setdefault('ingestion', {})['parser'] = parser_name
+    reader = BodyReader(iter_chunks(data))
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    entries = automation.parse_feed_entries(FEED_URL, reader, max_entries)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak, reader.bytes_read, entries
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000],
+                        help='Entries per feed')
+    parser.add_argument('--max-entries', type=int, default=5, help='Relevant entries kept per feed')
+    args = parser.parse_args()
+
+    automation = JobAutomationSystem()
+
+    print("FEED PARSER BENCHMARK")
+    print("=" * 78)
+    print(f"{'entries':>8} {'feed size':>10} | {'feedparser':>22} | {'streaming':>30}")
+    for size in args.sizes:
+        data = build_rss_feed("data-analyst", items_per_feed=size)
+        full_time, full_peak, _, full_entries = measure(automation, 'feedparser', data, args.max_entries)
+        stream_time, stream_peak, stream_read, stream_entries = measure(automation, 'streaming', data, args.max_entries)
+
+        same = [e['link'] for e in full_entries] == [e['link'] for e in stream_entries]
+        print(f"{size:>8} {len(data) / 1024:>8.0f}KB | "
+              f"{full_time * 1000:>8.1f}ms {full_peak / 1024:>9.0f}KB | "
+              f"{stream_time * 1000:>7.2f}ms {stream_peak / 1024:>6.0f}KB {stream_read / 1024:>6.0f}KB read"
+              f"{'' if same else '  (entries differ!)'}")
+
+
+if __name__ == "__main__":
+    main()
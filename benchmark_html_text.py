@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark cleaning large, messy feed summaries
+Compares the previous clean_description (two regex passes over the whole
+summary, then truncation) with html_to_text, which stops at the 500
+character budget, also on broken markup full of unclosed tags
+"""
+
+import argparse
+import random
+import re
+import time
+
+from html_text import html_to_text
+
+WORDS = ("datos analista python sql power bi tableau excel etl azure aws spark equipo experiencia "
+         "años madrid barcelona remoto senior junior informes dashboard negocio cliente empresa").split()
+NOISE = [
+    '<script type="text/javascript">var tracking = {"id": "<div>", "n": 42};</script>',
+    '<style>.job { font-family: Arial; color: #333 }</style>',
+    '<img src="https://example.com/pixel.gif?a=1&amp;b=2" alt="">',
+    '<!-- generated by the ATS -->',
+    '<a href="https://example.com/apply?ref=feed&amp;utm=rss" class=\'btn\'>Aplicar</a>',
+    '<span style="font-weight:bold">&nbsp;&#8226;&nbsp;</span>',
+]
+
+
+def make_summary(rng, size):
+    """Messy HTML summary of about `size` characters"""
+    parts = []
+    length = 0
+    while length < size:
+        if rng.random() < 0.3:
+            part = rng.choice(NOISE)
+        else:
+            tag = rng.choice(['p', 'li', 'div', 'td'])
+            words = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(5, 30)))
+            part = f"<{tag}>{words} &amp; m&aacute;s</{tag}>"
+        parts.append(part)
+        length += len(part)
+    return ''.join(parts)
+
+
+def make_broken_summary(rng, size):
+    """Summary of about `size` characters whose tags are never closed"""
+    parts = []
+    length = 0
+    while length < size:
+        part = f'{rng.choice(WORDS)} <a href="{rng.choice(WORDS)} ' + ' '.join(rng.sample(WORDS, 5)) + ' '
+        parts.append(part)
+        length += len(part)
+    return ''.join(parts)
+
+
+def regex_clean(description):
+    """clean_description before html_to_text"""
+    clean_text = re.sub(r'<[^>]+>', '', description)
+    clean_text = re.sub(r'\s+', ' ', clean_text).strip()
+    return clean_text[:500] + "..." if len(clean_text) > 500 else clean_text
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--summaries', type=int, default=200, help='Summaries to clean')
+    parser.add_argument('--size', type=int, default=200000, help='Characters per summary')
+    parser.add_argument('--max-chars', type=int, default=500, help='Output budget')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    summaries = [make_summary(rng, args.size) for _ in range(args.summaries)]
+
+    print("HTML CLEANER BENCHMARK")
+    print("=" * 40)
+    print(f"{args.summaries} summaries | {args.size:,} characters each | budget {args.max_chars}")
+
+    start = time.perf_counter()
+    for summary in summaries:
+        regex_clean(summary)
+    regex_time = time.perf_counter() - start
+    print(f"{'Regex':<10} {regex_time:.3f}s")
+
+    start = time.perf_counter()
+    for summary in summaries:
+        html_to_text(summary, max_chars=args.max_chars)
+    stream_time = time.perf_counter() - start
+    print(f"{'Streaming':<10} {stream_time:.3f}s ({regex_time / stream_time:.0f}x)")
+
+    start = time.perf_counter()
+    for summary in summaries[:10]:
+        html_to_text(summary)
+    full_time = (time.perf_counter() - start) / min(10, len(summaries))
+    print(f"{'Unbounded':<10} {full_time * 1000:.1f}ms per summary")
+
+    broken = [make_broken_summary(rng, args.size) for _ in range(10)]
+    start = time.perf_counter()
+    for summary in broken:
+        html_to_text(summary, max_chars=args.max_chars)
+    broken_time = (time.perf_counter() - start) / len(broken)
+    print(f"{'Unclosed':<10} {broken_time * 1000:.1f}ms per summary")
+
+    print(f"\nSample: {html_to_text(summaries[0], max_chars=160)!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark one-off requests.get calls vs the shared pooled HTTP client
+Counts the TCP connections the stand-in feed servers had to accept
+"""
+
+import argparse
+import time
+
+import requests
+
+from http_client import HttpClient
+from local_feed_server import LocalFeedServer
+
+
+def run(get, servers, requests_per_host):
+    """Fetch every feed path once per host and return (elapsed_seconds, bytes)"""
+    total_bytes = 0
+    start = time.perf_counter()
+    for i in range(requests_per_host):
+        for server in servers:
+            response = get(server.url(f"rss/ofertas-empleo/feed-{i}/"), timeout=(5, 30))
+            response.raise_for_status()
+            total_bytes += len(response.content)
+    return time.perf_counter() - start, total_bytes
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--hosts', type=int, default=2)
+    parser.add_argument('--requests', type=int, default=100, help='Requests per host')
+    parser.add_argument('--items', type=int, default=50, help='Entries per feed')
+    parser.add_argument('--handshake', type=float, default=0.03, help='Simulated TCP/TLS setup per connection')
+    args = parser.parse_args()
+
+    print("HTTP CLIENT BENCHMARK")
+    print("=" * 40)
+    for label in ("requests.get", "HttpClient"):
+        servers = [LocalFeedServer(latency=0, items_per_feed=args.items, handshake_latency=args.handshake).start()
+                   for _ in range(args.hosts)]
+        client = HttpClient() if label == "HttpClient" else None
+        try:
+            elapsed, total_bytes = run(client.get if client else requests.get, servers, args.requests)
+            connections = sum(server.connection_count for server in servers)
+            print(f"{label:<13} {elapsed:.3f}s | {args.hosts * args.requests} requests | "
+                  f"{connections} connections | {total_bytes / 1024:.0f}KB decoded")
+        finally:
+            if client:
+                client.close()
+            for server in servers:
+                server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark memory per job for plain job dicts and slotted Job records
+Jobs are built the way sources build them: every field is a fresh string,
+as if just parsed from a feed or API response
+"""
+
+import argparse
+import gc
+import random
+import tracemalloc
+from datetime import datetime, timedelta
+
+from job_record import Job
+
+COMPANIES = ["Banco Santander", "Telefónica", "Iberdrola", "BBVA", "Repsol", "Indra", "Inditex", "Mapfre"]
+LOCATIONS = ["Madrid", "Barcelona", "Bilbao", "Valencia", "Sevilla", "Remoto"]
+FEEDS = [f"https://www.infojobs.net/rss/feed-{i}/" for i in range(20)]
+
+
+def fresh(text):
+    """Copy of a string as a new object, like a value decoded from a response"""
+    return text.encode('utf-8').decode('utf-8')
+
+
+def make_raw_jobs(count, rng):
+    start = datetime(2025, 1, 1)
+    for i in range(count):
+        yield {
+            "title": f"Data Analyst {i}",
+            "company": fresh(rng.choice(COMPANIES)),
+            "location": fresh(rng.choice(LOCATIONS)),
+            "url": f"https://www.infojobs.net/oferta/of-{i:08d}",
+            "description": f"Oferta {i}: Python, SQL y Power BI",
+            "posted_date": (start + timedelta(minutes=i)).isoformat(),
+            "source": fresh(rng.choice(FEEDS)),
+        }
+
+
+def measure(count, seed, build):
+    """Bytes allocated per job while holding `count` jobs"""
+    rng = random.Random(seed)
+    gc.collect()
+    tracemalloc.start()
+    jobs = [build(raw) for raw in make_raw_jobs(count, rng)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(jobs) == count
+    return current / count
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=100000, help='Jobs to hold in memory')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print("JOB MEMORY BENCHMARK")
+    print("=" * 40)
+    print(f"{args.jobs} jobs")
+
+    dict_bytes = measure(args.jobs, args.seed, dict)
+    record_bytes = measure(args.jobs, args.seed, Job.from_dict)
+    print(f"{'Dict':<8} {dict_bytes:.0f} bytes per job | {dict_bytes * args.jobs / 2 ** 20:.1f} MiB")
+    print(f"{'Job':<8} {record_bytes:.0f} bytes per job | {record_bytes * args.jobs / 2 ** 20:.1f} MiB")
+    print(f"Saved {1 - record_bytes / dict_bytes:.0%}")
+
+
+if __name__ == "__main__":
+    main()
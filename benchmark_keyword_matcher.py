@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark keyword matching over many job descriptions
+Compares the per-method approach (each of six helpers lowercases the job
+text and tests its own keyword list with `in`) with one Aho-Corasick pass
+per job whose match set all six helpers share
+"""
+
+import argparse
+import random
+import time
+
+from keyword_matcher import KeywordIndex
+
+WORDS = ("datos analista python sql power bi tableau excel etl azure aws spark equipo experiencia "
+         "años madrid barcelona remoto senior junior informes dashboard negocio cliente empresa "
+         "business intelligence machine learning modelo financiero reporting").split()
+
+
+def make_keyword_lists(count, size, rng):
+    """`count` keyword lists of `size` terms each, mixing real and synthetic terms"""
+    lists = []
+    for list_index in range(count):
+        terms = set(rng.sample(WORDS, 8))
+        while len(terms) < size:
+            terms.add(f"{rng.choice(WORDS)}{list_index}-{len(terms)}")
+        lists.append(sorted(terms))
+    return lists
+
+
+def make_jobs(count, rng):
+    return [{
+        "title": " ".join(rng.choice(WORDS) for _ in range(5)).title(),
+        "description": " ".join(rng.choice(WORDS) for _ in range(rng.randint(60, 200))).capitalize(),
+    } for _ in range(count)]
+
+
+def scan_per_method(jobs, keyword_lists):
+    """Each helper rebuilds the text and scans its own list"""
+    hits = 0
+    for job in jobs:
+        for keywords in keyword_lists:
+            job_text = f"{job['title']} {job['description']}".lower()
+            hits += sum(1 for keyword in keywords if keyword in job_text)
+    return hits
+
+
+def scan_shared(jobs, keyword_lists):
+    """One automaton pass per job, every helper counts from the shared match set"""
+    index = KeywordIndex(*keyword_lists, cache_size=0)
+    hits = 0
+    for job in jobs:
+        matches = index.match_job(job)
+        for keywords in keyword_lists:
+            hits += matches.count(keywords)
+    return hits
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=3000, help='Job descriptions to match')
+    parser.add_argument('--keywords', type=int, default=1000, help='Terms per keyword list')
+    parser.add_argument('--lists', type=int, default=6, help='Keyword lists (one per helper method)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    keyword_lists = make_keyword_lists(args.lists, args.keywords, rng)
+    jobs = make_jobs(args.jobs, rng)
+
+    print("KEYWORD MATCHER BENCHMARK")
+    print("=" * 40)
+    print(f"{args.jobs} jobs | {args.lists} lists x {args.keywords} keywords")
+
+    start = time.perf_counter()
+    KeywordIndex(*keyword_lists)
+    print(f"Automaton build: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    results = {}
+    for label, run in (("Per method", scan_per_method), ("Shared pass", scan_shared)):
+        start = time.perf_counter()
+        results[label] = run(jobs, keyword_lists)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<12} {elapsed:.2f}s | {elapsed / args.jobs * 1000:.3f}ms per job | "
+              f"{results[label]} keyword hits")
+
+    if len(set(results.values())) != 1:
+        print("WARNING: match counts differ")
+
+
+if __name__ == "__main__":
+    main()
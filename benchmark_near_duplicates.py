@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark near-duplicate lookups as the job history grows
+LSH lookups against the SQLite job store, and checking a new job (lookup
+plus storing its signature and buckets), should cost about the same whether
+the history holds a thousand or a hundred thousand jobs, unlike a linear scan
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from job_store import JobStore
+from near_duplicates import (LSHIndex, MAX_HASH, MinHasher, NearDuplicateDetector,
+                             estimate_similarity, signature_to_bytes)
+
+WORDS = ("data analyst python sql power bi tableau azure spark etl madrid barcelona bilbao senior junior "
+         "experiencia equipo proyecto cliente banca energía reporting dashboard modelo datos negocio").split()
+
+
+def random_description(rng, length=40):
+    return ' '.join(rng.choice(WORDS) for _ in range(length))
+
+
+def build_history(store, size, num_perm, rng):
+    """Fill a job store with `size` synthetic signatures"""
+    index = LSHIndex(num_perm=num_perm)
+    signatures = []
+    with store.conn:
+        for i in range(size):
+            signature = tuple(rng.randrange(MAX_HASH) for _ in range(num_perm))
+            job_id = f"history-{i}"
+            store.conn.execute(
+                "INSERT INTO jobs (job_id, first_seen, last_seen) VALUES (?, '', '')", (job_id,)
+            )
+            store.conn.execute("INSERT INTO signatures (job_id, signature) VALUES (?, ?)",
+                               (job_id, signature_to_bytes(signature)))
+            store.conn.executemany("INSERT INTO lsh_buckets (bucket, job_id) VALUES (?, ?)",
+                                   [(key, job_id) for key in index.band_keys(signature)])
+            signatures.append(signature)
+    return signatures
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--num-perm', type=int, default=64)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    hasher = MinHasher(num_perm=args.num_perm)
+    queries = [hasher.signature(random_description(rng)) for _ in range(args.queries)]
+
+    print("NEAR-DUPLICATE LOOKUP BENCHMARK")
+    print("=" * 80)
+    print(f"{'History':>10} | {'LSH lookup (ms)':>16} | {'New job (ms)':>16} | {'Linear scan (ms)':>16}")
+
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = JobStore(os.path.join(tmp_dir, 'history.db'))
+            history = build_history(store, size, args.num_perm, rng)
+            detector = NearDuplicateDetector(num_perm=args.num_perm, job_store=store)
+            index = detector.batch_index
+
+            start = time.perf_counter()
+            for signature in queries:
+                detector._query_history(None, signature, index.band_keys(signature))
+            lsh_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+            new_jobs = [{'job_id': f"new-{i}", 'title': '', 'company': '', 'description': random_description(rng)}
+                        for i in range(args.queries)]
+            start = time.perf_counter()
+            for job in new_jobs:
+                detector.find_duplicate(job)
+            insert_ms = (time.perf_counter() - start) * 1000 / len(new_jobs)
+
+            scan_queries = queries[:10]
+            start = time.perf_counter()
+            for signature in scan_queries:
+                max(estimate_similarity(signature, other) for other in history)
+            scan_ms = (time.perf_counter() - start) * 1000 / len(scan_queries)
+
+            store.close()
+
+        print(f"{size:>10} | {lsh_ms:>16.3f} | {insert_ms:>16.3f} | {scan_ms:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
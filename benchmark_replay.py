@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Offline, repeatable benchmark of ingestion and the full daily pipeline
+Job sources are replayed from a fixture archive (record one with
+DEBUG_MODE=true, or let the benchmark synthesize one for the configured feeds)
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from final_automation import DEFAULT_JOB_FEEDS, JobAutomationSystem
+from http_replay import FixtureArchive, ReplayHttpClient
+from local_feed_server import build_rss_feed
+
+
+def synthesize_archive(path, automation, items, latency):
+    """Write an archive with one stand-in RSS feed per configured feed URL"""
+    archive = FixtureArchive(path)
+    for source in automation.config.get('sources') or [{"type": "rss", "feeds": DEFAULT_JOB_FEEDS}]:
+        for feed_url in source.get('feeds', []):
+            slug = feed_url.rstrip('/').rsplit('/', 1)[-1]
+            archive.add(feed_url, 200, {'Content-Type': 'application/rss+xml'}, build_rss_feed(slug, items), latency)
+    archive.save()
+
+
+def replay_automation(archive_path, work_dir, latency_scale):
+    """Automation system that reads sources from the archive and writes into work_dir"""
+    automation = JobAutomationSystem()
+    automation.http = ReplayHttpClient(archive_path, latency_scale=latency_scale)
+    automation.feed_cache = None
+    automation.config['job_store'] = {'enabled': True, 'path': os.path.join(work_dir, 'job_store.db')}
+    automation.config['email_config']['sender_password'] = ''
+    return automation
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--archive', help='Recorded fixture archive (default: synthesize one)')
+    parser.add_argument('--items', type=int, default=50, help='Entries per synthesized feed')
+    parser.add_argument('--latency', type=float, default=0.2, help='Latency per synthesized response')
+    parser.add_argument('--latency-scale', type=float, default=1.0)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    original_dir = os.getcwd()
+    ingestion_times, pipeline_times = [], []
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        archive_path = os.path.abspath(args.archive) if args.archive else os.path.join(work_dir, 'fixtures.zip')
+        if not args.archive:
+            synthesize_archive(archive_path, JobAutomationSystem(), args.items, args.latency)
+
+        for run in range(args.repeat):
+            run_dir = os.path.join(work_dir, f"run-{run}")
+            os.makedirs(run_dir)
+
+            automation = replay_automation(archive_path, run_dir, args.latency_scale)
+            start = time.perf_counter()
+            jobs = automation.search_jobs_real_sources()
+            ingestion_times.append(time.perf_counter() - start)
+
+            automation = replay_automation(archive_path, run_dir, args.latency_scale)
+            os.chdir(run_dir)
+            try:
+                start = time.perf_counter()
+                automation.run_daily_automation(incremental=False)
+                pipeline_times.append(time.perf_counter() - start)
+            finally:
+                os.chdir(original_dir)
+
+    print("REPLAY BENCHMARK")
+    print("=" * 40)
+    print(f"Archive: {args.archive or 'synthesized'} | {len(jobs)} relevant jobs per run")
+    for label, times in (("Ingestion", ingestion_times), ("Full pipeline", pipeline_times)):
+        spread = statistics.pstdev(times)
+        print(f"{label:<14} mean {statistics.mean(times):.3f}s | stdev {spread:.3f}s | runs {len(times)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark skill index queries over a large job history
+Bitmaps for a synthetic history of --jobs jobs (each skill present in a
+fixed share of them) are built in memory; then multi-skill queries are timed
+and compared with rescanning every description, and one run's worth of new
+jobs is added incrementally
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from skill_index import SkillIndex, bitmap_from_positions
+
+QUERIES = [
+    "databricks AND power bi",
+    "python AND sql AND NOT tableau",
+    "(azure OR aws) AND spark AND NOT hadoop",
+    "machine learning OR data warehouse",
+]
+
+
+def build_index(jobs, rng):
+    """Index with random skill bitmaps over row IDs 1..jobs"""
+    index = SkillIndex.from_config({})
+    for key in index.bitmaps:
+        share = rng.uniform(0.02, 0.4)
+        positions = np.flatnonzero(np.random.default_rng(rng.randrange(2 ** 32)).random(jobs) < share) + 1
+        index.bitmaps[key] = bitmap_from_positions(positions)
+        index.indexed_rowids[key] = jobs
+    return index
+
+
+def rescan(descriptions, expression_terms):
+    """Baseline: substring scan of every description for an AND of skills"""
+    return sum(1 for text in descriptions if all(term in text for term in expression_terms))
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=1000000, help='Jobs in the history')
+    parser.add_argument('--new-jobs', type=int, default=500, help='Jobs added by one run')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed repetitions per query')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print("SKILL INDEX BENCHMARK")
+    print("=" * 40)
+
+    start = time.perf_counter()
+    index = build_index(args.jobs, rng)
+    print(f"{args.jobs} jobs, {len(index.bitmaps)} skills | bitmaps built in {time.perf_counter() - start:.2f}s")
+
+    for expression in QUERIES:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            matches = index.query(expression, min_rowid=args.jobs // 4)
+        elapsed = (time.perf_counter() - start) / args.repeat
+        print(f"{expression:<45} {elapsed * 1000:7.2f}ms | {matches.bit_count()} jobs")
+
+    # Rescanning baseline on a sample, scaled up to the whole history
+    sample = min(args.jobs, 100000)
+    words = [name.lower() for name in index.names] + ["equipo", "madrid", "experiencia", "datos"]
+    descriptions = [" ".join(rng.choice(words) for _ in range(60)) for _ in range(sample)]
+    start = time.perf_counter()
+    rescan(descriptions, ["databricks", "power bi"])
+    elapsed = (time.perf_counter() - start) * args.jobs / sample
+    print(f"{'Rescan for databricks AND power bi (est.)':<45} {elapsed * 1000:7.0f}ms")
+
+    new_rows = [(args.jobs + i + 1, {"title": "Data Engineer", "description": rng.choice(descriptions)})
+                for i in range(args.new_jobs)]
+    start = time.perf_counter()
+    index.add_rows(new_rows)
+    print(f"Incremental update of {args.new_jobs} jobs: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BM25 relevance ranking for the Job Automation System
+Jobs are ranked against the config.json keyword profile with BM25: rare
+keywords weigh more than common ones and long postings are length-normalized.
+Document frequencies of the profile terms live in the job store and are
+updated incrementally with the jobs each run adds; terms added to the
+profile are counted once over the stored jobs
+"""
+
+import logging
+import math
+from collections import Counter
+
+from job_text import TOKEN_RE, fold_text, get_job_text, normalize_job_text
+
+logger = logging.getLogger(__name__)
+
+
+def document_terms(tokens):
+    """Term counts of a token sequence: single words plus adjacent word pairs"""
+    terms = Counter(tokens)
+    terms.update(f"{first} {second}" for first, second in zip(tokens, tokens[1:]))
+    return terms
+
+
+def query_terms(keywords):
+    """Index terms of profile keywords; keywords of more than two words become word pairs"""
+    terms = []
+    for keyword in keywords:
+        tokens = TOKEN_RE.findall(fold_text(keyword))
+        if len(tokens) <= 2:
+            terms.append(' '.join(tokens))
+        else:
+            terms += [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+    return list(dict.fromkeys(term for term in terms if term))
+
+
+class BM25Ranker:
+    """BM25 scores of jobs against a keyword profile, with incremental corpus statistics"""
+
+    def __init__(self, keywords, k1=1.2, b=0.75):
+        self.terms = query_terms(keywords)
+        self.k1 = k1
+        self.b = b
+        self.doc_count = 0
+        self.total_length = 0
+        self.indexed_rowid = 0
+        self.doc_freq = dict.fromkeys(self.terms, 0)
+        self.uncounted_terms = []
+        self._pending = Counter()
+
+    @classmethod
+    def from_config(cls, config):
+        """Create a ranker for the job_search keywords and the 'ranking' section of config.json"""
+        settings = config.get('ranking', {})
+        return cls(config.get('job_search', {}).get('keywords', []),
+                   k1=settings.get('k1', 1.2), b=settings.get('b', 0.75))
+
+    def add_document(self, tokens):
+        """Count one document in the corpus statistics"""
+        self.doc_count += 1
+        self.total_length += len(tokens)
+        for term in document_terms(tokens):
+            if term in self.doc_freq:
+                self.doc_freq[term] += 1
+                self._pending[term] += 1
+
+    def load(self, job_store):
+        """Load the corpus statistics and the document frequencies of the profile terms
+
+        Only profile terms are stored: rows of terms no longer in the profile
+        are deleted, and terms without a row are counted by the next update.
+        """
+        stats = job_store.get_corpus_stats()
+        self.doc_count = int(stats.get('doc_count', 0))
+        self.total_length = int(stats.get('total_length', 0))
+        self.indexed_rowid = int(stats.get('indexed_rowid', 0))
+        stored = job_store.get_term_doc_freqs(self.terms)
+        self.doc_freq.update(stored)
+        self.uncounted_terms = [term for term in self.terms if term not in stored]
+        if self.terms:
+            job_store.prune_term_stats(self.terms)
+
+    def save(self, job_store):
+        """Add the pending document frequency increments of the profile terms to the job store"""
+        job_store.save_term_stats({term: self._pending[term] for term in self.terms}, {
+            'doc_count': self.doc_count,
+            'total_length': self.total_length,
+            'indexed_rowid': self.indexed_rowid,
+        })
+        self._pending.clear()
+
+    def count_new_terms(self, job_store):
+        """Count profile terms without stored statistics over the jobs already indexed"""
+        terms = set(self.uncounted_terms)
+        if terms and self.indexed_rowid:
+            logger.info(f"BM25 corpus: counting {len(terms)} new profile terms")
+            for rowid, job in job_store.iter_job_rows(limit=self.indexed_rowid):
+                if rowid > self.indexed_rowid:
+                    break
+                tokens = normalize_job_text(job.get('title'), job.get('description')).tokens
+                for term in terms.intersection(document_terms(tokens)):
+                    self.doc_freq[term] += 1
+                    self._pending[term] += 1
+            self.save(job_store)
+        self.uncounted_terms = []
+
+    def update(self, job_store, batch_size=5000):
+        """Count the jobs stored since the last update; returns how many were added"""
+        self.count_new_terms(job_store)
+        added = 0
+        for rowid, job in job_store.iter_job_rows(after_rowid=self.indexed_rowid):
+            self.add_document(normalize_job_text(job.get('title'), job.get('description')).tokens)
+            self.indexed_rowid = rowid
+            added += 1
+            if added % batch_size == 0:
+                self.save(job_store)
+        if added:
+            self.save(job_store)
+        return added
+
+    @classmethod
+    def open(cls, config, job_store):
+        """Ranker from config.json with statistics brought up to date with the job store"""
+        ranker = cls.from_config(config)
+        ranker.load(job_store)
+        added = ranker.update(job_store)
+        logger.info(f"BM25 corpus: {added} new jobs, {ranker.doc_count} in total")
+        return ranker
+
+    def idf(self, term):
+        """Inverse document frequency, never negative"""
+        doc_freq = self.doc_freq.get(term, 0)
+        return math.log(1 + (self.doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def score(self, job):
+        """BM25 score of a job's title and description against the profile"""
+        tokens = get_job_text(job).tokens
+        if not tokens:
+            return 0.0
+        terms = document_terms(tokens)
+        average_length = self.total_length / self.doc_count if self.doc_count else len(tokens)
+        length_norm = self.k1 * (1 - self.b + self.b * len(tokens) / average_length)
+
+        score = 0.0
+        for term in self.terms:
+            frequency = terms.get(term)
+            if frequency:
+                score += self.idf(term) * frequency * (self.k1 + 1) / (frequency + length_norm)
+        return score
+
+    def rank(self, jobs):
+        """Jobs sorted by descending score, each with its score in job['relevance']"""
+        for job in jobs:
+            job['relevance'] = round(self.score(job), 4)
+        return sorted(jobs, key=lambda job: job['relevance'], reverse=True)
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+
+from job_store import compute_job_id
+
+
+@pytest.fixture
+def make_job():
+    """Factory of job dicts: make_job(i, **fields) with only the fields a test changes"""
+    def make(i=1, **fields):
+        job = {"title": f"Data Analyst {i}", "company": "Acme", "location": "Madrid",
+               "url": f"https://example.com/{i}", "description": "SQL and Power BI",
+               "posted_date": "", "source": "test"}
+        job.update(fields)
+        job["job_id"] = compute_job_id(job)
+        return job
+    return make
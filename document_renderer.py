@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parallel CV and cover letter rendering for the Job Automation System
+python-docx rendering is CPU-bound, so the documents of a run are rendered
+by a pool of worker processes. Each worker builds the automation system and
+its document templates once; the parent only computes the job-dependent
+fields. Results come back in submission order with their render time, and
+a document that fails is reported without stopping the others. Documents
+whose inputs were rendered before are taken from the render cache.
+Documents are rendered into memory; writing each one to its own file is
+optional, since the run's ZIP archive is written from the bytes
+"""
+
+import hashlib
+import io
+import json
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from document_templates import TEMPLATE_VERSION
+from render_cache import RenderCache
+
+logger = logging.getLogger(__name__)
+
+DOCUMENT_KINDS = ('cv', 'cover_letter')
+
+_automation = None
+
+
+class RenderResult:
+    """Outcome of rendering one document
+
+    name is the document's file name; path is None unless it was written
+    to that file (it may only be in memory, on its way to the archive).
+    """
+
+    __slots__ = ('job', 'kind', 'path', 'seconds', 'error', 'cached', 'data', 'name')
+
+    def __init__(self, kind, path, seconds, error=None, job=None, cached=False, data=None, name=None):
+        self.job = job
+        self.kind = kind
+        self.path = path
+        self.seconds = seconds
+        self.error = error
+        self.cached = cached
+        self.data = data
+        self.name = name
+
+    def __reduce__(self):
+        # Workers send results back without the job
+        return RenderResult, (self.kind, self.path, self.seconds, self.error, None, self.cached, self.data,
+                              self.name)
+
+
+def template_fingerprint(automation):
+    """Fingerprint of what an automation's templates are built from besides the job fields"""
+    automation_class = type(automation)
+    payload = json.dumps([automation_class.__module__, automation_class.__name__, TEMPLATE_VERSION,
+                          automation.config.get('documents', {}).get('engine', 'ooxml'),
+                          automation.config.get('personal_info', {})], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def write_file(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def render_document(automation, kind, fields, path, loose_file=True):
+    """Render one document into memory (and to path if loose_file), capturing any error"""
+    start = time.perf_counter()
+    name = os.path.basename(path)
+    try:
+        buffer = io.BytesIO()
+        automation.get_document_template(kind).render(fields, buffer)
+        data = buffer.getvalue()
+        if loose_file:
+            write_file(path, data)
+        return RenderResult(kind, path if loose_file else None, time.perf_counter() - start, data=data, name=name)
+    except Exception as e:
+        return RenderResult(kind, None, time.perf_counter() - start, f"{type(e).__name__}: {e}", name=name)
+
+
+def init_worker(automation_class, config_path):
+    """Build the automation system and its document templates once per worker process"""
+    global _automation
+    logging.disable(logging.INFO)
+    _automation = automation_class(config_path)
+    for kind in DOCUMENT_KINDS:
+        _automation.get_document_template(kind)
+
+
+def render_in_worker(kind, fields, path, loose_file):
+    return render_document(_automation, kind, fields, path, loose_file)
+
+
+class DocumentRenderer:
+    """Renders the CV and cover letter of each submitted job, in-process or in a worker pool"""
+
+    def __init__(self, automation, workers=1, cache=None, loose_files=True):
+        self.automation = automation
+        self.workers = workers or os.cpu_count() or 1
+        self.cache = cache
+        self.loose_files = loose_files
+        self.fingerprint = template_fingerprint(automation)
+        self._executor = None
+        self._pending = []
+        self.rendered = 0
+        self.cached = 0
+        self.failed = 0
+        self.render_seconds = 0.0
+
+    @classmethod
+    def from_config(cls, automation):
+        """Renderer for the 'documents' and 'render_cache' sections of config.json"""
+        documents = automation.config.get('documents', {})
+        return cls(automation, documents.get('workers', 1), RenderCache.from_config(automation.config),
+                   documents.get('loose_files', True))
+
+    def _get_executor(self):
+        if self._executor is None:
+            # Feed fetcher threads may still be running, so workers are not forked from this process
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(method),
+                initializer=init_worker,
+                initargs=(type(self.automation), self.automation.config_path)
+            )
+            logger.info(f"Rendering documents with {self.workers} worker processes")
+        return self._executor
+
+    def submit(self, job, output_dir):
+        """Queue the job's CV and cover letter; with one worker they are rendered right away"""
+        for kind in DOCUMENT_KINDS:
+            fields = self.automation.get_document_fields(kind, job)
+            path = os.path.join(output_dir, self.automation.get_document_filename(kind, job))
+            key = None
+            if self.cache:
+                start = time.perf_counter()
+                key = self.cache.key(kind, self.fingerprint, fields)
+                data = self.cache.fetch(key, fields)
+                if data is not None:
+                    result = RenderResult(kind, path if self.loose_files else None, 0.0, cached=True, data=data,
+                                          name=os.path.basename(path))
+                    try:
+                        if self.loose_files:
+                            write_file(path, data)
+                    except OSError as e:
+                        result.path, result.error = None, f"{type(e).__name__}: {e}"
+                    result.seconds = time.perf_counter() - start
+                    self._pending.append((job, kind, fields, None, result))
+                    continue
+
+            if self.workers == 1:
+                outcome = render_document(self.automation, kind, fields, path, self.loose_files)
+            else:
+                outcome = self._get_executor().submit(render_in_worker, kind, fields, path, self.loose_files)
+            self._pending.append((job, kind, fields, key, outcome))
+
+    def results(self):
+        """Results of every document submitted since the last call, in submission order"""
+        results = []
+        for job, kind, fields, key, outcome in self._pending:
+            if isinstance(outcome, RenderResult):
+                result = outcome
+            else:
+                try:
+                    result = outcome.result()
+                except Exception as e:
+                    # The worker itself failed (e.g. it was killed), not just the document
+                    result = RenderResult(kind, None, 0.0, f"{type(e).__name__}: {e}")
+            result.job = job
+
+            if result.error:
+                self.failed += 1
+                logger.error(f"Error generating {result.kind} for {job['title']}: {result.error}")
+            elif result.cached:
+                self.cached += 1
+            else:
+                self.rendered += 1
+                self.render_seconds += result.seconds
+                if key:
+                    self.cache.store(key, fields, result.data)
+            results.append(result)
+        self._pending = []
+        return results
+
+    def render(self, jobs, output_dir):
+        """Render the documents of a list of jobs and return the results in order"""
+        for job in jobs:
+            self.submit(job, output_dir)
+        return self.results()
+
+    def close(self):
+        """Stop the worker pool and persist the render cache"""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        if self.cache:
+            try:
+                self.cache.save()
+            except Exception as e:
+                logger.warning(f"Could not save render cache: {e}")
+
+    def summary_lines(self):
+        """Rendering and render cache summaries for the run log"""
+        average = self.render_seconds / self.rendered * 1000 if self.rendered else 0.0
+        lines = [f"Documents: {self.rendered} rendered, {self.cached} from cache, {self.failed} failed, "
+                 f"{average:.1f}ms per rendered document, {self.workers} workers"]
+        if self.cache:
+            lines.append(self.cache.summary())
+        return lines
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Template-based CV and cover letter rendering for the Job Automation System
+A document is built once per run with python-docx, with a marker in every
+paragraph whose text depends on the job. Each job then only rewrites those
+paragraphs and saves, instead of recreating the default template, styles
+and every static paragraph
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Bump when a build_*_document method changes, so cached renders are discarded
+TEMPLATE_VERSION = 1
+
+
+class PlaceholderFields(dict):
+    """Field mapping that answers every lookup with a marker naming the field"""
+
+    def __missing__(self, name):
+        return f"⟦{name}⟧"
+
+
+class DocumentTemplate:
+    """A document skeleton whose variable paragraphs are refilled for each job
+
+    build(fields) must create the document, putting each fields[name] into
+    a paragraph of its own (body or header). Not thread-safe: one template
+    is filled and saved at a time.
+    """
+
+    def __init__(self, build):
+        self.document = build(PlaceholderFields())
+        self.slots = {}
+        paragraphs = list(self.document.paragraphs)
+        for section in self.document.sections:
+            # Reading paragraphs of a linked (absent) header would add one
+            if not section.header.is_linked_to_previous:
+                paragraphs += section.header.paragraphs
+        for paragraph in paragraphs:
+            text = paragraph.text
+            if text.startswith('⟦') and text.endswith('⟧'):
+                self.slots.setdefault(text[1:-1], []).append(paragraph)
+        self.renders = 0
+
+    def fill(self, fields):
+        """Write the job's fields into the variable paragraphs"""
+        for name, paragraphs in self.slots.items():
+            for paragraph in paragraphs:
+                paragraph.text = fields[name]
+
+    def render(self, fields, target):
+        """Fill the template and save it to a path or binary stream"""
+        self.fill(fields)
+        self.document.save(target)
+        self.renders += 1
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Concurrent feed fetcher for the Job Automation System
+Runs all feed downloads at once with a global and a per-host concurrency
+limit, interleaving hosts so a slow or rate-limited one does not idle workers
+"""
+
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrentFeedFetcher:
+    """Fetch several feeds in parallel using a bounded thread pool"""
+
+    def __init__(self, fetch_func, max_workers=6, per_host_limit=2, rate_limiter=None):
+        """Initialize the fetcher
+
+        fetch_func is called with a feed URL (plus any extra arguments given to
+        iter_fetch) and returns the parsed feed. The limits are shared by every
+        call made through this fetcher, so several job sources can fetch at
+        the same time without exceeding them. With a rate_limiter (see
+        rate_limiter.DomainRateLimiter) feeds are started in the order their
+        domain's tokens become available.
+        """
+        self.fetch_func = fetch_func
+        self.max_workers = max(1, int(max_workers))
+        self.per_host_limit = max(1, int(per_host_limit))
+        self.rate_limiter = rate_limiter
+        self._active = 0
+        self._active_hosts = {}
+        self._changed = threading.Condition()
+
+    def _host(self, feed_url):
+        return urlparse(feed_url).netloc.lower()
+
+    def _next_host(self, feed_urls, pending):
+        """Pick the host to start next: (host, seconds until its token is ready)
+
+        Hosts at their concurrency limit are skipped; among the others the one
+        whose token is ready soonest wins, ties going to the host that waited
+        longest. Returns (None, None) while no host can start. Must be called
+        with self._changed held.
+        """
+        if self._active >= self.max_workers:
+            return None, None
+
+        best_host, best_wait = None, None
+        for host, indices in pending.items():
+            if self._active_hosts.get(host, 0) >= self.per_host_limit:
+                continue
+            wait = self.rate_limiter.ready_in(feed_urls[indices[0]]) if self.rate_limiter else 0.0
+            if best_wait is None or wait < best_wait:
+                best_host, best_wait = host, wait
+        return best_host, best_wait
+
+    def _run(self, feed_url, host, result, args):
+        """Fetch one feed into its result future and free its slots"""
+        try:
+            result.set_result(self.fetch_func(feed_url, *args))
+        except Exception as e:
+            result.set_exception(e)
+        finally:
+            with self._changed:
+                self._active -= 1
+                self._active_hosts[host] -= 1
+                self._changed.notify_all()
+
+    def _dispatch(self, feed_urls, results, args):
+        """Start feeds as hosts become available, round-robin across hosts
+
+        If dispatching itself fails, every feed not started yet gets the
+        error, so no caller is left waiting on its result.
+        """
+        pending = {}
+        for index, feed_url in enumerate(feed_urls):
+            pending.setdefault(self._host(feed_url), deque()).append(index)
+        started = set()
+
+        try:
+            workers = min(self.max_workers, len(feed_urls))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='feed') as executor:
+                with self._changed:
+                    while pending:
+                        host, wait = self._next_host(feed_urls, pending)
+                        if host is None or wait > 0:
+                            # Sleep until a fetch finishes or the next token is due
+                            self._changed.wait(timeout=wait)
+                            continue
+
+                        # Move the host to the back so hosts take turns
+                        indices = pending.pop(host)
+                        index = indices.popleft()
+                        if indices:
+                            pending[host] = indices
+
+                        self._active += 1
+                        self._active_hosts[host] = self._active_hosts.get(host, 0) + 1
+                        try:
+                            executor.submit(self._run, feed_urls[index], host, results[index], args)
+                        except Exception:
+                            self._active -= 1
+                            self._active_hosts[host] -= 1
+                            raise
+                        started.add(index)
+        except Exception as e:
+            logger.error(f"Feed dispatch failed: {e}")
+            for index, result in enumerate(results):
+                if index not in started and not result.done():
+                    result.set_exception(e)
+
+    def iter_fetch(self, feed_urls, *args):
+        """Fetch all feeds concurrently, yielding results as they become available
+
+        Yields (feed_url, result, error) tuples in the same order as feed_urls,
+        so callers can merge results exactly as a serial loop would while still
+        starting work as soon as the first feed has arrived.
+        """
+        feed_urls = list(feed_urls)
+        if not feed_urls:
+            return
+
+        results = [Future() for _ in feed_urls]
+        dispatcher = threading.Thread(target=self._dispatch, args=(feed_urls, results, args),
+                                      name='feed-dispatch', daemon=True)
+        dispatcher.start()
+
+        for feed_url, result in zip(feed_urls, results):
+            try:
+                yield feed_url, result.result(), None
+            except Exception as e:
+                yield feed_url, None, e
+
+    def fetch_all(self, feed_urls, *args):
+        """Fetch all feeds concurrently and return the list of results"""
+        return list(self.iter_fetch(feed_urls, *args))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streaming RSS/Atom parser for the Job Automation System
+Entries are produced one by one while the body is still being read, so a
+caller that only needs the first few relevant offers can stop early instead
+of downloading and parsing the whole feed
+"""
+
+from lxml import etree
+
+ATOM_NS = 'http://www.w3.org/2005/Atom'
+ENTRY_TAGS = ('item', f'{{{ATOM_NS}}}entry')
+
+# Child element -> entry field, for RSS 2.0, Atom and common extensions
+FIELD_ALIASES = {
+    'title': 'title',
+    'link': 'link',
+    'description': 'summary',
+    'summary': 'summary',
+    'content': 'summary',
+    'encoded': 'summary',
+    'author': 'author',
+    'creator': 'author',
+    'pubDate': 'published',
+    'published': 'published',
+    'updated': 'published',
+    'date': 'published',
+    'location': 'location',
+}
+
+
+class FeedEntry(dict):
+    """Feed entry with attribute access, like feedparser's entries"""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+def _entry_from_element(element):
+    """Build a FeedEntry from an <item> or <entry> element"""
+    entry = FeedEntry()
+
+    for child in element:
+        if not isinstance(child.tag, str):
+            continue
+
+        field = FIELD_ALIASES.get(etree.QName(child).localname)
+        if field is None or field in entry:
+            continue
+
+        if field == 'link' and child.get('href'):
+            entry['link'] = child.get('href')
+        elif field == 'author' and len(child):
+            # Atom <author><name>...</name></author>
+            entry['author'] = (child.findtext(f'{{{ATOM_NS}}}name') or '').strip()
+        elif child.text and child.text.strip():
+            entry[field] = child.text.strip()
+
+    return entry
+
+
+def iter_feed_entries(chunks):
+    """Yield FeedEntry objects from an iterable of body chunks
+
+    Parsing is incremental: each chunk is fed to a pull parser and the entries
+    completed so far are yielded before the next chunk is read. Processed
+    elements are cleared, so memory use does not grow with the feed size.
+    Closing the generator stops reading further chunks.
+    """
+    parser = etree.XMLPullParser(events=('end',), tag=ENTRY_TAGS, recover=True, resolve_entities=False)
+
+    for chunk in chunks:
+        parser.feed(chunk)
+
+        for _, element in parser.read_events():
+            yield _entry_from_element(element)
+
+            # Drop the element and everything parsed before it
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+
+    # End events fire as soon as a closing tag arrives, so anything completed
+    # only by close() is an entry cut off by a truncated body: drop it
+    try:
+        parser.close()
+    except etree.XMLSyntaxError:
+        pass
+
+
+def iter_chunks(data, chunk_size=16384):
+    """Split a bytes body into chunks for iter_feed_entries"""
+    for start in range(0, len(data), chunk_size):
+        yield data[start:start + chunk_size]
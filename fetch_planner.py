@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Yield-aware fetch planner for the Job Automation System
+Remembers how many relevant and new jobs every feed produced in past runs and
+spreads the per-run entry and request budget across feeds accordingly, so
+fetch time goes to the feeds that actually bring new offers
+"""
+
+import logging
+import math
+import random
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Smoothing for feeds with little history: one new job per run, one second per fetch
+PRIOR_NEW_JOBS = 1.0
+PRIOR_SECONDS = 1.0
+
+EMPTY_YIELD = {'runs': 0.0, 'requested': 0.0, 'relevant': 0.0, 'new_jobs': 0.0, 'fetch_seconds': 0.0}
+
+
+class FetchPlanner:
+    """Assign per-feed entry budgets in proportion to historical yield
+
+    Feeds without history keep their source's default budget. Known feeds
+    share the entry budget in proportion to the new jobs they produced per
+    run; when a request budget is set, only the feeds with the most new jobs
+    per second of fetch time are requested. Low-yield feeds are still given a
+    default budget now and then (see `exploration`) so a feed that improves
+    is noticed.
+    """
+
+    def __init__(self, entry_budget=None, request_budget=None, min_entries=1, max_entries=20,
+                 exploration=0.1, decay=0.8, history=None, seed=None):
+        self.entry_budget = entry_budget
+        self.request_budget = request_budget
+        self.min_entries = max(1, int(min_entries))
+        self.max_entries = max(self.min_entries, int(max_entries))
+        self.exploration = exploration
+        self.decay = decay
+        self.history = history or {}
+        self.decisions = {}
+        self.observed = {}
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+
+    @classmethod
+    def from_config(cls, config, job_store=None):
+        """Create a planner from the 'fetch_planner' section of config.json"""
+        settings = config.get('fetch_planner', {})
+        if not settings.get('enabled', True):
+            return None
+
+        history = {}
+        if job_store is not None:
+            try:
+                history = job_store.get_feed_yields()
+            except Exception as e:
+                logger.warning(f"Feed yield history unavailable: {e}")
+
+        return cls(
+            entry_budget=settings.get('entry_budget'),
+            request_budget=settings.get('request_budget'),
+            min_entries=settings.get('min_entries', 1),
+            max_entries=settings.get('max_entries', 20),
+            exploration=settings.get('exploration', 0.1),
+            decay=settings.get('decay', 0.8),
+            history=history,
+        )
+
+    def new_jobs_per_run(self, feed_url):
+        """Smoothed number of new relevant jobs a feed brings per run"""
+        stats = self.history[feed_url]
+        return (stats['new_jobs'] + PRIOR_NEW_JOBS) / (stats['runs'] + 1)
+
+    def new_jobs_per_second(self, feed_url):
+        """Smoothed number of new relevant jobs per second of fetch time"""
+        stats = self.history[feed_url]
+        return (stats['new_jobs'] + PRIOR_NEW_JOBS) / (stats['fetch_seconds'] + PRIOR_SECONDS)
+
+    def entry_cap(self, feed_url):
+        """Largest useful budget: a feed that ran out of relevant entries gets one more than it had"""
+        stats = self.history[feed_url]
+        if stats['runs'] and stats['relevant'] < stats['requested']:
+            return max(self.min_entries, math.ceil(stats['relevant'] / stats['runs']) + 1)
+        return self.max_entries
+
+    def _decide(self, feed_url, budget, reason):
+        self.decisions[feed_url] = {'budget': budget, 'reason': reason}
+
+    def plan(self, feed_defaults):
+        """Plan this run's budgets from {feed_url: default entry budget}
+
+        Returns {feed_url: budget}; a budget of 0 means the feed is not
+        requested this run.
+        """
+        self.decisions = {}
+        feed_defaults = dict(feed_defaults)
+        entry_budget = self.entry_budget
+        if entry_budget is None:
+            entry_budget = sum(feed_defaults.values())
+
+        known = sorted((url for url in feed_defaults if url in self.history),
+                       key=self.new_jobs_per_second, reverse=True)
+        for feed_url in feed_defaults:
+            if feed_url not in self.history:
+                self._decide(feed_url, feed_defaults[feed_url], 'new feed')
+
+        # Request budget: keep the feeds with the best new jobs per fetch second
+        slots = len(known)
+        if self.request_budget is not None:
+            slots = max(0, self.request_budget - (len(feed_defaults) - len(known)))
+        selected = known[:slots]
+        for feed_url in known[slots:]:
+            if self._rng.random() < self.exploration:
+                self._decide(feed_url, feed_defaults[feed_url], 'explore')
+            else:
+                self._decide(feed_url, 0, 'skipped')
+
+        # Entry budget: what is left is shared in proportion to new jobs per run.
+        # Feeds whose share exceeds their cap are fixed at the cap and the rest
+        # is shared again among the others.
+        remaining = max(0, entry_budget - sum(d['budget'] for d in self.decisions.values()))
+        weights = {feed_url: self.new_jobs_per_run(feed_url) for feed_url in selected}
+        caps = {feed_url: min(self.max_entries, self.entry_cap(feed_url)) for feed_url in selected}
+        budgets = {}
+        pending = list(selected)
+        while pending:
+            total_weight = sum(weights[feed_url] for feed_url in pending)
+            capped = [url for url in pending if remaining * weights[url] / total_weight > caps[url]]
+            if not capped:
+                break
+            for feed_url in capped:
+                budgets[feed_url] = caps[feed_url]
+                remaining = max(0, remaining - caps[feed_url])
+                pending.remove(feed_url)
+        for feed_url in pending:
+            share = round(remaining * weights[feed_url] / total_weight)
+            budgets[feed_url] = min(max(share, self.min_entries), caps[feed_url])
+
+        for feed_url in selected:
+            budget = budgets[feed_url]
+            if budget < feed_defaults[feed_url] and self._rng.random() < self.exploration:
+                self._decide(feed_url, feed_defaults[feed_url], 'explore')
+            else:
+                self._decide(feed_url, budget, 'yield')
+
+        # Keep the configured feed order in the run log
+        self.decisions = {feed_url: self.decisions[feed_url] for feed_url in feed_defaults}
+        return {feed_url: decision['budget'] for feed_url, decision in self.decisions.items()}
+
+    def budget_for(self, feed_url, default):
+        """Planned budget of a feed, or `default` if it was not planned"""
+        decision = self.decisions.get(feed_url)
+        return decision['budget'] if decision else default
+
+    def record_fetch(self, feed_url, requested, relevant, seconds):
+        """Record one fetch: entries asked for, relevant entries returned and time spent"""
+        with self._lock:
+            stats = self.observed.setdefault(feed_url, {'requested': 0, 'relevant': 0, 'new_jobs': 0, 'fetch_seconds': 0.0})
+            stats['requested'] += requested
+            stats['relevant'] += relevant
+            stats['fetch_seconds'] += seconds
+
+    def record_new_job(self, feed_url):
+        """Count a job from a feed that was not in the job store before"""
+        with self._lock:
+            if feed_url in self.observed:
+                self.observed[feed_url]['new_jobs'] += 1
+
+    def updated_history(self):
+        """History totals with this run added and older runs decayed"""
+        updated = {}
+        for feed_url, stats in self.observed.items():
+            previous = self.history.get(feed_url, EMPTY_YIELD)
+            updated[feed_url] = {'runs': previous['runs'] * self.decay + 1}
+            for column in ('requested', 'relevant', 'new_jobs', 'fetch_seconds'):
+                updated[feed_url][column] = previous[column] * self.decay + stats[column]
+        return updated
+
+    def save(self, job_store):
+        """Persist this run's yields in the job store"""
+        try:
+            job_store.save_feed_yields(self.updated_history())
+        except Exception as e:
+            logger.warning(f"Could not save feed yields: {e}")
+
+    def summary_lines(self):
+        """Planner decisions, per-feed yields and overall new jobs per fetch second"""
+        lines = []
+        for feed_url, decision in self.decisions.items():
+            stats = self.observed.get(feed_url)
+            if stats is None:
+                lines.append(f"Feed {feed_url}: budget {decision['budget']} ({decision['reason']}), not fetched")
+                continue
+            lines.append(
+                f"Feed {feed_url}: budget {decision['budget']} ({decision['reason']}), "
+                f"{stats['relevant']} relevant, {stats['new_jobs']} new, {stats['fetch_seconds']:.2f}s"
+            )
+
+        new_jobs = sum(stats['new_jobs'] for stats in self.observed.values())
+        seconds = sum(stats['fetch_seconds'] for stats in self.observed.values())
+        rate = new_jobs / seconds if seconds else 0.0
+        lines.append(
+            f"Fetch planner: {new_jobs} new relevant jobs from {len(self.observed)} feed requests "
+            f"in {seconds:.2f}s of fetch time ({rate:.1f} new jobs/s)"
+        )
+        return lines
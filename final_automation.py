@@ -6,6 +6,9 @@ This system searches for real job opportunities and sends automated emails
 Specialized in Business Intelligence and Big Data positions
 """
 
+import argparse
+import hashlib
+import io
 import json
 import logging
 import os
@@ -36,6 +39,23 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 import pandas as pd
 from dotenv import load_dotenv
 
+from bm25 import BM25Ranker
+from document_renderer import DocumentRenderer
+from document_templates import DocumentTemplate
+from feed_fetcher import ConcurrentFeedFetcher
+from feed_parser import FeedEntry, iter_feed_entries
+from fetch_planner import FetchPlanner
+from html_text import html_to_text
+from http_cache import BodyReader, FeedHttpCache
+from http_replay import create_http_client
+from job_fields import get_job_fields, passes_filters
+from job_sources import SourceRegistry, job_board_sources, make_job
+from job_store import JobStore
+from keyword_matcher import KeywordIndex
+from near_duplicates import NearDuplicateDetector
+from ooxml_writer import OoxmlTemplate
+from skill_index import SkillIndex
+
 # Load environment variables
 load_dotenv()
 
@@ -50,6 +70,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Real RSS feeds for job searching, used when config.json has no 'sources'
+DEFAULT_JOB_FEEDS = [
+    "https://www.infojobs.net/rss/ofertas-empleo/data-analyst/",
+    "https://www.infojobs.net/rss/ofertas-empleo/business-intelligence/",
+    "https://www.infojobs.net/rss/ofertas-empleo/big-data/",
+    "https://www.infojobs.net/rss/ofertas-empleo/python/",
+    "https://www.tecnoempleo.com/rss/ofertas-empleo/data-analyst/",
+    "https://www.tecnoempleo.com/rss/ofertas-empleo/business-intelligence/",
+]
+
+# Keywords the CV helpers look for, compiled with the config.json keyword lists
+SUMMARY_KEYWORDS = ['machine learning', 'azure', 'tableau']
+MATCHED_KEYWORD_LISTS = [SUMMARY_KEYWORDS]
+
+# Entry fields kept in the feed cache so unchanged feeds are not parsed again
+CACHED_ENTRY_FIELDS = ['title', 'author', 'link', 'summary', 'published', 'location']
+
 class JobAutomationSystem:
     """Main class for job automation system"""
     
@@ -59,6 +96,11 @@ class JobAutomationSystem:
         self.config = self.load_config()
         self.jobs_found = []
         self.cvs_generated = []
+        self.document_templates = {}
+        self.http = create_http_client(self.config)
+        self.feed_cache = self.create_feed_cache()
+        self.keyword_index = self.create_keyword_index()
+        self.fetch_planner = None
         
     def load_config(self):
         """Load configuration from JSON file"""
@@ -119,6 +161,91 @@ class JobAutomationSystem:
                     "https://api.indeed.com/ads/apisearch",
                     "https://api.infojobs.net/api/9/offer"
                 ]
+            },
+            "http": {
+                "pool_connections": 10,
+                "pool_maxsize": 10,
+                "connect_timeout": 5,
+                "read_timeout": 30,
+                "max_retries": 3,
+                "backoff_factor": 0.5,
+                "backoff_max": 30
+            },
+            "rate_limits": {
+                "enabled": True,
+                "default": {"rate": 2, "burst": 4},
+                "domains": {
+                    "infojobs.net": {"rate": 1, "burst": 2},
+                    "tecnoempleo.com": {"rate": 1, "burst": 2}
+                }
+            },
+            "replay": {
+                "archive": "fixtures/job_sources.zip",
+                "latency_scale": 1.0
+            },
+            "ingestion": {
+                "concurrent": True,
+                "max_workers": 6,
+                "per_host_limit": 2,
+                "parser": "streaming",
+                "max_response_bytes": 2097152
+            },
+            "http_cache": {
+                "enabled": True,
+                "directory": ".feed_cache",
+                "max_bytes": 20971520
+            },
+            "sources": [
+                {"name": "infojobs", "type": "rss", "feeds": DEFAULT_JOB_FEEDS[:4]},
+                {"name": "tecnoempleo", "type": "rss", "feeds": DEFAULT_JOB_FEEDS[4:]}
+            ],
+            "fetch_planner": {
+                "enabled": True,
+                "entry_budget": None,
+                "request_budget": None,
+                "min_entries": 1,
+                "max_entries": 20,
+                "exploration": 0.1,
+                "decay": 0.8
+            },
+            "job_store": {
+                "enabled": True,
+                "path": "job_store.db",
+                "incremental": True
+            },
+            "near_duplicates": {
+                "enabled": True,
+                "threshold": 0.7,
+                "num_perm": 64,
+                "shingle_size": 3
+            },
+            "scoring": {
+                "deterministic": True,
+                "cache": True
+            },
+            "skill_index": {
+                "enabled": True
+            },
+            "ranking": {
+                "enabled": True,
+                "k1": 1.2,
+                "b": 0.75
+            },
+            "filters": {
+                "seniority": [],
+                "contract_types": [],
+                "min_salary": None,
+                "max_experience_years": None
+            },
+            "documents": {
+                "workers": 4,
+                "loose_files": True,
+                "engine": "ooxml"
+            },
+            "render_cache": {
+                "enabled": True,
+                "directory": ".render_cache",
+                "max_bytes": 52428800
             }
         }
         
@@ -127,42 +254,104 @@ class JobAutomationSystem:
         
         logger.info(f"Default configuration created: {self.config_path}")
     
-    def search_jobs_real_sources(self):
-        """Search for jobs using real sources and RSS feeds"""
-        jobs = []
-        
-        # Real RSS feeds for job searching
-        job_feeds = [
-            "https://www.infojobs.net/rss/ofertas-empleo/data-analyst/",
-            "https://www.infojobs.net/rss/ofertas-empleo/business-intelligence/",
-            "https://www.infojobs.net/rss/ofertas-empleo/big-data/",
-            "https://www.infojobs.net/rss/ofertas-empleo/python/",
-            "https://www.tecnoempleo.com/rss/ofertas-empleo/data-analyst/",
-            "https://www.tecnoempleo.com/rss/ofertas-empleo/business-intelligence/",
+    def create_feed_cache(self):
+        """Create the persistent HTTP cache for feeds, if enabled"""
+        cache_config = self.config.get('http_cache', {})
+        if not cache_config.get('enabled', True):
+            return None
+        
+        try:
+            return FeedHttpCache(
+                cache_dir=cache_config.get('directory', '.feed_cache'),
+                max_bytes=cache_config.get('max_bytes', 20 * 1024 * 1024),
+                session=self.http,
+                max_response_bytes=self.config.get('ingestion', {}).get('max_response_bytes')
+            )
+        except Exception as e:
+            logger.warning(f"Feed cache disabled: {e}")
+            return None
+    
+    def get_source_configs(self, feed_urls=None):
+        """Return the job source configs for this run
+
+        Sources come from the 'sources' section of config.json, plus one API
+        source per URL in apis.job_boards. Passing feed_urls restricts the run
+        to those RSS feeds only.
+        """
+        if feed_urls:
+            return [{"name": "rss_feeds", "type": "rss", "feeds": list(feed_urls)}]
+        
+        sources = self.config.get('sources') or [
+            {"name": "rss_feeds", "type": "rss", "feeds": DEFAULT_JOB_FEEDS}
         ]
+        return sources + job_board_sources(self.config)
+    
+    def plan_feed_budgets(self, source_configs, job_store=None):
+        """Create the fetch planner and plan per-feed entry budgets for this run"""
+        self.fetch_planner = FetchPlanner.from_config(self.config, job_store)
+        if self.fetch_planner is None:
+            return
         
-        for feed_url in job_feeds:
-            try:
-                logger.info(f"Searching jobs from: {feed_url}")
-                feed = feedparser.parse(feed_url)
-                
-                for entry in feed.entries[:5]:  # Limit to 5 jobs per feed
-                    job = {
-                        "title": entry.title,
-                        "company": getattr(entry, 'author', 'Unknown Company'),
-                        "location": self.extract_location(entry),
-                        "url": entry.link,
-                        "description": self.clean_description(entry.summary),
-                        "posted_date": getattr(entry, 'published', datetime.now().isoformat()),
-                        "source": feed_url
-                    }
-                    
-                    if self.is_relevant_job(job):
-                        jobs.append(job)
-                        
-            except Exception as e:
-                logger.warning(f"Error parsing feed {feed_url}: {e}")
-                continue
+        feed_defaults = {}
+        for source_config in source_configs:
+            if source_config.get('type') == 'rss' and source_config.get('enabled', True):
+                for feed_url in source_config['feeds']:
+                    feed_defaults.setdefault(feed_url, source_config.get('max_entries', 5))
+        self.fetch_planner.plan(feed_defaults)
+    
+    def iter_relevant_jobs(self, feed_urls=None, job_store=None):
+        """Yield (position, job) for every relevant job as sources produce them
+        
+        With a job store, per-feed entry budgets are planned from the yields
+        recorded in earlier runs.
+        """
+        ingestion = self.config.get('ingestion', {})
+        concurrent = ingestion.get('concurrent', True)
+        max_workers = ingestion.get('max_workers', 6)
+        source_configs = self.get_source_configs(feed_urls)
+        
+        self.plan_feed_budgets(source_configs, job_store)
+        self.feed_fetcher = ConcurrentFeedFetcher(
+            self.fetch_planned_feed,
+            max_workers=max_workers,
+            per_host_limit=ingestion.get('per_host_limit', 2),
+            rate_limiter=self.http.rate_limiter
+        )
+        registry = SourceRegistry.from_config(source_configs, self, max_workers=max_workers)
+        
+        for position, job in registry.stream(concurrent=concurrent):
+            if self.is_relevant_job(job) and self.matches_filters(job):
+                yield position, job
+        
+        for line in registry.summary_lines():
+            logger.info(line)
+        
+        if self.fetch_planner:
+            for line in self.fetch_planner.summary_lines():
+                logger.info(line)
+        self.http.flush()
+        logger.info(self.http.summary())
+        if self.http.rate_limiter:
+            for line in self.http.rate_limiter.summary_lines():
+                logger.info(line)
+        
+        if self.feed_cache:
+            self.feed_cache.save()
+            logger.info(self.feed_cache.summary())
+    
+    def stream_jobs(self, feed_urls=None, job_store=None):
+        """Yield relevant, unique jobs as soon as any source produces them"""
+        seen_urls = set()
+        
+        for _, job in self.iter_relevant_jobs(feed_urls, job_store):
+            if job['url'] not in seen_urls:
+                seen_urls.add(job['url'])
+                yield job
+    
+    def search_jobs_real_sources(self, feed_urls=None):
+        """Search for jobs using real sources and RSS feeds"""
+        # Restore the configured source order so the result does not depend on timing
+        jobs = [job for _, job in sorted(self.iter_relevant_jobs(feed_urls), key=lambda item: item[0])]
         
         # Remove duplicates based on URL
         unique_jobs = []
@@ -173,25 +362,109 @@ class JobAutomationSystem:
                 unique_jobs.append(job)
                 seen_urls.add(job['url'])
         
-        # Additional real job sources
-        unique_jobs.extend(self.search_additional_sources())
-        
         logger.info(f"Found {len(unique_jobs)} unique jobs")
         return unique_jobs
     
-    def search_additional_sources(self):
-        """Search additional real job sources"""
-        additional_jobs = []
+    def iter_feeds(self, feed_urls, max_entries=5):
+        """Yield (feed_url, entries, error) for each feed, in feed order
+        
+        Feeds the fetch planner gave no budget this run are not requested.
+        """
+        if self.fetch_planner:
+            feed_urls = [url for url in feed_urls if self.fetch_planner.budget_for(url, max_entries) > 0]
+        
+        if self.config.get('ingestion', {}).get('concurrent', True) and len(feed_urls) > 1:
+            yield from self.feed_fetcher.iter_fetch(feed_urls, max_entries)
+        else:
+            for feed_url in feed_urls:
+                yield self.fetch_feed_safely(feed_url, max_entries)
+    
+    def build_job_from_entry(self, entry, feed_url):
+        """Normalize a feed entry into a job record"""
+        return make_job(
+            entry.title,
+            getattr(entry, 'author', 'Unknown Company'),
+            self.extract_location(entry),
+            entry.link,
+            self.clean_description(entry.summary),
+            getattr(entry, 'published', datetime.now().isoformat()),
+            feed_url
+        )
+    
+    def feed_parse_variant(self, max_entries):
+        """Fingerprint of the settings that decide which entries a parse keeps"""
+        parser = self.config.get('ingestion', {}).get('parser', 'streaming')
+        keywords = '|'.join(self.config['job_search']['keywords']).lower()
+        digest = hashlib.sha1(keywords.encode('utf-8')).hexdigest()[:12]
+        return f"{parser}:{max_entries}:{digest}"
+    
+    def parse_feed_entries(self, feed_url, chunks, max_entries=5):
+        """Parse feed body chunks until max_entries relevant entries are found
+        
+        The streaming parser stops reading the body as soon as the budget is
+        met; setting ingestion.parser to "feedparser" parses the whole
+        document instead. Returns plain dicts of CACHED_ENTRY_FIELDS.
+        """
+        if self.config.get('ingestion', {}).get('parser', 'streaming') == 'feedparser':
+            entries = feedparser.parse(b''.join(chunks)).entries
+        else:
+            entries = iter_feed_entries(chunks)
         
-        # Example of searching GitHub Jobs API (if available)
+        selected = []
         try:
-            # Note: This is a placeholder for real API integration
-            # In a real implementation, you would use actual API keys and endpoints
-            pass
-        except Exception as e:
-            logger.warning(f"Error searching additional sources: {e}")
+            for entry in entries:
+                if 'title' not in entry or 'link' not in entry:
+                    continue
+                if not self.is_relevant_job(self.build_job_from_entry(entry, feed_url)):
+                    continue
+                
+                selected.append({field: entry[field] for field in CACHED_ENTRY_FIELDS if field in entry})
+                if len(selected) >= max_entries:
+                    break
+        finally:
+            if hasattr(entries, 'close'):
+                entries.close()
+        
+        return selected
+    
+    def fetch_feed(self, feed_url, max_entries=5):
+        """Download a feed and return up to max_entries relevant entries"""
+        logger.info(f"Searching jobs from: {feed_url}")
+        
+        def parse(chunks):
+            return self.parse_feed_entries(feed_url, chunks, max_entries)
         
-        return additional_jobs
+        if self.feed_cache is None:
+            response = self.http.get(feed_url, stream=True)
+            try:
+                response.raise_for_status()
+                max_bytes = self.config.get('ingestion', {}).get('max_response_bytes')
+                entries = parse(BodyReader(response.iter_content(16384), max_bytes))
+            finally:
+                response.close()
+        else:
+            # Unchanged feeds come back already parsed from the cache
+            entries, _ = self.feed_cache.fetch(feed_url, parse, variant=self.feed_parse_variant(max_entries))
+        
+        return [FeedEntry(entry) for entry in entries]
+    
+    def fetch_planned_feed(self, feed_url, max_entries=5):
+        """Fetch a feed with its planned budget and record its yield"""
+        if self.fetch_planner is None:
+            return self.fetch_feed(feed_url, max_entries)
+        
+        budget = self.fetch_planner.budget_for(feed_url, max_entries)
+        start = time.perf_counter()
+        entries = self.fetch_feed(feed_url, budget)
+        self.fetch_planner.record_fetch(feed_url, budget, len(entries), time.perf_counter() - start)
+        return entries
+    
+    def fetch_feed_safely(self, feed_url, max_entries=5):
+        """Fetch a feed and return a (feed_url, entries, error) tuple"""
+        try:
+            return feed_url, self.fetch_planned_feed(feed_url, max_entries), None
+        except Exception as e:
+            return feed_url, None, e
     
     def extract_location(self, entry):
         """Extract location from job entry"""
@@ -211,96 +484,61 @@ class JobAutomationSystem:
         return location
     
     def clean_description(self, description):
-        """Clean job description text"""
+        """Clean job description text (HTML to text, at most 500 characters)"""
         if not description:
             return "No description available"
         
-        # Remove HTML tags and clean text
-        import re
-        clean_text = re.sub(r'<[^>]+>', '', description)
-        clean_text = re.sub(r'\s+', ' ', clean_text).strip()
-        
-        return clean_text[:500] + "..." if len(clean_text) > 500 else clean_text
+        return html_to_text(description, max_chars=500) or "No description available"
+    
+    def create_keyword_index(self):
+        """Compile every keyword list matched against job text into one matcher"""
+        job_search = self.config.get('job_search', {})
+        return KeywordIndex(
+            job_search.get('keywords', []),
+            job_search.get('locations', []),
+            job_search.get('experience_level', []),
+            job_search.get('job_types', []),
+            *MATCHED_KEYWORD_LISTS
+        )
+    
+    def get_job_matches(self, job):
+        """Keywords found in a job's title and description, scanned once and shared"""
+        return self.keyword_index.match_job(job)
     
     def is_relevant_job(self, job):
         """Check if job is relevant based on keywords"""
-        keywords = self.config['job_search']['keywords']
-        
-        text_to_check = f"{job['title']} {job['description']}".lower()
-        
         # Check if at least one keyword is present
-        for keyword in keywords:
-            if keyword.lower() in text_to_check:
-                return True
-        
-        return False
+        return self.get_job_matches(job).any(self.config['job_search']['keywords'])
+    
+    def matches_filters(self, job):
+        """Extract the job's structured fields (stored in job['fields']) and check the config.json filters"""
+        return passes_filters(get_job_fields(job), self.config.get('filters', {}))
+    
+    def get_document_template(self, kind):
+        """Template for 'cv' or 'cover_letter', built on first use (see document_templates and ooxml_writer)"""
+        if kind not in self.document_templates:
+            build = self.build_cv_document if kind == 'cv' else self.build_cover_letter_document
+            if self.config.get('documents', {}).get('engine', 'ooxml') == 'ooxml':
+                self.document_templates[kind] = OoxmlTemplate(build)
+            else:
+                self.document_templates[kind] = DocumentTemplate(build)
+        return self.document_templates[kind]
+    
+    def get_document_filename(self, kind, job):
+        """File name of a job's 'cv' or 'cover_letter'"""
+        prefix = 'CV' if kind == 'cv' else 'Cover_Letter'
+        return f"{prefix}_{job['company'].replace(' ', '_')}_{job['title'].replace(' ', '_')}.docx"
+    
+    def get_document_fields(self, kind, job):
+        """Job-dependent paragraphs of a job's 'cv' or 'cover_letter'"""
+        return self.get_cv_fields(job) if kind == 'cv' else self.get_cover_letter_fields(job)
     
     def generate_cv_for_job(self, job, output_dir):
         """Generate a customized CV for a specific job"""
         try:
-            # Create CV document
-            doc = Document()
-            
-            # Add header
-            header = doc.sections[0].header
-            header_para = header.paragraphs[0]
-            header_para.text = f"CV for {job['title']} - {job['company']}"
-            header_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
-            # Personal Information
-            personal_info = self.config['personal_info']
-            
-            # Name
-            name_para = doc.add_paragraph()
-            name_run = name_para.add_run(personal_info['name'])
-            name_run.font.size = Inches(0.2)
-            name_run.bold = True
-            name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
-            # Contact Info
-            contact_para = doc.add_paragraph()
-            contact_text = f"Email: {personal_info['email']} | Phone: {personal_info['phone']} | Location: {personal_info['location']}"
-            contact_para.add_run(contact_text)
-            contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
-            # LinkedIn and GitHub
-            links_para = doc.add_paragraph()
-            links_text = f"LinkedIn: {personal_info['linkedin']} | GitHub: {personal_info['github']}"
-            links_para.add_run(links_text)
-            links_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
-            doc.add_paragraph()  # Space
-            
-            # Professional Summary
-            doc.add_heading('Professional Summary', level=2)
-            summary_text = self.generate_custom_summary(job)
-            doc.add_paragraph(summary_text)
-            
-            # Skills
-            doc.add_heading('Technical Skills', level=2)
-            skills_text = self.generate_skills_section(job)
-            doc.add_paragraph(skills_text)
-            
-            # Experience
-            doc.add_heading('Professional Experience', level=2)
-            experience_text = self.generate_experience_section(job)
-            doc.add_paragraph(experience_text)
-            
-            # Education
-            doc.add_heading('Education', level=2)
-            education_text = """
-            Master's in Business Intelligence and Big Data Analytics
-            Universidad Politécnica de Madrid (Expected 2025)
-            
-            Bachelor's in Computer Science
-            Universidad del País Vasco (2022)
-            """
-            doc.add_paragraph(education_text)
-            
-            # Save CV
-            cv_filename = f"CV_{job['company'].replace(' ', '_')}_{job['title'].replace(' ', '_')}.docx"
+            cv_filename = self.get_document_filename('cv', job)
             cv_path = os.path.join(output_dir, cv_filename)
-            doc.save(cv_path)
+            self.get_document_template('cv').render(self.get_cv_fields(job), cv_path)
             
             logger.info(f"CV generated: {cv_filename}")
             return cv_path
@@ -309,6 +547,75 @@ class JobAutomationSystem:
             logger.error(f"Error generating CV for {job['title']}: {e}")
             return None
     
+    def get_cv_fields(self, job):
+        """Job-dependent paragraphs of the CV"""
+        return {
+            'header': f"CV for {job['title']} - {job['company']}",
+            'summary': self.generate_custom_summary(job),
+            'skills': self.generate_skills_section(job),
+            'experience': self.generate_experience_section(job)
+        }
+    
+    def build_cv_document(self, fields):
+        """Build the CV with python-docx from the job-dependent paragraphs"""
+        # Create CV document
+        doc = Document()
+        
+        # Add header
+        header = doc.sections[0].header
+        header_para = header.paragraphs[0]
+        header_para.text = fields['header']
+        header_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        
+        # Personal Information
+        personal_info = self.config['personal_info']
+        
+        # Name
+        name_para = doc.add_paragraph()
+        name_run = name_para.add_run(personal_info['name'])
+        name_run.font.size = Inches(0.2)
+        name_run.bold = True
+        name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        
+        # Contact Info
+        contact_para = doc.add_paragraph()
+        contact_text = f"Email: {personal_info['email']} | Phone: {personal_info['phone']} | Location: {personal_info['location']}"
+        contact_para.add_run(contact_text)
+        contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        
+        # LinkedIn and GitHub
+        links_para = doc.add_paragraph()
+        links_text = f"LinkedIn: {personal_info['linkedin']} | GitHub: {personal_info['github']}"
+        links_para.add_run(links_text)
+        links_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        
+        doc.add_paragraph()  # Space
+        
+        # Professional Summary
+        doc.add_heading('Professional Summary', level=2)
+        doc.add_paragraph(fields['summary'])
+        
+        # Skills
+        doc.add_heading('Technical Skills', level=2)
+        doc.add_paragraph(fields['skills'])
+        
+        # Experience
+        doc.add_heading('Professional Experience', level=2)
+        doc.add_paragraph(fields['experience'])
+        
+        # Education
+        doc.add_heading('Education', level=2)
+        education_text = """
+            Master's in Business Intelligence and Big Data Analytics
+            Universidad Politécnica de Madrid (Expected 2025)
+            
+            Bachelor's in Computer Science
+            Universidad del País Vasco (2022)
+            """
+        doc.add_paragraph(education_text)
+        
+        return doc
+    
     def generate_custom_summary(self, job):
         """Generate customized professional summary"""
         base_summary = """
@@ -319,13 +626,14 @@ class JobAutomationSystem:
         """
         
         # Customize based on job requirements
-        if "machine learning" in job['description'].lower():
+        matches = self.get_job_matches(job)
+        if matches.in_description("machine learning"):
             base_summary += " Strong background in machine learning algorithms and predictive modeling."
         
-        if "azure" in job['description'].lower():
+        if matches.in_description("azure"):
             base_summary += " Experienced with Microsoft Azure cloud platform and Azure Data Factory."
         
-        if "tableau" in job['description'].lower():
+        if matches.in_description("tableau"):
             base_summary += " Expert in Tableau for data visualization and dashboard creation."
         
         return base_summary.strip()
@@ -368,25 +676,51 @@ class JobAutomationSystem:
     def generate_cover_letter(self, job, output_dir):
         """Generate a customized cover letter"""
         try:
-            doc = Document()
-            
-            # Header
-            doc.add_paragraph(f"Date: {datetime.now().strftime('%B %d, %Y')}")
-            doc.add_paragraph()
-            
-            # Recipient
-            doc.add_paragraph(f"Dear {job['company']} Hiring Manager,")
-            doc.add_paragraph()
-            
-            # Body
-            intro = f"I am writing to express my strong interest in the {job['title']} position at {job['company']}. "
-            intro += "With my background in data analysis and business intelligence, I am excited about the opportunity "
-            intro += "to contribute to your team's success."
+            cl_filename = self.get_document_filename('cover_letter', job)
+            cl_path = os.path.join(output_dir, cl_filename)
+            self.get_document_template('cover_letter').render(self.get_cover_letter_fields(job), cl_path)
             
-            doc.add_paragraph(intro)
-            doc.add_paragraph()
+            logger.info(f"Cover letter generated: {cl_filename}")
+            return cl_path
             
-            body = """
+        except Exception as e:
+            logger.error(f"Error generating cover letter for {job['title']}: {e}")
+            return None
+    
+    def get_cover_letter_fields(self, job):
+        """Job-dependent paragraphs of the cover letter"""
+        intro = f"I am writing to express my strong interest in the {job['title']} position at {job['company']}. "
+        intro += "With my background in data analysis and business intelligence, I am excited about the opportunity "
+        intro += "to contribute to your team's success."
+        
+        closing = f"I am particularly drawn to {job['company']} because of your commitment to data-driven "
+        closing += "innovation. I would welcome the opportunity to discuss how my skills and experience "
+        closing += "can contribute to your team's objectives."
+        
+        return {
+            'date': f"Date: {datetime.now().strftime('%B %d, %Y')}",
+            'greeting': f"Dear {job['company']} Hiring Manager,",
+            'intro': intro,
+            'closing': closing
+        }
+    
+    def build_cover_letter_document(self, fields):
+        """Build the cover letter with python-docx from the job-dependent paragraphs"""
+        doc = Document()
+        
+        # Header
+        doc.add_paragraph(fields['date'])
+        doc.add_paragraph()
+        
+        # Recipient
+        doc.add_paragraph(fields['greeting'])
+        doc.add_paragraph()
+        
+        # Body
+        doc.add_paragraph(fields['intro'])
+        doc.add_paragraph()
+        
+        body = """
             In my current role as a Senior Data Analyst, I have developed expertise in Python, SQL, and various 
             BI tools including Power BI and Tableau. I have successfully implemented data-driven solutions that 
             have directly contributed to business growth and operational efficiency. My experience includes:
@@ -396,53 +730,54 @@ class JobAutomationSystem:
             • Creating predictive models and performing advanced statistical analysis
             • Collaborating with stakeholders to translate business requirements into technical solutions
             """
-            
-            doc.add_paragraph(body)
-            doc.add_paragraph()
-            
-            closing = f"I am particularly drawn to {job['company']} because of your commitment to data-driven "
-            closing += "innovation. I would welcome the opportunity to discuss how my skills and experience "
-            closing += "can contribute to your team's objectives."
-            
-            doc.add_paragraph(closing)
-            doc.add_paragraph()
-            doc.add_paragraph("Sincerely,")
-            doc.add_paragraph(self.config['personal_info']['name'])
-            
-            # Save cover letter
-            cl_filename = f"Cover_Letter_{job['company'].replace(' ', '_')}_{job['title'].replace(' ', '_')}.docx"
-            cl_path = os.path.join(output_dir, cl_filename)
-            doc.save(cl_path)
-            
-            logger.info(f"Cover letter generated: {cl_filename}")
-            return cl_path
-            
-        except Exception as e:
-            logger.error(f"Error generating cover letter for {job['title']}: {e}")
-            return None
+        
+        doc.add_paragraph(body)
+        doc.add_paragraph()
+        
+        doc.add_paragraph(fields['closing'])
+        doc.add_paragraph()
+        doc.add_paragraph("Sincerely,")
+        doc.add_paragraph(self.config['personal_info']['name'])
+        
+        return doc
     
-    def create_job_applications_zip(self, job_data, output_dir):
-        """Create a ZIP file with all job applications"""
+    def create_job_applications_zip(self, job_data, output_dir, documents=None):
+        """Create a ZIP file with all job applications
+        
+        documents are the RenderResults of the run: their bytes are streamed
+        into the archive (and released) instead of reading the files back.
+        """
         try:
             zip_filename = f"CVs_Generated_{datetime.now().strftime('%Y-%m-%d')}.zip"
             zip_path = os.path.join(output_dir, zip_filename)
             
+            if documents is None:
+                generated = len(self.cvs_generated)
+            else:
+                generated = sum(1 for result in documents if result.error is None)
+            
             with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
                 # Add all generated files
-                for file_path in self.cvs_generated:
-                    if os.path.exists(file_path):
-                        zip_file.write(file_path, os.path.basename(file_path))
+                if documents is None:
+                    for file_path in self.cvs_generated:
+                        if os.path.exists(file_path):
+                            zip_file.write(file_path, os.path.basename(file_path))
+                else:
+                    for result in documents:
+                        if result.data is not None:
+                            with zip_file.open(result.name, 'w') as f:
+                                f.write(result.data)
+                            result.data = None
                 
-                # Add job summary
+                # Add job summary, written straight into the archive
                 summary_filename = f"Job_Summary_{datetime.now().strftime('%Y-%m-%d')}.txt"
-                summary_path = os.path.join(output_dir, summary_filename)
                 
-                with open(summary_path, 'w', encoding='utf-8') as f:
+                with io.TextIOWrapper(zip_file.open(summary_filename, 'w'), encoding='utf-8') as f:
                     f.write("JOB SEARCH AUTOMATION SUMMARY\n")
                     f.write("=" * 40 + "\n\n")
                     f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
                     f.write(f"Total jobs found: {len(job_data)}\n")
-                    f.write(f"CVs generated: {len(self.cvs_generated)}\n\n")
+                    f.write(f"CVs generated: {generated}\n\n")
                     
                     for i, job in enumerate(job_data, 1):
                         f.write(f"Job {i}:\n")
@@ -451,8 +786,6 @@ class JobAutomationSystem:
                         f.write(f"  Location: {job['location']}\n")
                         f.write(f"  URL: {job['url']}\n")
                         f.write(f"  Description: {job['description'][:200]}...\n\n")
-                
-                zip_file.write(summary_path, os.path.basename(summary_path))
             
             logger.info(f"ZIP file created: {zip_filename}")
             return zip_path
@@ -539,41 +872,139 @@ Job Search Automation System
             logger.error(f"Error sending email: {e}")
             return False
     
-    def run_daily_automation(self):
-        """Run the complete daily automation process"""
+    def open_job_store(self):
+        """Open the persistent job store, if enabled"""
+        store_config = self.config.get('job_store', {})
+        if not store_config.get('enabled', True):
+            return None
+        
+        try:
+            return JobStore(store_config.get('path', 'job_store.db'))
+        except Exception as e:
+            logger.warning(f"Job store disabled: {e}")
+            return None
+    
+    def update_skill_index(self, job_store):
+        """Add the jobs stored by this run to the skill bitmap index"""
+        if job_store is None or not self.config.get('skill_index', {}).get('enabled', True):
+            return None
+        try:
+            return SkillIndex.open(self.config, job_store)
+        except Exception as e:
+            logger.warning(f"Could not update skill index: {e}")
+            return None
+    
+    def rank_jobs(self, jobs, job_store):
+        """Order a run's jobs by BM25 relevance to the config.json keyword profile"""
+        if job_store is None or not jobs or not self.config.get('ranking', {}).get('enabled', True):
+            return jobs
+        try:
+            return BM25Ranker.open(self.config, job_store).rank(jobs)
+        except Exception as e:
+            logger.warning(f"Could not rank jobs: {e}")
+            return jobs
+    
+    def is_already_processed(self, job, job_store, incremental):
+        """Record a job in the store and tell whether this run can skip it"""
+        if job_store is None:
+            return False
+        
+        if job_store.record_seen(job) and self.fetch_planner:
+            self.fetch_planner.record_new_job(job['source'])
+        return incremental and job_store.has_artifacts(job['job_id'])
+    
+    def is_near_duplicate(self, job, duplicate_detector):
+        """Check whether a job is a cross-posted copy of one already handled"""
+        if duplicate_detector is None:
+            return False
+        
+        duplicate = duplicate_detector.find_duplicate(job)
+        if duplicate:
+            logger.info(f"Skipping near-duplicate ({duplicate[1]:.0%} similar to {duplicate[0]}): {job['title']}")
+            return True
+        return False
+    
+    def record_document(self, result, job_store, zip_path=None):
+        """Keep a rendered document and record it as an artifact of its job
+        
+        A document that was only written to the archive is recorded by its
+        path inside it (zip_path/name).
+        """
+        if result.error:
+            return
+        path = result.path
+        if path is None:
+            if not zip_path:
+                return
+            path = os.path.join(zip_path, result.name)
+        
+        label = 'CV' if result.kind == 'cv' else 'Cover letter'
+        source = 'from cache' if result.cached else f"{result.seconds * 1000:.0f}ms"
+        logger.info(f"{label} generated: {result.name} ({source})")
+        self.cvs_generated.append(path)
+        if job_store:
+            job_store.record_artifact(result.job['job_id'], result.kind, path)
+    
+    def run_daily_automation(self, incremental=None):
+        """Run the complete daily automation process
+
+        In incremental mode (the default, see job_store.incremental in
+        config.json) jobs that already got documents in a previous run are
+        skipped by the document and email stages.
+        """
+        job_store = None
+        renderer = None
         try:
             logger.info("Starting daily job search automation")
             
+            job_store = self.open_job_store()
+            if incremental is None:
+                incremental = self.config.get('job_store', {}).get('incremental', True)
+            skipped_jobs = 0
+            duplicate_detector = NearDuplicateDetector.from_config(self.config, job_store, use_history=incremental)
+            
             # Create output directory
             today = datetime.now().strftime('%Y-%m-%d')
             output_dir = os.path.join('job_applications', today)
             os.makedirs(output_dir, exist_ok=True)
+            renderer = DocumentRenderer.from_config(self)
             
-            # Search for jobs
-            jobs = self.search_jobs_real_sources()
+            # Collect the jobs the sources produce, keeping only those not processed in earlier runs
+            jobs = []
+            for job in self.stream_jobs(job_store=job_store):
+                if self.is_already_processed(job, job_store, incremental):
+                    skipped_jobs += 1
+                elif not self.is_near_duplicate(job, duplicate_detector):
+                    jobs.append(job)
+            
+            if self.fetch_planner and job_store:
+                self.fetch_planner.save(job_store)
+            self.update_skill_index(job_store)
+            
+            if incremental and job_store:
+                logger.info(f"Incremental mode: skipped {skipped_jobs} jobs processed in earlier runs")
             
             if not jobs:
-                logger.info("No relevant jobs found today")
+                logger.info("No new relevant jobs found today" if skipped_jobs else "No relevant jobs found today")
                 return
             
-            # Process each job
+            logger.info(f"Found {len(jobs)} unique jobs")
+            
+            # Process each job, most relevant first
+            jobs = self.rank_jobs(jobs, job_store)
             for i, job in enumerate(jobs, 1):
                 logger.info(f"Processing job {i}/{len(jobs)}: {job['title']}")
                 
-                # Generate CV
-                cv_path = self.generate_cv_for_job(job, output_dir)
-                if cv_path:
-                    self.cvs_generated.append(cv_path)
-                
-                # Generate cover letter
-                cl_path = self.generate_cover_letter(job, output_dir)
-                if cl_path:
-                    self.cvs_generated.append(cl_path)
-                
-                logger.info(f"Job processed successfully: {job['title']}")
+                # Queue the CV and cover letter (rendered by the worker pool)
+                renderer.submit(job, output_dir)
+            
+            # Collect the rendered documents, in job order
+            documents = renderer.results()
             
             # Create ZIP file
-            zip_path = self.create_job_applications_zip(jobs, output_dir)
+            zip_path = self.create_job_applications_zip(jobs, output_dir, documents)
+            for result in documents:
+                self.record_document(result, job_store, zip_path)
             
             # Send email report
             if not self.send_email_report(jobs, zip_path):
@@ -584,6 +1015,12 @@ Job Search Automation System
             logger.info(f"Files generated in: {output_dir}")
             logger.info(f"Total jobs processed: {len(jobs)}")
             logger.info(f"CVs generated: {len(self.cvs_generated)}")
+            for line in renderer.summary_lines():
+                logger.info(line)
+            if duplicate_detector:
+                logger.info(duplicate_detector.summary())
+            if job_store:
+                logger.info(job_store.summary())
             
             return True
             
@@ -591,12 +1028,25 @@ Job Search Automation System
             logger.error(f"Error in daily automation: {e}")
             logger.error(traceback.format_exc())
             return False
+        
+        finally:
+            if renderer:
+                renderer.close()
+            if job_store:
+                job_store.close()
 
 def main():
     """Main function to run the automation"""
+    parser = argparse.ArgumentParser(description="Daily job search automation")
+    parser.add_argument('--no-loose-files', action='store_true',
+                        help="Only write the ZIP archive, not each CV and cover letter as a file")
+    args = parser.parse_args()
+    
     try:
         # Initialize automation system
         automation = JobAutomationSystem()
+        if args.no_loose_files:
+            automation.config.setdefault('documents', {})['loose_files'] = False
         
         # Run daily automation
         success = automation.run_daily_automation()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTML to plain text for the Job Automation System
+Feed summaries are scanned as a stream of tags and text runs: entities are
+decoded, script/style content is dropped, block elements become line breaks
+and the scan stops as soon as the output budget is used up, so a huge
+summary costs no more than the part of it that is kept
+"""
+
+import html
+import re
+
+# One token per match: comment, CDATA section, tag, other markup (<!DOCTYPE>, <?xml?>), text run or stray "<".
+# A tag cannot contain "<", so an unclosed one fails at the next "<" instead of scanning the rest of the input
+TOKEN_RE = re.compile(
+    r"<!--.*?(?:-->|\Z)"
+    r"|<!\[CDATA\[(?P<cdata>.*?)(?:\]\]>|\Z)"
+    r"|<(?P<closing>/)?(?P<tag>[a-zA-Z][\w:-]*)(?:[^<>\"']|\"[^\"<]*\"|'[^'<]*')*>"
+    r"|<[!?][^<>]*>"
+    r"|(?P<text>[^<]+|<)",
+    re.S
+)
+
+# Elements whose content is never text
+SKIPPED_ELEMENTS = frozenset({'script', 'style', 'head', 'noscript', 'template', 'svg'})
+
+# Elements that start or end a line
+BLOCK_ELEMENTS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt', 'fieldset', 'figcaption',
+    'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav',
+    'ol', 'p', 'pre', 'section', 'table', 'td', 'th', 'tr', 'ul',
+})
+
+
+def html_to_text(markup, max_chars=None, ellipsis='...'):
+    """Plain text of an HTML fragment, one line per block element
+
+    With max_chars, scanning stops once more than max_chars characters of
+    text have been produced and the result is cut there, followed by the
+    ellipsis.
+    """
+    parts = []
+    length = 0
+    separator = ''
+    position = 0
+    end = len(markup)
+
+    while position < end:
+        match = TOKEN_RE.match(markup, position)
+        position = match.end()
+        text = match.group('text')
+        if text is None:
+            text = match.group('cdata')
+        elif '&' in text:
+            text = html.unescape(text)
+
+        if text is None:
+            tag = match.group('tag')
+            if tag is None:
+                continue
+            tag = tag.lower()
+            if tag in BLOCK_ELEMENTS:
+                separator = '\n' if parts else ''
+            elif tag in SKIPPED_ELEMENTS and not match.group('closing') and not match.group(0).endswith('/>'):
+                # Jump straight past the closing tag without tokenizing the content
+                close = re.compile(rf"</{tag}\s*>", re.I).search(markup, position)
+                position = close.end() if close else end
+            continue
+
+        words = text.split()
+        if not words:
+            if parts and not separator:
+                separator = ' '
+            continue
+        if parts and not separator and text[0].isspace():
+            separator = ' '
+        chunk = separator + ' '.join(words)
+        parts.append(chunk)
+        length += len(chunk)
+        separator = ' ' if text[-1].isspace() else ''
+
+        if max_chars is not None and length > max_chars:
+            return ''.join(parts)[:max_chars] + ellipsis
+    return ''.join(parts)
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Persistent conditional-GET HTTP cache for job feeds
+Stores ETag/Last-Modified validators, a content hash of the part of every
+body that was parsed, and the parsed entries, so unchanged feeds cost a
+single 304 round-trip and no parse work
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+from http_client import get_default_client
+
+logger = logging.getLogger(__name__)
+
+
+class BodyReader:
+    """Iterate a streamed response body with a byte cap, remembering what was read"""
+
+    def __init__(self, chunks, max_bytes=None):
+        self._chunks = iter(chunks)
+        self._pending = []
+        self._consumed = []
+        self.max_bytes = max_bytes
+        self.bytes_read = 0
+        self.truncated = False
+
+    def _next_chunk(self):
+        """Read the next chunk from the network, honouring max_bytes"""
+        if self.max_bytes is not None and self.bytes_read >= self.max_bytes:
+            self.truncated = True
+            return None
+
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            return None
+
+        if self.max_bytes is not None and self.bytes_read + len(chunk) > self.max_bytes:
+            chunk = chunk[:self.max_bytes - self.bytes_read]
+            self.truncated = True
+        self.bytes_read += len(chunk)
+        return chunk
+
+    def peek(self, size):
+        """Return the first `size` bytes without consuming them"""
+        buffered = sum(len(chunk) for chunk in self._pending)
+        while buffered < size:
+            chunk = self._next_chunk()
+            if chunk is None:
+                break
+            self._pending.append(chunk)
+            buffered += len(chunk)
+        return b''.join(self._pending)[:size]
+
+    def __iter__(self):
+        while True:
+            chunk = self._pending.pop(0) if self._pending else self._next_chunk()
+            if chunk is None:
+                return
+            self._consumed.append(chunk)
+            yield chunk
+
+    def consumed(self):
+        """Bytes handed to the consumer so far"""
+        return b''.join(self._consumed)
+
+
+class FeedHttpCache:
+    """On-disk HTTP cache with validators, content hashing and LRU eviction"""
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, cache_dir='.feed_cache', max_bytes=20 * 1024 * 1024, session=None, timeout=None,
+                 chunk_size=16384, max_response_bytes=None):
+        """Initialize the cache and load its index from disk
+
+        session is the HttpClient used for requests (the shared default
+        client if omitted); timeout=None keeps the client's timeouts.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.session = session or get_default_client()
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.max_response_bytes = max_response_bytes
+        self.stats = {'not_modified': 0, 'content_hash_hits': 0, 'misses': 0, 'evictions': 0}
+        self._lock = threading.Lock()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.index = self._load_index()
+
+    def _load_index(self):
+        """Load the cache index, starting empty if it is missing or corrupt"""
+        index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable feed cache index: {e}")
+            return {}
+
+    def _entry_path(self, url):
+        """Path of the cached parse for a URL"""
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _write_file(self, path, data):
+        """Write bytes to a file atomically"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _remove_file(self, path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _load_parsed(self, url):
+        """Load the parsed payload stored for a URL, if any"""
+        try:
+            with open(self._entry_path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _usable_entry(self, url, variant):
+        """Cached entry for a URL if it was parsed with the same variant"""
+        entry = self.index.get(url)
+        if entry and entry.get('variant') == variant and os.path.exists(self._entry_path(url)):
+            return entry
+        return None
+
+    def conditional_headers(self, entry):
+        """Build If-None-Match / If-Modified-Since headers for a cached entry"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def fetch(self, url, parse_func, variant=''):
+        """Fetch and parse a URL, reusing the cached parse when nothing changed
+
+        parse_func receives an iterable of body chunks and returns a
+        JSON-serializable result; it may stop reading early. `variant`
+        identifies the parse settings, and a cached parse made with other
+        settings is ignored. Returns (parsed, changed).
+        """
+        with self._lock:
+            entry = self._usable_entry(url, variant)
+            headers = self.conditional_headers(entry)
+
+        response = self.session.get(url, headers=headers, timeout=self.timeout, stream=True)
+        try:
+            if response.status_code == 304 and entry:
+                parsed = self._load_parsed(url)
+                if parsed is not None:
+                    with self._lock:
+                        self.stats['not_modified'] += 1
+                        entry['last_access'] = time.time()
+                    return parsed, False
+
+            response.raise_for_status()
+            reader = BodyReader(response.iter_content(self.chunk_size), self.max_response_bytes)
+
+            if entry and entry.get('prefix_size'):
+                # Server ignored the validators: compare the part we parsed last time
+                prefix = reader.peek(entry['prefix_size'])
+                if hashlib.sha256(prefix).hexdigest() == entry.get('prefix_hash'):
+                    parsed = self._load_parsed(url)
+                    if parsed is not None:
+                        with self._lock:
+                            self.stats['content_hash_hits'] += 1
+                            entry.update({
+                                'etag': response.headers.get('ETag') or entry.get('etag'),
+                                'last_modified': response.headers.get('Last-Modified') or entry.get('last_modified'),
+                                'last_access': time.time(),
+                            })
+                        return parsed, False
+
+            parsed = parse_func(reader)
+            consumed = reader.consumed()
+            data = json.dumps(parsed, ensure_ascii=False).encode('utf-8')
+
+            with self._lock:
+                self.stats['misses'] += 1
+                self._write_file(self._entry_path(url), data)
+                self.index[url] = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'variant': variant,
+                    'prefix_size': len(consumed),
+                    'prefix_hash': hashlib.sha256(consumed).hexdigest(),
+                    'size': len(data),
+                    'last_access': time.time(),
+                }
+            return parsed, True
+
+        finally:
+            response.close()
+
+    def evict(self):
+        """Evict least recently used entries until the cache fits in max_bytes"""
+        with self._lock:
+            total = sum(entry.get('size', 0) for entry in self.index.values())
+            for url, entry in sorted(self.index.items(), key=lambda item: item[1].get('last_access', 0)):
+                if total <= self.max_bytes:
+                    break
+                total -= entry.get('size', 0)
+                self._remove_file(self._entry_path(url))
+                del self.index[url]
+                self.stats['evictions'] += 1
+
+    def save(self):
+        """Evict if needed and persist the index"""
+        self.evict()
+        with self._lock:
+            self._write_file(os.path.join(self.cache_dir, self.INDEX_FILE), json.dumps(self.index, indent=2).encode('utf-8'))
+
+    def summary(self):
+        """One-line summary of hit/miss counters for the run log"""
+        hits = self.stats['not_modified'] + self.stats['content_hash_hits']
+        return (f"Feed cache: {hits} hits ({self.stats['not_modified']} not modified, "
+                f"{self.stats['content_hash_hits']} identical content), {self.stats['misses']} misses, "
+                f"{self.stats['evictions']} evictions")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared HTTP client for the Job Automation System
+Every job source goes through one requests session with pooled keep-alive
+connections per host, gzip negotiation, connect/read timeouts and capped
+exponential-backoff retries on 429 and 5xx responses
+"""
+
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limiter import DomainRateLimiter
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+USER_AGENT = 'FinanzApp-JobAutomation/1.0'
+
+
+def client_settings(config):
+    """HttpClient keyword arguments from the 'http' section of config.json"""
+    settings = config.get('http', {})
+    return {
+        'pool_connections': settings.get('pool_connections', 10),
+        'pool_maxsize': settings.get('pool_maxsize', 10),
+        'connect_timeout': settings.get('connect_timeout', 5),
+        'read_timeout': settings.get('read_timeout', 30),
+        'max_retries': settings.get('max_retries', 3),
+        'backoff_factor': settings.get('backoff_factor', 0.5),
+        'backoff_max': settings.get('backoff_max', 30),
+        'retry_statuses': settings.get('retry_statuses', RETRY_STATUSES),
+    }
+
+
+class HttpClient:
+    """Pooled requests session with default timeouts and a retry policy"""
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, connect_timeout=5, read_timeout=30,
+                 max_retries=3, backoff_factor=0.5, backoff_max=30, retry_statuses=RETRY_STATUSES,
+                 rate_limiter=None):
+        """Initialize the session
+
+        pool_connections is the number of hosts kept in the pool and
+        pool_maxsize the number of keep-alive connections kept per host; it
+        should not be lower than ingestion.per_host_limit. Every attempt,
+        retries included, waits for a token from rate_limiter if one is given.
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.retry_statuses = set(retry_statuses)
+        self.rate_limiter = rate_limiter
+        self.sleep = time.sleep
+        self.stats = {'requests': 0, 'retries': 0, 'errors': 0}
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip, deflate'})
+
+    @classmethod
+    def from_config(cls, config):
+        """Create a client from the 'http' and 'rate_limits' sections of config.json"""
+        return cls(rate_limiter=DomainRateLimiter.from_config(config), **client_settings(config))
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def retry_delay(self, attempt, response=None):
+        """Seconds to wait before retry number `attempt` (0-based)
+
+        A Retry-After header (seconds or HTTP date) takes precedence over the
+        exponential backoff; both are capped at backoff_max.
+        """
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return min(max(0.0, delay), self.backoff_max)
+
+        return min(self.backoff_factor * (2 ** attempt), self.backoff_max)
+
+    def get(self, url, redact_params=(), **kwargs):
+        """GET a URL, retrying connection errors, timeouts and retryable statuses
+
+        Accepts the same keyword arguments as requests.get; timeout defaults
+        to the client's (connect, read) timeouts. redact_params names query
+        parameters that carry credentials, which recording clients must not
+        store. The last response is returned even if its status is still an
+        error, so callers keep using raise_for_status().
+        """
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+
+        for attempt in range(self.max_retries + 1):
+            self._count('requests')
+            if self.rate_limiter:
+                self.rate_limiter.acquire(url)
+            try:
+                response = self.session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries:
+                    self._count('errors')
+                    raise
+                delay = self.retry_delay(attempt)
+                logger.warning(f"Request to {url} failed ({e}), retrying in {delay:.1f}s")
+            else:
+                if response.status_code not in self.retry_statuses or attempt >= self.max_retries:
+                    return response
+                delay = self.retry_delay(attempt, response)
+                response.close()
+                logger.warning(f"{url} answered {response.status_code}, retrying in {delay:.1f}s")
+
+            self._count('retries')
+            self.sleep(delay)
+
+    def flush(self):
+        """Persist anything buffered by the client (see http_replay)"""
+        pass
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
+
+    def summary(self):
+        """One-line summary of request counters for the run log"""
+        return (f"HTTP client: {self.stats['requests']} requests, {self.stats['retries']} retries, "
+                f"{self.stats['errors']} failed")
+
+
+_default_client = None
+_default_lock = threading.Lock()
+
+
+def get_default_client():
+    """Process-wide client for callers that are not given one"""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Record/replay HTTP clients for the Job Automation System
+Record mode saves every feed and API response into a compressed, versioned
+fixture archive; replay mode serves them back with the recorded latency, so
+the whole pipeline can run and be benchmarked without a network
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import zipfile
+from datetime import datetime
+from http.client import responses as HTTP_REASONS
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from http_cache import BodyReader
+from http_client import HttpClient, client_settings
+from rate_limiter import DomainRateLimiter
+
+logger = logging.getLogger(__name__)
+
+FIXTURE_FORMAT_VERSION = 1
+MANIFEST_FILE = 'manifest.json'
+
+# Response headers worth replaying; bodies are stored decoded
+RECORDED_HEADERS = ['Content-Type', 'ETag', 'Last-Modified', 'Retry-After']
+CONDITIONAL_HEADERS = ['If-None-Match', 'If-Modified-Since']
+
+
+def env_flag(name, default=False):
+    """Read a true/false flag from the environment (.env)"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def fixture_key(url, params=None, redact_params=()):
+    """Request key of a fixture: the URL plus sorted query parameters
+
+    Parameters listed in redact_params (API keys) are left out, so recorded
+    archives never contain credentials.
+    """
+    params = {name: value for name, value in (params or {}).items() if name not in redact_params}
+    if not params:
+        return url
+    separator = '&' if '?' in url else '?'
+    return f"{url}{separator}{urlencode(sorted(params.items()))}"
+
+
+class FixtureArchive:
+    """ZIP archive of recorded responses with a versioned JSON manifest"""
+
+    def __init__(self, path):
+        self.path = path
+        self.responses = {}
+        self.bodies = {}
+
+    @classmethod
+    def load(cls, path):
+        """Load an archive written by save(); raises ValueError on a version mismatch"""
+        archive = cls(path)
+        with zipfile.ZipFile(path) as zf:
+            manifest = json.loads(zf.read(MANIFEST_FILE).decode('utf-8'))
+            version = manifest.get('format_version')
+            if version != FIXTURE_FORMAT_VERSION:
+                raise ValueError(f"Unsupported fixture archive version {version} in {path}")
+
+            archive.responses = manifest['responses']
+            for fixture in archive.responses.values():
+                if fixture['body'] not in archive.bodies:
+                    archive.bodies[fixture['body']] = zf.read(fixture['body'])
+        return archive
+
+    def add(self, key, status, headers, body, latency):
+        """Add (or replace) the response recorded for a request key"""
+        body_name = f"bodies/{hashlib.sha1(body).hexdigest()}"
+        self.bodies[body_name] = body
+        self.responses[key] = {
+            'status': status,
+            'headers': {name: headers[name] for name in RECORDED_HEADERS if headers.get(name)},
+            'latency': round(latency, 4),
+            'body': body_name,
+        }
+
+    def save(self):
+        """Write the archive atomically"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        manifest = {
+            'format_version': FIXTURE_FORMAT_VERSION,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'responses': self.responses,
+        }
+        tmp_path = f"{self.path}.tmp"
+        with zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(MANIFEST_FILE, json.dumps(manifest, indent=2, sort_keys=True))
+            for name, body in self.bodies.items():
+                zf.writestr(name, body)
+        os.replace(tmp_path, self.path)
+
+
+class RecordingHttpClient(HttpClient):
+    """Live client that also records every response into a fixture archive
+
+    Bodies are read through a BodyReader capped at max_response_bytes, the
+    same cap ingestion applies, and the response is handed on with the
+    recorded body.
+    """
+
+    def __init__(self, archive_path, max_response_bytes=None, **kwargs):
+        super().__init__(**kwargs)
+        self.archive = FixtureArchive(archive_path)
+        self.max_response_bytes = max_response_bytes
+        self._record_lock = threading.Lock()
+
+    def get(self, url, params=None, headers=None, redact_params=(), **kwargs):
+        # Always ask for the full body so the archive can replay it
+        headers = {name: value for name, value in (headers or {}).items() if name not in CONDITIONAL_HEADERS}
+
+        start = time.perf_counter()
+        response = super().get(url, params=params, headers=headers, redact_params=redact_params, **kwargs)
+        body = b''.join(BodyReader(response.iter_content(16384), self.max_response_bytes))
+        response.close()
+        response._content = body
+        response._content_consumed = True
+        latency = time.perf_counter() - start
+
+        with self._record_lock:
+            self.archive.add(fixture_key(url, params, redact_params), response.status_code,
+                             response.headers, body, latency)
+        return response
+
+    def flush(self):
+        """Write the recorded responses to the archive"""
+        with self._record_lock:
+            self.archive.save()
+        logger.info(f"Recorded {len(self.archive.responses)} responses to {self.archive.path}")
+
+    def summary(self):
+        return f"{super().summary()} (recording to {self.archive.path})"
+
+
+class ReplayHttpClient(HttpClient):
+    """Offline client that serves responses from a fixture archive"""
+
+    def __init__(self, archive_path, latency_scale=1.0, **kwargs):
+        super().__init__(**kwargs)
+        self.archive = FixtureArchive.load(archive_path)
+        self.latency_scale = latency_scale
+        self.stats['missing'] = 0
+
+    def get(self, url, params=None, headers=None, redact_params=(), **kwargs):
+        key = fixture_key(url, params, redact_params)
+        self._count('requests')
+
+        if self.rate_limiter:
+            self.rate_limiter.acquire(url)
+
+        fixture = self.archive.responses.get(key)
+        if fixture is None:
+            self._count('missing')
+            raise requests.ConnectionError(f"No recorded response for {key}")
+
+        # Simulate the recorded network time of this source
+        self.sleep(fixture['latency'] * self.latency_scale)
+
+        response = requests.Response()
+        response.url = url
+        response.status_code = fixture['status']
+        response.headers = CaseInsensitiveDict(fixture['headers'])
+        response._content = self.archive.bodies[fixture['body']]
+
+        etag = fixture['headers'].get('ETag')
+        if etag and (headers or {}).get('If-None-Match') == etag:
+            response.status_code = 304
+            response._content = b''
+
+        response._content_consumed = True
+        response.reason = HTTP_REASONS.get(response.status_code, '')
+        return response
+
+    def summary(self):
+        return (f"HTTP client (replay from {self.archive.path}): {self.stats['requests']} requests, "
+                f"{self.stats['missing']} not recorded")
+
+
+def create_http_client(config):
+    """Create the HTTP client for the configured mode
+
+    USE_REAL_APIS=false in .env replays the fixture archive instead of using
+    the network; with real APIs, DEBUG_MODE=true also records responses into
+    the archive. The 'replay' section of config.json sets the archive path
+    and latency scale, and its "mode" ("live", "record" or "replay")
+    overrides the environment.
+    """
+    settings = config.get('replay', {})
+    archive_path = settings.get('archive', 'fixtures/job_sources.zip')
+
+    mode = settings.get('mode')
+    if not mode:
+        if not env_flag('USE_REAL_APIS', default=True):
+            mode = 'replay'
+        elif env_flag('DEBUG_MODE'):
+            mode = 'record'
+        else:
+            mode = 'live'
+
+    if mode == 'replay':
+        logger.info(f"Replaying job sources from {archive_path}")
+        try:
+            return ReplayHttpClient(archive_path, latency_scale=settings.get('latency_scale', 1.0),
+                                    rate_limiter=DomainRateLimiter.from_config(config), **client_settings(config))
+        except FileNotFoundError:
+            logger.error(f"Replay mode needs a recorded fixture archive, but {archive_path} does not exist. "
+                         "Record one first (replay.mode \"record\" in config.json, or USE_REAL_APIS=true and "
+                         "DEBUG_MODE=true in .env), or set replay.mode to \"live\".")
+            raise
+    if mode == 'record':
+        logger.info(f"Recording job sources to {archive_path}")
+        return RecordingHttpClient(archive_path, config.get('ingestion', {}).get('max_response_bytes'),
+                                   rate_limiter=DomainRateLimiter.from_config(config), **client_settings(config))
+    return HttpClient.from_config(config)
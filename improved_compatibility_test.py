@@ -7,14 +7,23 @@ Versión mejorada del cálculo de compatibilidad para mejor distribución de col
 import re
 import random
 from datetime import datetime
+from job_text import get_job_text
+from score_cache import ScoreCache, scorer_fingerprint, stable_variation
 from simple_automation import JobAutomationSystem
 
+# Bump when calculate_improved_compatibility changes, so memoized scores are recomputed
+SCORER_VERSION = 1
+
 class ImprovedCompatibilityCalculator:
     """Calculador de compatibilidad mejorado para mejor distribución"""
     
-    def __init__(self, config):
+    def __init__(self, config, job_store=None):
         self.config = config
         self.my_skills = config['job_search']['keywords']
+        scoring = config.get('scoring', {})
+        self.deterministic = scoring.get('deterministic', True)
+        # The variation always applies here, so this is simple_automation's memoize condition
+        self.memoize = self.deterministic and scoring.get('cache', True)
         
         # Categorizar skills por importancia
         self.high_value_skills = [
@@ -33,10 +42,22 @@ class ImprovedCompatibilityCalculator:
             'senior', 'lead', 'specialist', 'expert', 'advanced',
             'years experience', 'bi', 'data', 'analysis', 'analytics'
         ]
+        
+        # Memoized scores (deterministic mode with scoring.cache on), persisted if a job store is given
+        fingerprint = scorer_fingerprint('calculate_improved_compatibility', SCORER_VERSION,
+                                         self.high_value_skills, self.medium_value_skills, self.bonus_keywords)
+        self.score_cache = ScoreCache(fingerprint, job_store)
     
     def calculate_improved_compatibility(self, job):
         """Calculate improved compatibility with better distribution"""
-        job_text = f"{job['title']} {job.get('description', '')}".lower()
+        normalized = get_job_text(job)
+        if self.memoize:
+            score = self.score_cache.get(normalized.content_hash)
+            if score is not None:
+                return score
+        
+        job_text = normalized.text
+        title = normalized.title
         
         # Initialize scoring
         compatibility_score = 0
@@ -53,11 +74,11 @@ class ImprovedCompatibilityCalculator:
         
         # 3. Title relevance (20% of total score)
         title_score = 0
-        if any(keyword in job['title'].lower() for keyword in ['data', 'business intelligence', 'bi', 'analyst', 'analytics']):
+        if any(keyword in title for keyword in ['data', 'business intelligence', 'bi', 'analyst', 'analytics']):
             title_score = 20
-        elif any(keyword in job['title'].lower() for keyword in ['python', 'sql', 'developer']):
+        elif any(keyword in title for keyword in ['python', 'sql', 'developer']):
             title_score = 15
-        elif any(keyword in job['title'].lower() for keyword in ['science', 'scientist', 'engineer']):
+        elif any(keyword in title for keyword in ['science', 'scientist', 'engineer']):
             title_score = 10
         compatibility_score += title_score
         
@@ -79,10 +100,15 @@ class ImprovedCompatibilityCalculator:
         # Ensure realistic distribution
         compatibility_score = max(30, min(95, compatibility_score))
         
-        # Add slight randomization for variety (±3%)
-        variation = random.randint(-3, 3)
+        # Add slight variation for variety (±3%)
+        if self.deterministic:
+            variation = stable_variation(normalized.content_hash, 3)
+        else:
+            variation = random.randint(-3, 3)
         final_score = max(30, min(95, int(compatibility_score + variation)))
         
+        if self.memoize:
+            self.score_cache.put(normalized.content_hash, final_score)
         return final_score
 
 def test_improved_compatibility():
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Structured job fields for the Job Automation System
+One compiled pattern scans a job's normalized text once and pulls out the
+years of experience asked for, any salary stated (amount, currency and
+period), the seniority level in the title and the contract type. The
+fields are stored on the job at ingestion, so the email, the CVs and the
+filters read them instead of searching the text again
+"""
+
+import re
+
+from job_text import get_job_text
+
+FIELD_NAMES = ('experience_min', 'experience_max', 'salary_min', 'salary_max', 'salary_currency',
+               'salary_period', 'seniority', 'contract_type')
+
+NUMBER = r"\d{1,3}(?:[.,]\d{3})+|\d+(?:[.,]\d+)?"
+RANGE = r"\s?(?:-|–|a|to|y|and|hasta)\s?"
+SYMBOL = r"[€$£]"
+CURRENCY_WORD = r"(?:eur(?:os)?|usd|dolares|dollars|gbp|libras)\b"
+YEARS = r"(?:anos|years?|yrs?)\b"
+PERIOD = (r"(?:\s?(?:brutos?|netos?|gross|net))?"
+          r"(?P<period>\s?/\s?(?:ano|year|yr|mes|month|hora|hour|h)\b"
+          r"|\s(?:al|por|per|a|an?)\s(?:ano|year|mes|month|hora|hour)\b"
+          r"|\s(?:anual(?:es)?|annual(?:ly)?|mensual(?:es)?|monthly|hourly)\b)?")
+
+SENIORITY_TERMS = {
+    'intern': ('trainee', 'intern', 'becario', 'becaria'),
+    'junior': ('junior', 'jr', 'entry level', 'entry-level', 'graduate'),
+    'mid': ('mid', 'mid-level', 'mid level', 'semi senior', 'semi-senior', 'intermedio'),
+    'senior': ('senior', 'sr', 'experto', 'expert'),
+    'lead': ('lead', 'principal', 'head of', 'jefe', 'jefa', 'manager', 'responsable'),
+}
+
+# Most specific first: a posting offering "practicas, jornada completa" is an internship
+CONTRACT_TERMS = {
+    'internship': ('practicas', 'internship', 'beca'),
+    'freelance': ('freelance', 'autonomo', 'contractor'),
+    'temporary': ('temporal', 'temporary', 'fixed-term', 'fixed term', 'duracion determinada', 'por obra'),
+    'part-time': ('part-time', 'part time', 'media jornada', 'tiempo parcial'),
+    'permanent': ('indefinido', 'permanent', 'permanente'),
+    'full-time': ('full-time', 'full time', 'jornada completa', 'tiempo completo'),
+}
+
+CURRENCIES = {'€': 'EUR', 'eur': 'EUR', 'euros': 'EUR', '$': 'USD', 'usd': 'USD', 'dolares': 'USD',
+              'dollars': 'USD', '£': 'GBP', 'gbp': 'GBP', 'libras': 'GBP'}
+PERIODS = {'ano': 'year', 'year': 'year', 'yr': 'year', 'anual': 'year', 'anuales': 'year', 'annual': 'year',
+           'annually': 'year', 'mes': 'month', 'month': 'month', 'mensual': 'month', 'mensuales': 'month',
+           'monthly': 'month', 'hora': 'hour', 'hour': 'hour', 'h': 'hour', 'hourly': 'hour'}
+ANNUAL_FACTORS = {'year': 1, 'month': 12, 'hour': 1760}
+
+_seniority_levels = {term: level for level, terms in SENIORITY_TERMS.items() for term in terms}
+_contract_types = {term: kind for kind, terms in CONTRACT_TERMS.items() for term in terms}
+_contract_rank = {kind: rank for rank, kind in enumerate(CONTRACT_TERMS)}
+
+
+def _terms_pattern(terms):
+    return '|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+
+
+FIELDS_RE = re.compile(
+    # Experience: "3-5 años", "de 2 a 4 years", "3+ años", "al menos 2 años de experiencia",
+    # "experiencia mínima de 3 años", "experiencia: 2 años"
+    rf"(?P<experience>(?P<exp_prefix>(?:experiencia|experience)(?:\s(?:minima|requerida|minimum|required))?"
+    rf"\s?:?\s(?:de\s|of\s)?)?"
+    rf"(?P<qualifier>(?:mas de|al menos|minimo(?: de)?|at least|minimum(?: of)?|over)\s)?"
+    rf"(?P<exp_min>\d{{1,2}})(?:{RANGE}(?P<exp_max>\d{{1,2}}))?\s?(?P<plus>\+)?\s?{YEARS}"
+    rf"(?P<exp_context>(?:\s[\w/]+){{0,3}}?\s(?:de\s)?(?:experiencia|experience))?)"
+    # Salary with the currency first: "€45k - €55k", "$60,000/year"
+    rf"|(?P<salary_prefix>(?P<cur1>{SYMBOL})\s?(?P<sal1>{NUMBER})(?P<k1>\s?k\b)?"
+    rf"(?:{RANGE}{SYMBOL}?\s?(?P<sal2>{NUMBER})(?P<k2>\s?k\b)?)?{PERIOD.replace('period', 'period1')})"
+    # Salary with the currency last: "30.000 - 40.000 € brutos anuales", "2.500 euros al mes"
+    rf"|(?P<salary_suffix>(?P<sal3>{NUMBER})(?P<k3>\s?k\b)?(?:{RANGE}(?P<sal4>{NUMBER})(?P<k4>\s?k\b)?)?"
+    rf"\s?(?P<cur2>{SYMBOL}|{CURRENCY_WORD}){PERIOD.replace('period', 'period2')})"
+    rf"|\b(?P<seniority>{_terms_pattern(_seniority_levels)})\b"
+    rf"|\b(?P<contract>{_terms_pattern(_contract_types)})\b"
+)
+
+
+def parse_amount(number, thousands=None):
+    """Parse "45.000", "45,000", "2,5" or "45" (with a "k" suffix for thousands)"""
+    if re.fullmatch(r"\d{1,3}(?:[.,]\d{3})+", number):
+        value = float(re.sub(r"[.,]", '', number))
+    else:
+        value = float(number.replace(',', '.'))
+    return int(round(value * 1000)) if thousands else int(round(value))
+
+
+def infer_period(amount):
+    """Salary period implied by its size when the posting does not say"""
+    if amount >= 10000:
+        return 'year'
+    return 'month' if amount >= 400 else 'hour'
+
+
+def extract_fields(job_text):
+    """Structured fields of a JobText, from a single scan of its normalized text"""
+    fields = dict.fromkeys(FIELD_NAMES)
+    contract_rank = len(CONTRACT_TERMS)
+
+    for match in FIELDS_RE.finditer(job_text.text):
+        if match.group('experience') is not None:
+            if fields['experience_min'] is not None:
+                continue
+            # Bare "20 años" (company history, ages) only counts with a range, "+" or context
+            if not (match.group('exp_max') or match.group('plus') or match.group('qualifier')
+                    or match.group('exp_prefix') or match.group('exp_context')):
+                continue
+            low = int(match.group('exp_min'))
+            high = int(match.group('exp_max')) if match.group('exp_max') else None
+            if low > 30 or (high is not None and not low <= high <= 30):
+                continue
+            fields['experience_min'] = low
+            fields['experience_max'] = high
+
+        elif match.group('salary_prefix') is not None or match.group('salary_suffix') is not None:
+            if fields['salary_min'] is not None:
+                continue
+            if match.group('salary_prefix') is not None:
+                currency, period = match.group('cur1'), match.group('period1')
+                amounts = [(match.group('sal1'), match.group('k1')), (match.group('sal2'), match.group('k2'))]
+            else:
+                currency, period = match.group('cur2'), match.group('period2')
+                amounts = [(match.group('sal3'), match.group('k3')), (match.group('sal4'), match.group('k4'))]
+
+            # "40-50k" shares the k suffix
+            if amounts[1][0] and amounts[1][1] and not amounts[0][1]:
+                amounts[0] = (amounts[0][0], amounts[1][1])
+            values = [parse_amount(number, k) for number, k in amounts if number]
+            if min(values) < 5:
+                continue
+            fields['salary_min'] = min(values)
+            fields['salary_max'] = max(values)
+            fields['salary_currency'] = CURRENCIES[currency]
+            if period:
+                fields['salary_period'] = PERIODS[period.strip(' /').split()[-1]]
+            else:
+                fields['salary_period'] = infer_period(fields['salary_max'])
+
+        elif match.group('seniority') is not None:
+            # Only the title states the role's level: a description mentions managers,
+            # leads and seniors the role reports to or works with
+            if match.start() < job_text.description_start and fields['seniority'] is None:
+                fields['seniority'] = _seniority_levels[match.group('seniority')]
+
+        else:
+            kind = _contract_types[match.group('contract')]
+            if _contract_rank[kind] < contract_rank:
+                contract_rank = _contract_rank[kind]
+                fields['contract_type'] = kind
+
+    return fields
+
+
+def get_job_fields(job):
+    """Structured fields of a job, extracted on first use and stored in job['fields']"""
+    fields = job.get('fields')
+    if fields is None:
+        fields = extract_fields(get_job_text(job))
+        job['fields'] = fields
+    return fields
+
+
+def annual_salary(fields):
+    """Upper salary figure converted to a yearly amount, or None"""
+    if fields.get('salary_max') is None:
+        return None
+    return fields['salary_max'] * ANNUAL_FACTORS.get(fields.get('salary_period'), 1)
+
+
+def format_salary(fields):
+    """Stated salary as "40000-50000 EUR" (with "/mes" or "/hora" when not yearly), or None"""
+    if fields.get('salary_min') is None:
+        return None
+    amount = str(fields['salary_min'])
+    if fields['salary_max'] != fields['salary_min']:
+        amount += f"-{fields['salary_max']}"
+    suffix = {'month': '/mes', 'hour': '/hora'}.get(fields.get('salary_period'), '')
+    return f"{amount} {fields['salary_currency']}{suffix}"
+
+
+def format_experience(fields):
+    """Stated experience as "3-5 años de experiencia" or "3+ años de experiencia", or None"""
+    if fields.get('experience_min') is None:
+        return None
+    if fields.get('experience_max') is not None:
+        return f"{fields['experience_min']}-{fields['experience_max']} años de experiencia"
+    return f"{fields['experience_min']}+ años de experiencia"
+
+
+def passes_filters(fields, filters):
+    """Check a job's fields against the config.json 'filters' section
+
+    Jobs whose postings do not state a field are kept.
+    """
+    seniority = filters.get('seniority') or []
+    if seniority and fields.get('seniority') and fields['seniority'] not in seniority:
+        return False
+
+    contract_types = filters.get('contract_types') or []
+    if contract_types and fields.get('contract_type') and fields['contract_type'] not in contract_types:
+        return False
+
+    min_salary = filters.get('min_salary')
+    salary = annual_salary(fields)
+    if min_salary and salary is not None and salary < min_salary:
+        return False
+
+    max_experience = filters.get('max_experience_years')
+    if max_experience is not None and fields.get('experience_min') is not None \
+            and fields['experience_min'] > max_experience:
+        return False
+    return True
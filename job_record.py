@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compact job records for the Job Automation System
+A Job keeps its fields in __slots__ instead of a per-job dict: repeated
+strings (source, location, company) are interned, the posting date is parsed
+once and matched skills are stored as small integer IDs. The normalized
+text is kept on the job but never copied or serialized with it. Jobs still
+behave like the job dicts the rest of the pipeline expects
+"""
+
+import sys
+import threading
+from collections.abc import MutableMapping
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+
+# Keys of the dict view backed by slots; anything else goes to a small extras dict
+JOB_FIELDS = ('title', 'company', 'location', 'url', 'description', 'posted_date', 'source')
+OPTIONAL_FIELDS = ('job_id', 'score', 'skills', 'fields')
+FIELD_ALIASES = {'compatibility_override': 'score'}
+
+SKILL_NAMES = []
+_skill_ids = {}
+_skill_lock = threading.Lock()
+
+
+def skill_id(name):
+    """Small integer ID of a skill name, assigned on first use"""
+    with _skill_lock:
+        if name not in _skill_ids:
+            _skill_ids[name] = len(SKILL_NAMES)
+            SKILL_NAMES.append(name)
+        return _skill_ids[name]
+
+
+def intern_text(value):
+    """Intern strings that repeat across many jobs so they are stored once"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def parse_posted_date(value):
+    """Parse an ISO 8601 or RFC 822 (RSS) date; returns None if it cannot"""
+    if isinstance(value, datetime) or not value:
+        return value or None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class Job(MutableMapping):
+    """Slotted job record with a dict-compatible view"""
+
+    __slots__ = ('title', 'company', 'location', 'url', 'description', 'posted_at', 'source',
+                 'job_id', 'score', 'skill_ids', 'fields', '_posted_date', '_extra', '_text')
+
+    def __init__(self, title='', company='', location='', url='', description='', posted_date=None,
+                 source='', job_id=None, score=None, skills=None):
+        self.title = title
+        self.company = intern_text(company)
+        self.location = intern_text(location)
+        self.url = url
+        self.description = description
+        self.source = intern_text(source)
+        self.job_id = job_id
+        self.score = score
+        self.skill_ids = None
+        self.fields = None
+        self._extra = None
+        self._text = None
+        self.posted_date = posted_date
+        if skills is not None:
+            self.skills = skills
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a Job from a job dict; unknown keys are kept as extras"""
+        job = cls()
+        for key, value in data.items():
+            job[key] = value
+        return job
+
+    @property
+    def posted_date(self):
+        """Posting date as the source gave it; the parsed date is in posted_at"""
+        return '' if self._posted_date is None else self._posted_date
+
+    @posted_date.setter
+    def posted_date(self, value):
+        self._posted_date = value
+        self.posted_at = parse_posted_date(value)
+
+    @property
+    def skills(self):
+        """Names of the matched skills"""
+        return None if self.skill_ids is None else [SKILL_NAMES[i] for i in self.skill_ids]
+
+    @skills.setter
+    def skills(self, names):
+        self.skill_ids = None if names is None else tuple(skill_id(name) for name in names)
+
+    def normalized_text(self, normalize):
+        """normalize(title, description), computed once while the title and description stay the same"""
+        cached = self._text
+        if cached is None or cached[0] is not self.title or cached[1] is not self.description:
+            cached = self._text = (self.title, self.description,
+                                   normalize(self.title or '', self.description or ''))
+        return cached[2]
+
+    def __getstate__(self):
+        return None, {name: getattr(self, name) for name in self.__slots__ if name != '_text'}
+
+    def __setstate__(self, state):
+        self._text = None
+        for name, value in state[1].items():
+            object.__setattr__(self, name, value)
+
+    def _set_extra(self, key, value):
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+
+    def __getitem__(self, key):
+        key = FIELD_ALIASES.get(key, key)
+        if key in JOB_FIELDS:
+            return getattr(self, key)
+        if key in OPTIONAL_FIELDS:
+            value = getattr(self, key)
+            if value is None:
+                raise KeyError(key)
+            return value
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        key = FIELD_ALIASES.get(key, key)
+        if key in ('company', 'location', 'source'):
+            value = intern_text(value)
+        if key in JOB_FIELDS or key in OPTIONAL_FIELDS:
+            setattr(self, key, value)
+        else:
+            self._set_extra(key, value)
+
+    def __delitem__(self, key):
+        key = FIELD_ALIASES.get(key, key)
+        if key in JOB_FIELDS:
+            raise KeyError(f"{key} is a required job field")
+        if key in OPTIONAL_FIELDS:
+            if getattr(self, key) is None:
+                raise KeyError(key)
+            setattr(self, key, None)
+        elif self._extra and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        yield from JOB_FIELDS
+        for key in OPTIONAL_FIELDS:
+            if getattr(self, key) is not None:
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"Job({dict(self)!r})"
+
+    def to_dict(self):
+        """Plain dict copy of the job"""
+        return dict(self)
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pluggable job-source adapters for the Job Automation System
+Every adapter is a lazy generator of normalized job dicts; the registry runs
+them side by side and streams jobs to the caller as soon as any adapter yields
+"""
+
+import logging
+import os
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from http_client import get_default_client
+from job_record import Job
+
+logger = logging.getLogger(__name__)
+
+ADAPTER_TYPES = {}
+
+# Candidate field names used to normalize job-board API responses
+DEFAULT_API_FIELDS = {
+    "title": ["title", "jobtitle", "name"],
+    "company": ["company", "author.name", "companyName"],
+    "location": ["city", "location", "formattedLocation"],
+    "url": ["link", "url"],
+    "description": ["description", "snippet", "requirementMin"],
+    "posted_date": ["published", "date", "postedDate"],
+}
+
+
+def register_adapter(source_type):
+    """Class decorator that makes an adapter available to config.json sources"""
+    def decorator(cls):
+        cls.source_type = source_type
+        ADAPTER_TYPES[source_type] = cls
+        return cls
+    return decorator
+
+
+def make_job(title, company, location, url, description, posted_date, source):
+    """Build a job record with the normalized field set used by the pipeline"""
+    return Job(title, company, location, url, description, posted_date, source)
+
+
+class SourceAdapter:
+    """Base class for job sources"""
+
+    source_type = None
+
+    def __init__(self, name):
+        self.name = name
+        self.error_count = 0
+
+    def iter_jobs(self):
+        """Yield normalized jobs one at a time"""
+        raise NotImplementedError
+
+
+@register_adapter('rss')
+class RssFeedAdapter(SourceAdapter):
+    """RSS/Atom job feeds fetched through the automation system's feed layer"""
+
+    def __init__(self, name, automation, feeds, max_entries=5):
+        super().__init__(name)
+        self.automation = automation
+        self.feeds = list(feeds)
+        self.max_entries = max_entries
+
+    @classmethod
+    def from_config(cls, source_config, automation):
+        return cls(source_config['name'], automation, source_config['feeds'],
+                   source_config.get('max_entries', 5))
+
+    def iter_jobs(self):
+        for feed_url, entries, error in self.automation.iter_feeds(self.feeds, self.max_entries):
+            try:
+                if error is not None:
+                    raise error
+
+                # The feed layer already stopped parsing at max_entries relevant entries
+                for entry in entries:
+                    yield self.automation.build_job_from_entry(entry, feed_url)
+
+            except Exception as e:
+                self.error_count += 1
+                logger.warning(f"Error parsing feed {feed_url}: {e}")
+
+
+@register_adapter('static')
+class StaticJobsAdapter(SourceAdapter):
+    """Fixed list of jobs, used for samples and demos"""
+
+    def __init__(self, name, jobs):
+        super().__init__(name)
+        self.jobs = jobs
+
+    @classmethod
+    def from_config(cls, source_config, automation):
+        return cls(source_config['name'], source_config.get('jobs', []))
+
+    def iter_jobs(self):
+        for job in self.jobs:
+            yield Job.from_dict(job)
+
+
+@register_adapter('json_api')
+class JsonApiAdapter(SourceAdapter):
+    """Job-board REST API returning a JSON list of offers
+
+    The adapter is skipped when its API key environment variable is not set.
+    Requests go through the automation system's shared HttpClient.
+    """
+
+    def __init__(self, name, url, api_key_env=None, auth='bearer', params=None,
+                 items_field='items', fields=None, timeout=None, http=None):
+        super().__init__(name)
+        self.url = url
+        self.api_key_env = api_key_env
+        self.auth = auth
+        self.params = params or {}
+        self.items_field = items_field
+        self.fields = fields or DEFAULT_API_FIELDS
+        self.timeout = timeout
+        self.http = http or get_default_client()
+
+    @classmethod
+    def from_config(cls, source_config, automation):
+        return cls(
+            source_config['name'],
+            source_config['url'],
+            api_key_env=source_config.get('api_key_env'),
+            auth=source_config.get('auth', 'bearer'),
+            params=source_config.get('params'),
+            items_field=source_config.get('items_field', 'items'),
+            fields=source_config.get('fields'),
+            timeout=source_config.get('timeout'),
+            http=getattr(automation, 'http', None),
+        )
+
+    def _lookup(self, item, candidates):
+        """Return the first candidate field present in an API item"""
+        for candidate in candidates:
+            value = item
+            for part in candidate.split('.'):
+                value = value.get(part) if isinstance(value, dict) else None
+            if value:
+                return value
+        return None
+
+    def _request_options(self, api_key):
+        """Build request headers, params and auth for the configured scheme"""
+        headers = {'Accept': 'application/json'}
+        params = dict(self.params)
+        auth = None
+
+        if self.auth == 'bearer':
+            headers['Authorization'] = f"Bearer {api_key}"
+        elif self.auth == 'basic':
+            auth = tuple(api_key.split(':', 1))
+        else:
+            params[self.auth] = api_key
+
+        return headers, params, auth
+
+    def iter_jobs(self):
+        api_key = os.getenv(self.api_key_env) if self.api_key_env else None
+        if self.api_key_env and (not api_key or api_key.startswith('your_')):
+            logger.info(f"Skipping {self.name}: {self.api_key_env} not configured")
+            return
+
+        headers, params, auth = self._request_options(api_key)
+        redact_params = () if self.auth in ('bearer', 'basic') else (self.auth,)
+        response = self.http.get(self.url, headers=headers, params=params, auth=auth, timeout=self.timeout,
+                                 redact_params=redact_params)
+        response.raise_for_status()
+
+        for item in response.json().get(self.items_field, []):
+            title = self._lookup(item, self.fields['title'])
+            url = self._lookup(item, self.fields['url'])
+            if not title or not url:
+                continue
+
+            yield make_job(
+                title,
+                self._lookup(item, self.fields['company']) or 'Unknown Company',
+                self._lookup(item, self.fields['location']) or 'Remote',
+                url,
+                self._lookup(item, self.fields['description']) or 'No description available',
+                self._lookup(item, self.fields['posted_date']) or '',
+                self.url
+            )
+
+
+def job_board_sources(config):
+    """Build json_api source configs for the URLs in apis.job_boards
+
+    The API key variable is derived from the board's domain, e.g.
+    api.infojobs.net -> INFOJOBS_API_KEY as declared in .env.template.
+    """
+    sources = []
+    for url in config.get('apis', {}).get('job_boards', []):
+        host_parts = urlparse(url).netloc.split('.')
+        board = host_parts[-2] if len(host_parts) >= 2 else host_parts[0]
+        sources.append({
+            "name": f"{board}_api",
+            "type": "json_api",
+            "url": url,
+            "api_key_env": f"{board.upper()}_API_KEY"
+        })
+    return sources
+
+
+class SourceRegistry:
+    """Runs job-source adapters and streams their jobs"""
+
+    def __init__(self, adapters, max_workers=4):
+        self.adapters = list(adapters)
+        self.max_workers = max(1, int(max_workers))
+        self.stats = {}
+
+    @classmethod
+    def from_config(cls, source_configs, automation, max_workers=4):
+        """Create adapters from a list of source configs (see config.json 'sources')"""
+        adapters = []
+        for source_config in source_configs:
+            if not source_config.get('enabled', True):
+                continue
+
+            adapter_class = ADAPTER_TYPES.get(source_config.get('type'))
+            if adapter_class is None:
+                logger.warning(f"Unknown job source type: {source_config.get('type')}")
+                continue
+
+            adapters.append(adapter_class.from_config(source_config, automation))
+
+        return cls(adapters, max_workers=max_workers)
+
+    def _run_adapter(self, adapter):
+        """Iterate one adapter, recording latency, yield and error counts"""
+        stats = {'jobs': 0, 'errors': 0, 'first_job_seconds': None, 'total_seconds': 0.0}
+        self.stats[adapter.name] = stats
+        adapter.error_count = 0
+        start = time.perf_counter()
+
+        try:
+            for job in adapter.iter_jobs():
+                if stats['first_job_seconds'] is None:
+                    stats['first_job_seconds'] = time.perf_counter() - start
+                stats['jobs'] += 1
+                yield job
+        except Exception as e:
+            adapter.error_count += 1
+            logger.warning(f"Error in job source {adapter.name}: {e}")
+        finally:
+            stats['errors'] = adapter.error_count
+            stats['total_seconds'] = time.perf_counter() - start
+
+    def stream(self, concurrent=True):
+        """Yield (position, job) pairs as soon as any adapter produces a job
+
+        position is (adapter_index, job_index) and lets callers restore the
+        configured source order once every adapter has finished.
+        """
+        self.stats = {}
+
+        if not concurrent or len(self.adapters) <= 1:
+            for index, adapter in enumerate(self.adapters):
+                for job_index, job in enumerate(self._run_adapter(adapter)):
+                    yield (index, job_index), job
+            return
+
+        results = queue.Queue()
+        finished = object()
+
+        def drain(index, adapter):
+            try:
+                for job_index, job in enumerate(self._run_adapter(adapter)):
+                    results.put(((index, job_index), job))
+            finally:
+                results.put(finished)
+
+        workers = min(self.max_workers, len(self.adapters))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='source') as executor:
+            for index, adapter in enumerate(self.adapters):
+                executor.submit(drain, index, adapter)
+
+            remaining = len(self.adapters)
+            while remaining:
+                item = results.get()
+                if item is finished:
+                    remaining -= 1
+                    continue
+                yield item
+
+    def summary_lines(self):
+        """Per-adapter latency, yield and error counts for the run log"""
+        lines = []
+        for name, stats in self.stats.items():
+            first = stats['first_job_seconds']
+            first_text = f"{first:.2f}s" if first is not None else "n/a"
+            lines.append(
+                f"Source {name}: {stats['jobs']} jobs, {stats['errors']} errors, "
+                f"first job after {first_text}, total {stats['total_seconds']:.2f}s"
+            )
+        return lines
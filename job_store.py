@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Persistent job store for the Job Automation System
+Keeps every job seen across scheduled runs in SQLite so each run can process
+only the offers it has not handled before
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+from datetime import datetime
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    url TEXT,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    source TEXT,
+    posted_date TEXT,
+    description TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    seen_count INTEGER NOT NULL DEFAULT 1,
+    score INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_first_seen ON jobs (first_seen);
+CREATE TABLE IF NOT EXISTS artifacts (
+    job_id TEXT NOT NULL REFERENCES jobs (job_id),
+    kind TEXT NOT NULL,
+    path TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (job_id, kind, path)
+);
+CREATE TABLE IF NOT EXISTS signatures (
+    job_id TEXT PRIMARY KEY REFERENCES jobs (job_id),
+    signature BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS lsh_buckets (
+    bucket TEXT NOT NULL,
+    job_id TEXT NOT NULL REFERENCES jobs (job_id)
+);
+CREATE INDEX IF NOT EXISTS idx_lsh_buckets_bucket ON lsh_buckets (bucket);
+CREATE INDEX IF NOT EXISTS idx_lsh_buckets_job ON lsh_buckets (job_id);
+CREATE TABLE IF NOT EXISTS feed_yields (
+    feed_url TEXT PRIMARY KEY,
+    runs REAL NOT NULL DEFAULT 0,
+    requested REAL NOT NULL DEFAULT 0,
+    relevant REAL NOT NULL DEFAULT 0,
+    new_jobs REAL NOT NULL DEFAULT 0,
+    fetch_seconds REAL NOT NULL DEFAULT 0,
+    last_run TEXT
+);
+CREATE TABLE IF NOT EXISTS score_cache (
+    content_hash TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    PRIMARY KEY (content_hash, fingerprint)
+);
+CREATE TABLE IF NOT EXISTS skill_bitmaps (
+    skill TEXT PRIMARY KEY,
+    bitmap BLOB NOT NULL,
+    indexed_rowid INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_analysis (
+    job_id TEXT PRIMARY KEY REFERENCES jobs (job_id),
+    score INTEGER,
+    skills TEXT,
+    experience TEXT,
+    fingerprint TEXT,
+    analyzed_at TEXT
+);
+CREATE TABLE IF NOT EXISTS term_stats (
+    term TEXT PRIMARY KEY,
+    doc_freq INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS corpus_stats (
+    name TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+"""
+
+FEED_YIELD_COLUMNS = ['runs', 'requested', 'relevant', 'new_jobs', 'fetch_seconds']
+
+JOB_COLUMNS = ['url', 'title', 'company', 'location', 'source', 'posted_date', 'description']
+
+
+def compute_job_id(job):
+    """Stable job ID derived from the offer URL
+
+    Scheme, query string, fragment, case and trailing slashes are ignored so
+    tracking parameters do not make a known offer look new. Jobs without a URL
+    fall back to their title and company.
+    """
+    url = (job.get('url') or '').strip()
+    if url:
+        parts = urlsplit(url)
+        key = f"{parts.netloc.lower()}{parts.path.rstrip('/').lower()}"
+    else:
+        key = f"{job.get('title', '')}|{job.get('company', '')}".lower()
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+class JobStore:
+    """SQLite-backed history of every job seen by the automation"""
+
+    def __init__(self, db_path='job_store.db'):
+        """Open (and create if needed) the job store"""
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+    def record_seen(self, job, seen_at=None):
+        """Insert or refresh a job; returns True the first time it is seen"""
+        return bool(self.record_seen_many([job], seen_at))
+
+    def record_seen_many(self, jobs, seen_at=None):
+        """Insert or refresh several jobs in one transaction
+
+        Sets job['job_id'] on every job and returns the jobs seen for the first time.
+        """
+        seen_at = seen_at or datetime.now().isoformat(timespec='seconds')
+        new_jobs = []
+
+        with self.conn:
+            for job in jobs:
+                job_id = job.setdefault('job_id', compute_job_id(job))
+                updated = self.conn.execute(
+                    "UPDATE jobs SET last_seen = ?, seen_count = seen_count + 1 WHERE job_id = ?",
+                    (seen_at, job_id)
+                ).rowcount
+
+                if not updated:
+                    self.conn.execute(
+                        f"INSERT INTO jobs (job_id, {', '.join(JOB_COLUMNS)}, first_seen, last_seen) "
+                        f"VALUES (?, {', '.join('?' for _ in JOB_COLUMNS)}, ?, ?)",
+                        (job_id, *[job.get(column) for column in JOB_COLUMNS], seen_at, seen_at)
+                    )
+                    new_jobs.append(job)
+
+        return new_jobs
+
+    def record_score(self, job_id, score):
+        """Store the compatibility score of a job"""
+        with self.conn:
+            self.conn.execute("UPDATE jobs SET score = ? WHERE job_id = ?", (score, job_id))
+
+    def record_artifact(self, job_id, kind, path):
+        """Remember a generated document (cv, cover_letter, ...) for a job"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO artifacts (job_id, kind, path, created_at) VALUES (?, ?, ?, ?)",
+                (job_id, kind, path, datetime.now().isoformat(timespec='seconds'))
+            )
+
+    def has_artifacts(self, job_id):
+        """Whether documents were already generated for a job"""
+        row = self.conn.execute("SELECT 1 FROM artifacts WHERE job_id = ? LIMIT 1", (job_id,)).fetchone()
+        return row is not None
+
+    def get_artifacts(self, job_id):
+        """List the (kind, path) documents generated for a job"""
+        rows = self.conn.execute(
+            "SELECT kind, path FROM artifacts WHERE job_id = ? ORDER BY created_at", (job_id,)
+        ).fetchall()
+        return [(row['kind'], row['path']) for row in rows]
+
+    def add_signature(self, job_id, signature, band_keys):
+        """Store a near-duplicate signature and its LSH bucket keys"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO signatures (job_id, signature) VALUES (?, ?)", (job_id, signature)
+            )
+            self.conn.execute("DELETE FROM lsh_buckets WHERE job_id = ?", (job_id,))
+            self.conn.executemany(
+                "INSERT INTO lsh_buckets (bucket, job_id) VALUES (?, ?)",
+                [(band_key, job_id) for band_key in band_keys]
+            )
+
+    def find_signature_candidates(self, band_keys):
+        """(job_id, signature) of stored jobs sharing at least one LSH bucket"""
+        placeholders = ', '.join('?' for _ in band_keys)
+        return self.conn.execute(
+            "SELECT DISTINCT s.job_id, s.signature FROM lsh_buckets b "
+            f"JOIN signatures s ON s.job_id = b.job_id WHERE b.bucket IN ({placeholders})",
+            list(band_keys)
+        ).fetchall()
+
+    def get_feed_yields(self):
+        """Return {feed_url: yield totals} recorded by the fetch planner"""
+        rows = self.conn.execute("SELECT * FROM feed_yields").fetchall()
+        return {row['feed_url']: dict(row) for row in rows}
+
+    def save_feed_yields(self, yields, run_at=None):
+        """Replace the yield totals of the given feeds ({feed_url: totals})"""
+        run_at = run_at or datetime.now().isoformat(timespec='seconds')
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO feed_yields (feed_url, {', '.join(FEED_YIELD_COLUMNS)}, last_run) "
+                f"VALUES (?, {', '.join('?' for _ in FEED_YIELD_COLUMNS)}, ?)",
+                [(feed_url, *[totals.get(column, 0) for column in FEED_YIELD_COLUMNS], run_at)
+                 for feed_url, totals in yields.items()]
+            )
+
+    def get_cached_scores(self, fingerprint):
+        """Return {content_hash: score} memoized for a scorer fingerprint"""
+        rows = self.conn.execute(
+            "SELECT content_hash, score FROM score_cache WHERE fingerprint = ?", (fingerprint,)
+        ).fetchall()
+        return {row['content_hash']: row['score'] for row in rows}
+
+    def save_cached_scores(self, fingerprint, scores):
+        """Memoize scores ({content_hash: score}) for a scorer fingerprint"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO score_cache (content_hash, fingerprint, score) VALUES (?, ?, ?)",
+                [(content_hash, fingerprint, score) for content_hash, score in scores.items()]
+            )
+
+    def get_skill_bitmaps(self):
+        """Return {skill: (compressed bitmap, indexed_rowid)} saved by the skill index"""
+        rows = self.conn.execute("SELECT skill, bitmap, indexed_rowid FROM skill_bitmaps").fetchall()
+        return {row['skill']: (row['bitmap'], row['indexed_rowid']) for row in rows}
+
+    def save_skill_bitmaps(self, bitmaps):
+        """Replace the skill index bitmaps ({skill: (compressed bitmap, indexed_rowid)})"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO skill_bitmaps (skill, bitmap, indexed_rowid) VALUES (?, ?, ?)",
+                [(skill, data, indexed_rowid) for skill, (data, indexed_rowid) in bitmaps.items()]
+            )
+
+    def save_job_analysis(self, results, fingerprint=None, analyzed_at=None):
+        """Store scores, skills and experience of many jobs in one transaction
+
+        results holds (job_id, score, skills, experience) tuples; the score
+        also replaces jobs.score.
+        """
+        analyzed_at = analyzed_at or datetime.now().isoformat(timespec='seconds')
+        with self.conn:
+            self.conn.executemany("UPDATE jobs SET score = ? WHERE job_id = ?",
+                                  [(score, job_id) for job_id, score, _, _ in results])
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO job_analysis (job_id, score, skills, experience, fingerprint, analyzed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(job_id, score, json.dumps(skills, ensure_ascii=False), experience, fingerprint, analyzed_at)
+                 for job_id, score, skills, experience in results]
+            )
+
+    def get_job_analysis(self, job_id):
+        """Return the stored analysis of a job as a dict, or None"""
+        row = self.conn.execute("SELECT * FROM job_analysis WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        analysis = dict(row)
+        analysis['skills'] = json.loads(analysis['skills'])
+        return analysis
+
+    def get_corpus_stats(self):
+        """Return the BM25 corpus totals ({name: value})"""
+        return {row['name']: row['value'] for row in self.conn.execute("SELECT name, value FROM corpus_stats")}
+
+    def get_term_doc_freqs(self, terms, batch_size=500):
+        """Return {term: document frequency} for the given terms"""
+        terms = list(terms)
+        doc_freqs = {}
+        for i in range(0, len(terms), batch_size):
+            batch = terms[i:i + batch_size]
+            doc_freqs.update((row['term'], row['doc_freq']) for row in self.conn.execute(
+                f"SELECT term, doc_freq FROM term_stats WHERE term IN ({', '.join('?' for _ in batch)})", batch
+            ))
+        return doc_freqs
+
+    def save_term_stats(self, increments, corpus_stats):
+        """Add document frequency increments ({term: count}) and replace the corpus totals"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO term_stats (term, doc_freq) VALUES (?, ?) "
+                "ON CONFLICT (term) DO UPDATE SET doc_freq = doc_freq + excluded.doc_freq",
+                increments.items()
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO corpus_stats (name, value) VALUES (?, ?)",
+                corpus_stats.items()
+            )
+
+    def prune_term_stats(self, terms):
+        """Delete the document frequencies of every term not in `terms`; returns how many were deleted"""
+        terms = list(terms)
+        with self.conn:
+            return self.conn.execute(
+                f"DELETE FROM term_stats WHERE term NOT IN ({', '.join('?' for _ in terms)})", terms
+            ).rowcount
+
+    def iter_job_rows(self, after_rowid=0, limit=-1):
+        """Iterate (rowid, job) for jobs stored after a row ID, in insertion order"""
+        cursor = self.conn.execute("SELECT rowid AS row_id, * FROM jobs WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                                   (after_rowid, limit))
+        for row in cursor:
+            job = dict(row)
+            yield job.pop('row_id'), job
+
+    def first_rowid_since(self, since):
+        """Row ID of the first job first seen at or after `since`, or None"""
+        return self.conn.execute("SELECT MIN(rowid) FROM jobs WHERE first_seen >= ?", (since,)).fetchone()[0]
+
+    def get_jobs_by_rowid(self, rowids, batch_size=500):
+        """Return the stored jobs with the given row IDs, in row ID order"""
+        jobs = []
+        rowids = sorted(rowids)
+        for i in range(0, len(rowids), batch_size):
+            batch = rowids[i:i + batch_size]
+            jobs += [dict(row) for row in self.conn.execute(
+                f"SELECT * FROM jobs WHERE rowid IN ({', '.join('?' for _ in batch)}) ORDER BY rowid", batch
+            )]
+        return jobs
+
+    def get_job(self, job_id):
+        """Return a stored job as a dict, or None"""
+        row = self.conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def iter_jobs(self, since=None):
+        """Iterate stored jobs, optionally only those first seen after `since`"""
+        if since:
+            cursor = self.conn.execute("SELECT * FROM jobs WHERE first_seen >= ? ORDER BY first_seen", (since,))
+        else:
+            cursor = self.conn.execute("SELECT * FROM jobs ORDER BY first_seen")
+        for row in cursor:
+            yield dict(row)
+
+    def count(self):
+        """Number of jobs in the store"""
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def summary(self):
+        """Short description of the store for the run log"""
+        artifacts = self.conn.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0]
+        return f"Job store: {self.count()} jobs, {artifacts} generated documents"
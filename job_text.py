@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Normalized job text for the Job Automation System
+A job's title and description are lowercased, accent-folded ("análisis"
+matches "analisis"), whitespace-collapsed and tokenized once; the result is
+kept on the Job, or for plain dicts cached by content hash, and shared by
+every analysis method
+"""
+
+import hashlib
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from functools import lru_cache
+
+from job_record import Job
+
+TOKEN_RE = re.compile(r"\w+")
+COMBINING_RE = re.compile("[\u0300-\u036f]")
+
+
+def strip_accents(text):
+    """Remove combining accents ("año" -> "ano"); ASCII text is returned as is"""
+    if text.isascii():
+        return text
+    return COMBINING_RE.sub('', unicodedata.normalize('NFKD', text))
+
+
+def fold_text(text):
+    """Lowercase, strip accents and collapse runs of whitespace"""
+    return ' '.join(strip_accents(text.lower()).split())
+
+
+@lru_cache(maxsize=65536)
+def fold_keyword(keyword):
+    """Lowercase and strip accents of a keyword, keeping edge spaces ('r ')"""
+    return strip_accents(keyword.lower())
+
+
+def content_hash(title, description):
+    """Hash identifying a job's text, independent of its URL or source"""
+    return hashlib.blake2b(f"{title}\0{description}".encode('utf-8'), digest_size=16).hexdigest()
+
+
+class JobText:
+    """Normalized forms of a job's title and description"""
+
+    __slots__ = ('content_hash', 'title', 'description', 'text', 'description_start', '_tokens')
+
+    def __init__(self, title, description, key=None):
+        self.content_hash = key or content_hash(title, description)
+        self.title = fold_text(title)
+        self.description = fold_text(description)
+        self.text = f"{self.title} {self.description}"
+        self.description_start = len(self.title) + 1
+        self._tokens = None
+
+    @property
+    def tokens(self):
+        """Word tokens of the title and description, computed on first use"""
+        if self._tokens is None:
+            self._tokens = tuple(TOKEN_RE.findall(self.text))
+        return self._tokens
+
+
+class JobTextCache:
+    """Thread-safe LRU of JobText objects keyed by content hash"""
+
+    def __init__(self, max_size=4096):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, job):
+        """JobText of a job dict, normalized on the first request only"""
+        return self.get_text(job.get('title') or '', job.get('description') or '')
+
+    def get_text(self, title, description):
+        """JobText of a title and description, e.g. from DataFrame columns"""
+        key = content_hash(title, description)
+
+        with self._lock:
+            job_text = self._entries.get(key)
+            if job_text is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return job_text
+            self.misses += 1
+
+        job_text = JobText(title, description, key)
+        with self._lock:
+            self._entries[key] = job_text
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return job_text
+
+
+_shared_cache = JobTextCache()
+
+
+def get_job_text(job):
+    """Normalized text of a job, kept on a Job or from the process-wide cache for dicts"""
+    if isinstance(job, Job):
+        return job.normalized_text(JobText)
+    return _shared_cache.get(job)
+
+
+def normalize_job_text(title, description):
+    """Normalized text of a title and description from the process-wide cache"""
+    return _shared_cache.get_text(title or '', description or '')
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Single-pass multi-keyword matching for the Job Automation System
+All keyword lists (config.json and the scoring/CV helpers) are compiled into
+one Aho-Corasick automaton, so a job's text is scanned once and every
+consumer reads from the same match set. Jobs are matched on their normalized
+text (see job_text), so accents and case do not matter
+"""
+
+import threading
+from collections import OrderedDict, deque
+
+from job_text import fold_keyword, get_job_text
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton finding every occurrence of a set of keywords
+
+    Matching is plain substring matching, like `keyword in text`, including
+    overlapping keywords ("data" inside "data analyst").
+    """
+
+    def __init__(self, keywords):
+        self.keywords = list(dict.fromkeys(keyword for keyword in keywords if keyword))
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                state = next_state
+            self._output[state] += (index,)
+
+        # Breadth-first failure links; each state also reports its suffixes' keywords
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def iter_matches(self, text):
+        """Yield (start, keyword) for every keyword occurrence in text"""
+        goto, fail, output, keywords = self._goto, self._fail, self._output, self.keywords
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                yield position - len(keywords[index]) + 1, keywords[index]
+
+
+class JobMatches:
+    """Keywords found in a job's title and description
+
+    Queries are folded like the job text, so 'Año' and 'ano' are the same
+    keyword.
+    """
+
+    __slots__ = ('found', 'in_description_found')
+
+    def __init__(self, found, in_description_found):
+        self.found = found
+        self.in_description_found = in_description_found
+
+    def __contains__(self, keyword):
+        return fold_keyword(keyword) in self.found
+
+    def any(self, keywords):
+        """Whether any of the keywords occurs"""
+        return any(fold_keyword(keyword) in self.found for keyword in keywords)
+
+    def count(self, keywords):
+        """Number of entries of `keywords` that occur (duplicates count twice)"""
+        return sum(1 for keyword in keywords if fold_keyword(keyword) in self.found)
+
+    def in_description(self, keyword):
+        """Whether the keyword occurs within the description alone"""
+        return fold_keyword(keyword) in self.in_description_found
+
+
+class KeywordIndex:
+    """Shared keyword matcher with a small cache of match sets by content hash"""
+
+    def __init__(self, *keyword_lists, cache_size=2048):
+        keywords = [fold_keyword(keyword) for keyword_list in keyword_lists for keyword in keyword_list]
+        self.matcher = KeywordMatcher(keywords)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def match(self, job_text):
+        """Match set of a job_text.JobText, scanned once"""
+        key = job_text.content_hash
+        with self._lock:
+            matches = self._cache.get(key)
+            if matches is not None:
+                self._cache.move_to_end(key)
+                return matches
+
+        found = set()
+        in_description_found = set()
+        for start, keyword in self.matcher.iter_matches(job_text.text):
+            found.add(keyword)
+            if start >= job_text.description_start:
+                in_description_found.add(keyword)
+        matches = JobMatches(frozenset(found), frozenset(in_description_found))
+
+        with self._lock:
+            self._cache[key] = matches
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return matches
+
+    def match_job(self, job):
+        return self.match(get_job_text(job))
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Local stand-in feed server for benchmarks and tests
+Serves deterministic InfoJobs-style RSS feeds with a simulated latency,
+optional ETag revalidation, gzip, HTTP/1.1 keep-alive and injected 503s
+"""
+
+import gzip
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from xml.sax.saxutils import escape
+
+SAMPLE_TITLES = [
+    "Data Analyst - Business Intelligence",
+    "Senior BI Developer Power BI",
+    "Big Data Engineer Spark",
+    "Python Developer - Analytics",
+    "Analista de Datos SQL",
+    "Data Scientist Machine Learning",
+    "Administrativo de oficina",
+    "Tableau Reporting Specialist",
+]
+
+
+def build_rss_feed(slug, items_per_feed=10):
+    """Build a deterministic RSS document for a feed slug"""
+    items = []
+    for i in range(items_per_feed):
+        title = SAMPLE_TITLES[i % len(SAMPLE_TITLES)]
+        items.append(
+            "<item>"
+            f"<title>{escape(title)} ({slug} #{i})</title>"
+            f"<link>https://jobs.example.com/{slug}/offer-{i}</link>"
+            f"<author>Company {i % 4}</author>"
+            f"<description>{escape(f'<p>{title} en Madrid. Experiencia en python, sql y dashboards.</p>')}</description>"
+            "<pubDate>Mon, 06 Jan 2025 09:00:00 GMT</pubDate>"
+            "</item>"
+        )
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0"><channel>'
+        f"<title>{escape(slug)}</title>"
+        "<link>https://jobs.example.com/</link>"
+        "<description>Stand-in job feed</description>"
+        + "".join(items) +
+        "</channel></rss>"
+    ).encode('utf-8')
+
+
+class _FeedRequestHandler(BaseHTTPRequestHandler):
+    """Serve one RSS feed per path after the configured latency"""
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately; avoid Nagle stalls on kept-alive sockets
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.stats_lock:
+            self.server.connection_count += 1
+        # Stand-in for the TCP/TLS handshake round-trips of a real job board
+        time.sleep(self.server.handshake_latency)
+
+    def do_GET(self):
+        server = self.server
+        with server.stats_lock:
+            server.request_count += 1
+            failures_left = server.failures.get(self.path, server.fail_first)
+            server.failures[self.path] = max(0, failures_left - 1)
+
+        time.sleep(server.latency)
+
+        if failures_left:
+            self.send_response(503)
+            self.send_header('Retry-After', str(server.retry_after))
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        slug = self.path.strip('/').replace('/', '-') or 'feed'
+        body = build_rss_feed(slug, server.items_per_feed)
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+
+        if server.use_etags and self.headers.get('If-None-Match') == etag:
+            with server.stats_lock:
+                server.not_modified_count += 1
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml; charset=utf-8')
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body, compresslevel=5)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        if server.use_etags:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Keep benchmark output quiet"""
+        pass
+
+
+class LocalFeedServer:
+    """Threaded HTTP server on localhost that stands in for a job board"""
+
+    def __init__(self, latency=0.2, items_per_feed=10, use_etags=True, fail_first=0, retry_after=0,
+                 handshake_latency=0):
+        """Initialize the server on a free local port
+
+        handshake_latency is added once per new connection. The first `fail_first`
+        requests to every path are answered with 503 and a Retry-After of
+        `retry_after` seconds.
+        """
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), _FeedRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.latency = latency
+        self.httpd.items_per_feed = items_per_feed
+        self.httpd.use_etags = use_etags
+        self.httpd.request_count = 0
+        self.httpd.not_modified_count = 0
+        self.httpd.connection_count = 0
+        self.httpd.handshake_latency = handshake_latency
+        self.httpd.fail_first = fail_first
+        self.httpd.retry_after = retry_after
+        self.httpd.failures = {}
+        self.httpd.stats_lock = threading.Lock()
+        self.thread = None
+
+    @property
+    def base_url(self):
+        """Base URL of the running server"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self):
+        """Number of requests served so far"""
+        return self.httpd.request_count
+
+    @property
+    def not_modified_count(self):
+        """Number of 304 responses served so far"""
+        return self.httpd.not_modified_count
+
+    @property
+    def connection_count(self):
+        """Number of TCP connections accepted so far"""
+        return self.httpd.connection_count
+
+    def url(self, path):
+        """Build a feed URL for the given path"""
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def start(self):
+        """Start serving in a background thread"""
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop the server"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.stop()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Near-duplicate job detection for the Job Automation System
+The same offer is often cross-posted on several boards under different URLs.
+Jobs are reduced to compact MinHash signatures and looked up through an LSH
+index, so finding candidates does not require comparing against every job.
+"""
+
+import hashlib
+import logging
+import random
+import re
+from array import array
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def optimal_bands(num_perm, threshold):
+    """Pick (bands, rows) so the LSH candidate threshold sits just below `threshold`
+
+    The S-curve midpoint of b bands of r rows is roughly (1/b) ** (1/r); using
+    the largest midpoint not above the similarity threshold keeps recall high.
+    """
+    best = (num_perm, 1)
+    best_midpoint = 0.0
+    for bands in range(1, num_perm + 1):
+        if num_perm % bands:
+            continue
+        rows = num_perm // bands
+        midpoint = (1.0 / bands) ** (1.0 / rows)
+        if best_midpoint < midpoint <= threshold:
+            best, best_midpoint = (bands, rows), midpoint
+    return best
+
+
+def job_signature_text(job):
+    """Text used to fingerprint a job: title, company and description"""
+    return f"{job.get('title', '')} {job.get('company', '')} {job.get('description', '')}"
+
+
+class MinHasher:
+    """Compute MinHash signatures over word shingles"""
+
+    def __init__(self, num_perm=64, shingle_size=3, seed=42):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self.permutations = [
+            (rng.randrange(1, MERSENNE_PRIME), rng.randrange(0, MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def shingles(self, text):
+        """Set of word n-grams of the lowercased text"""
+        tokens = TOKEN_RE.findall(text.lower())
+        k = self.shingle_size
+        if len(tokens) <= k:
+            return {' '.join(tokens)}
+        return {' '.join(tokens[i:i + k]) for i in range(len(tokens) - k + 1)}
+
+    def signature(self, text):
+        """MinHash signature of a text as a tuple of num_perm integers"""
+        hashes = [
+            int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+            for shingle in self.shingles(text)
+        ]
+        return tuple(
+            min(((a * h + b) % MERSENNE_PRIME) & MAX_HASH for h in hashes)
+            for a, b in self.permutations
+        )
+
+
+def estimate_similarity(signature_a, signature_b):
+    """Estimated Jaccard similarity of two signatures"""
+    matches = sum(1 for a, b in zip(signature_a, signature_b) if a == b)
+    return matches / len(signature_a)
+
+
+def signature_to_bytes(signature):
+    return array('I', signature).tobytes()
+
+
+def signature_from_bytes(data):
+    return tuple(array('I', data))
+
+
+class LSHIndex:
+    """In-memory banded LSH index over MinHash signatures"""
+
+    def __init__(self, num_perm=64, threshold=0.7):
+        self.num_perm = num_perm
+        self.threshold = threshold
+        self.bands, self.rows = optimal_bands(num_perm, threshold)
+        self.buckets = defaultdict(list)
+        self.signatures = {}
+
+    def band_keys(self, signature):
+        """One bucket key per band, tagged with the banding layout"""
+        keys = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(signature_to_bytes(chunk), digest_size=8).hexdigest()
+            keys.append(f"{self.num_perm}:{self.rows}:{band}:{digest}")
+        return keys
+
+    def add(self, key, signature, band_keys=None):
+        self.signatures[key] = signature
+        for band_key in band_keys or self.band_keys(signature):
+            self.buckets[band_key].append(key)
+
+    def query(self, signature, band_keys=None):
+        """Return (key, similarity) of the best match above the threshold, or None"""
+        candidates = set()
+        for band_key in band_keys or self.band_keys(signature):
+            candidates.update(self.buckets.get(band_key, ()))
+
+        best = None
+        for key in candidates:
+            similarity = estimate_similarity(signature, self.signatures[key])
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (key, similarity)
+        return best
+
+    def __len__(self):
+        return len(self.signatures)
+
+
+class NearDuplicateDetector:
+    """Collapse near-duplicate jobs within a run and against the job history"""
+
+    def __init__(self, threshold=0.7, num_perm=64, shingle_size=3, job_store=None, use_history=True):
+        self.hasher = MinHasher(num_perm=num_perm, shingle_size=shingle_size)
+        self.batch_index = LSHIndex(num_perm=num_perm, threshold=threshold)
+        self.job_store = job_store
+        self.use_history = use_history and job_store is not None
+        self.duplicates_found = 0
+
+    @classmethod
+    def from_config(cls, config, job_store=None, use_history=True):
+        """Create a detector from the 'near_duplicates' section of config.json"""
+        settings = config.get('near_duplicates', {})
+        if not settings.get('enabled', True):
+            return None
+        return cls(
+            threshold=settings.get('threshold', 0.7),
+            num_perm=settings.get('num_perm', 64),
+            shingle_size=settings.get('shingle_size', 3),
+            job_store=job_store,
+            use_history=use_history,
+        )
+
+    def _query_history(self, job_id, signature, band_keys):
+        """Best matching job in the store, found through its LSH band keys"""
+        best = None
+        for other_id, data in self.job_store.find_signature_candidates(band_keys):
+            if other_id == job_id:
+                continue
+            similarity = estimate_similarity(signature, signature_from_bytes(data))
+            if similarity >= self.batch_index.threshold and (best is None or similarity > best[1]):
+                best = (other_id, similarity)
+        return best
+
+    def find_duplicate(self, job):
+        """Return (job_key, similarity) of an earlier near-duplicate, or None
+
+        Jobs that are not duplicates are added to the index (and the job
+        store) so later jobs can be matched against them.
+        """
+        signature = self.hasher.signature(job_signature_text(job))
+        band_keys = self.batch_index.band_keys(signature)
+        job_key = job.get('job_id') or job['url']
+
+        match = self.batch_index.query(signature, band_keys)
+        if match is None and self.use_history:
+            match = self._query_history(job_key, signature, band_keys)
+
+        if match is not None:
+            self.duplicates_found += 1
+            return match
+
+        self.batch_index.add(job_key, signature, band_keys)
+        if self.job_store is not None and job.get('job_id'):
+            self.job_store.add_signature(job['job_id'], signature_to_bytes(signature), band_keys)
+        return None
+
+    def summary(self):
+        return f"Near-duplicates collapsed: {self.duplicates_found}"
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Direct OOXML writer for the Job Automation System
+A document is built once per run with python-docx, like a DocumentTemplate,
+and its body and header XML are compiled into string templates split at the
+job-dependent paragraphs. Each job then only escapes its fields, joins the
+strings and zips them with parts precompiled from the same document: its
+settings, theme and stylesheet, cut down to the defaults and the styles in
+use, so the output looks the same without python-docx's object model or
+its 800 KB of unused styles
+"""
+
+import logging
+import re
+import zipfile
+from copy import deepcopy
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape
+
+from docx.oxml.ns import qn
+from lxml import etree
+
+from document_templates import PlaceholderFields
+
+logger = logging.getLogger(__name__)
+
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+# The run text of a variable paragraph, as python-docx writes a marker
+MARKER_RE = re.compile(r"<w:t>⟦(\w+)⟧</w:t>")
+
+# Relationship ids referenced from document XML (headers, footers, images, hyperlinks)
+RELATIONSHIP_REF_RE = re.compile(r'r:(?:id|embed|link)="([^"]+)"')
+
+STYLE_REF_RE = re.compile(r'<w:[pr]Style w:val="([^"]+)"/>')
+
+# Characters that cannot appear in XML 1.0
+INVALID_XML_CHARS_RE = re.compile("[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]")
+
+TEXT_START = '<w:t xml:space="preserve">'
+TEXT_END = '</w:t>'
+BREAK = f'{TEXT_END}<w:br/>{TEXT_START}'
+TAB = f'{TEXT_END}<w:tab/>{TEXT_START}'
+
+# Document parts copied as they are from the built document: they set
+# compatibility options and the theme fonts and colors the styles refer to
+COPIED_RELTYPES = (f"{R_NS}/settings", f"{R_NS}/theme")
+
+CONTENT_TYPES_XML = (
+    f'{XML_DECLARATION}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>'
+    '{overrides}</Types>'
+)
+
+PACKAGE_RELS_XML = (
+    f'{XML_DECLARATION}<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Id="rId1" Type="{R_NS}/officeDocument" Target="word/document.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/'
+    'core-properties" Target="docProps/core.xml"/></Relationships>'
+)
+
+DOCUMENT_RELS_XML = (
+    f'{XML_DECLARATION}<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '{relationships}</Relationships>'
+)
+
+CORE_XML = (
+    f'{XML_DECLARATION}<cp:coreProperties '
+    'xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
+    'xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:dcterms="http://purl.org/dc/terms/" '
+    'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+    '<dcterms:created xsi:type="dcterms:W3CDTF">{created}</dcterms:created>'
+    '<dcterms:modified xsi:type="dcterms:W3CDTF">{created}</dcterms:modified></cp:coreProperties>'
+)
+
+
+def run_text(text):
+    """Run content for a paragraph's text: escaped, with line breaks and tabs as elements"""
+    text = escape(INVALID_XML_CHARS_RE.sub('', text))
+    return TEXT_START + text.replace('\n', BREAK).replace('\r', BREAK).replace('\t', TAB) + TEXT_END
+
+
+def compile_styles(document, used_styles):
+    """styles.xml of a document with only its defaults and the styles in use (and those they refer to)"""
+    styles = document.styles.element
+    by_id = {style.get(qn('w:styleId')): style for style in styles.iterchildren(qn('w:style'))}
+    missing = used_styles - set(by_id)
+    if missing:
+        raise ValueError(f"Styles missing from the document template: {', '.join(sorted(missing))}")
+
+    kept = set()
+    pending = [style_id for style_id, style in by_id.items() if style.get(qn('w:default')) == '1']
+    pending += used_styles
+    while pending:
+        style_id = pending.pop()
+        if style_id in kept or style_id not in by_id:
+            continue
+        kept.add(style_id)
+        for tag in ('w:basedOn', 'w:link', 'w:next'):
+            reference = by_id[style_id].find(qn(tag))
+            if reference is not None:
+                pending.append(reference.get(qn('w:val')))
+
+    compiled = deepcopy(styles)
+    for child in list(compiled):
+        if child.tag == qn('w:latentStyles') or (child.tag == qn('w:style') and
+                                                 child.get(qn('w:styleId')) not in kept):
+            compiled.remove(child)
+    return etree.tostring(compiled, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+class CompiledPart:
+    """The XML of a package part, split at its variable paragraphs"""
+
+    __slots__ = ('name', 'literals', 'fields')
+
+    def __init__(self, name, xml):
+        pieces = MARKER_RE.split(xml)
+        self.name = name
+        self.literals = pieces[0::2]
+        self.fields = pieces[1::2]
+
+    def fill(self, fields):
+        """The part's bytes with the fields' text"""
+        literals = self.literals
+        chunks = [literals[0]]
+        for index, name in enumerate(self.fields, 1):
+            chunks.append(run_text(fields[name]))
+            chunks.append(literals[index])
+        return ''.join(chunks).encode('utf-8')
+
+
+class OoxmlTemplate:
+    """A document compiled to XML strings, written as a .docx without python-docx
+
+    Drop-in replacement for DocumentTemplate: build(fields) is the same
+    python-docx builder, called once to compile. The document may have
+    headers and footers but no images or hyperlinks.
+    """
+
+    def __init__(self, build):
+        document = build(PlaceholderFields())
+        document_xml = document.part.blob.decode('utf-8')
+
+        self.parts = [CompiledPart('word/document.xml', document_xml)]
+        self.static_parts = []
+        used_styles = set(STYLE_REF_RE.findall(document_xml))
+        referenced = set(RELATIONSHIP_REF_RE.findall(document_xml))
+        overrides = []
+        relationships = []
+        styles_part = None
+        for rel_id, rel in document.part.rels.items():
+            if rel_id in referenced:
+                if rel.is_external or rel.target_part.rels:
+                    raise ValueError(f"Unsupported relationship in document template: {rel.reltype}")
+                xml = rel.target_part.blob.decode('utf-8')
+                used_styles.update(STYLE_REF_RE.findall(xml))
+                self.parts.append(CompiledPart(rel.target_part.partname.lstrip('/'), xml))
+            elif rel.reltype == f"{R_NS}/styles":
+                styles_part = rel.target_part
+            elif rel.reltype in COPIED_RELTYPES:
+                self.static_parts.append((rel.target_part.partname.lstrip('/'), rel.target_part.blob))
+            else:
+                continue
+            part = rel.target_part
+            overrides.append(f'<Override PartName="{part.partname}" ContentType="{part.content_type}"/>')
+            relationships.append(f'<Relationship Id="{rel_id}" Type="{rel.reltype}" '
+                                 f'Target="{part.partname[len("/word/"):]}"/>')
+        self.static_parts.append((styles_part.partname.lstrip('/'), compile_styles(document, used_styles)))
+
+        created = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        self.static_parts[:0] = [
+            ('[Content_Types].xml', CONTENT_TYPES_XML.format(overrides=''.join(overrides)).encode('utf-8')),
+            ('_rels/.rels', PACKAGE_RELS_XML.encode('utf-8')),
+            ('docProps/core.xml', CORE_XML.format(created=created).encode('utf-8')),
+            ('word/_rels/document.xml.rels',
+             DOCUMENT_RELS_XML.format(relationships=''.join(relationships)).encode('utf-8')),
+        ]
+        self.fields = [name for part in self.parts for name in part.fields]
+        self.renders = 0
+
+    def render(self, fields, target):
+        """Write the document with the job's fields to a path or binary stream"""
+        with zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for name, data in self.static_parts:
+                archive.writestr(name, data)
+            for part in self.parts:
+                archive.writestr(part.name, part.fill(fields))
+        self.renders += 1
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Per-domain token-bucket rate limiting for the Job Automation System
+Every source request takes a token from its domain's bucket, so bursts to
+one job board are paced while other domains keep going
+"""
+
+import logging
+import threading
+import time
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens per second up to `burst` tokens"""
+
+    def __init__(self, rate, burst=1, clock=time.monotonic):
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.clock = clock
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def ready_in(self):
+        """Seconds until a token is available, without taking it"""
+        with self._lock:
+            self._refill()
+            return max(0.0, (1.0 - self.tokens) / self.rate)
+
+    def reserve(self):
+        """Take a token and return how long the caller must wait before using it
+
+        Tokens can be reserved ahead of time (the bucket goes negative), so
+        concurrent callers queue up at the configured rate instead of
+        polling.
+        """
+        with self._lock:
+            self._refill()
+            self.tokens -= 1.0
+            return max(0.0, -self.tokens / self.rate)
+
+
+class DomainRateLimiter:
+    """One token bucket per domain, with wait-time statistics"""
+
+    def __init__(self, rate=2.0, burst=4, domains=None, clock=time.monotonic):
+        """Initialize the limiter
+
+        rate/burst apply to every host without an entry in `domains`
+        ({domain: {"rate": ..., "burst": ...}}). A domain entry also covers
+        its subdomains, which then share one bucket. A rate of 0 or None
+        disables limiting.
+        """
+        self.default = {'rate': rate, 'burst': burst}
+        self.domains = {domain.lower(): settings for domain, settings in (domains or {}).items()}
+        self.clock = clock
+        self.sleep = time.sleep
+        self.buckets = {}
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """Create a limiter from the 'rate_limits' section of config.json"""
+        settings = config.get('rate_limits', {})
+        if not settings.get('enabled', True):
+            return None
+        default = settings.get('default', {})
+        return cls(
+            rate=default.get('rate', 2.0),
+            burst=default.get('burst', 4),
+            domains=settings.get('domains', {}),
+        )
+
+    def bucket_key(self, url):
+        """Configured domain covering the URL's host, or the host itself"""
+        host = urlparse(url).netloc.lower()
+        hostname = host.rsplit(':', 1)[0]
+        for domain in self.domains:
+            if hostname == domain or hostname.endswith(f".{domain}"):
+                return domain
+        return host
+
+    def _bucket(self, key):
+        """Token bucket for a key, or None if the key is not limited"""
+        with self._lock:
+            if key not in self.buckets:
+                settings = self.domains.get(key, self.default)
+                rate = settings.get('rate')
+                self.buckets[key] = TokenBucket(rate, settings.get('burst', 1), self.clock) if rate else None
+                self.stats[key] = {'requests': 0, 'delayed': 0, 'wait_seconds': 0.0, 'max_wait': 0.0}
+            return self.buckets[key]
+
+    def ready_in(self, url):
+        """Seconds until a request to the URL could start without waiting"""
+        bucket = self._bucket(self.bucket_key(url))
+        return bucket.ready_in() if bucket else 0.0
+
+    def acquire(self, url):
+        """Wait until a request to the URL is allowed; returns the seconds waited"""
+        key = self.bucket_key(url)
+        bucket = self._bucket(key)
+        wait = bucket.reserve() if bucket else 0.0
+
+        with self._lock:
+            stats = self.stats[key]
+            stats['requests'] += 1
+            if wait > 0:
+                stats['delayed'] += 1
+                stats['wait_seconds'] += wait
+                stats['max_wait'] = max(stats['max_wait'], wait)
+
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+    def summary_lines(self):
+        """Per-domain request and wait-time statistics for the run log"""
+        return [
+            f"Rate limit {key}: {stats['requests']} requests, {stats['delayed']} delayed, "
+            f"waited {stats['wait_seconds']:.2f}s (max {stats['max_wait']:.2f}s)"
+            for key, stats in self.stats.items()
+        ]
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Content-addressed cache of rendered CVs and cover letters
+A document is keyed by a hash of everything it is rendered from (kind,
+template fingerprint and job-dependent paragraphs). Most CVs differ only in
+their header, so the header text is left out of the key: a hit with another
+header is served by rewriting the small header part of the cached file
+instead of rendering the whole document again
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import time
+import zipfile
+from xml.sax.saxutils import escape
+
+logger = logging.getLogger(__name__)
+
+# Fields rendered into the page header rather than the body
+HEADER_FIELDS = ('header',)
+
+
+def patch_header(data, old_text, new_text):
+    """DOCX bytes with a header paragraph's text replaced, or None if it is not found"""
+    old = f">{escape(old_text)}<".encode('utf-8')
+    new = f">{escape(new_text)}<".encode('utf-8')
+    output = io.BytesIO()
+    patched = False
+    with zipfile.ZipFile(io.BytesIO(data)) as source, zipfile.ZipFile(output, 'w') as target:
+        for info in source.infolist():
+            content = source.read(info)
+            if info.filename.startswith('word/header') and old in content:
+                content = content.replace(old, new)
+                patched = True
+            target.writestr(info, content)
+    return output.getvalue() if patched else None
+
+
+class RenderCache:
+    """On-disk store of rendered documents with LRU eviction by total size"""
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, cache_dir='.render_cache', max_bytes=50 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.stats = {'hits': 0, 'header_patches': 0, 'misses': 0, 'evictions': 0}
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.index = self._load_index()
+
+    @classmethod
+    def from_config(cls, config):
+        """Cache for the 'render_cache' section of config.json, or None if disabled"""
+        cache_config = config.get('render_cache', {})
+        if not cache_config.get('enabled', True):
+            return None
+
+        try:
+            return cls(cache_config.get('directory', '.render_cache'),
+                       cache_config.get('max_bytes', 50 * 1024 * 1024))
+        except Exception as e:
+            logger.warning(f"Render cache disabled: {e}")
+            return None
+
+    def _load_index(self):
+        """Load the cache index, starting empty if it is missing or corrupt"""
+        try:
+            with open(os.path.join(self.cache_dir, self.INDEX_FILE), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable render cache index: {e}")
+            return {}
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.docx")
+
+    def key(self, kind, fingerprint, fields):
+        """Content address of a document; header fields are not part of it"""
+        body = {name: value for name, value in fields.items() if name not in HEADER_FIELDS}
+        payload = json.dumps([kind, fingerprint, body], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def fetch(self, key, fields):
+        """Bytes of the cached document for a key with the fields' header, or None on a miss"""
+        entry = self.index.get(key)
+        header = {name: fields[name] for name in HEADER_FIELDS if name in fields}
+        try:
+            if entry is None:
+                raise FileNotFoundError(key)
+            with open(self._entry_path(key), 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            self.index.pop(key, None)
+            self.stats['misses'] += 1
+            return None
+
+        if entry.get('header', {}) != header:
+            for name, text in header.items():
+                data = patch_header(data, entry['header'].get(name, ''), text)
+                if data is None:
+                    self.stats['misses'] += 1
+                    return None
+            self.stats['header_patches'] += 1
+
+        entry['last_access'] = time.time()
+        self.stats['hits'] += 1
+        return data
+
+    def store(self, key, fields, data):
+        """Keep the bytes of a freshly rendered document"""
+        tmp_path = f"{self._entry_path(key)}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self._entry_path(key))
+        except OSError as e:
+            logger.warning(f"Could not cache rendered document: {e}")
+            return
+        self.index[key] = {
+            'size': len(data),
+            'header': {name: fields[name] for name in HEADER_FIELDS if name in fields},
+            'last_access': time.time(),
+        }
+
+    def evict(self):
+        """Evict least recently used documents until the cache fits in max_bytes"""
+        total = sum(entry.get('size', 0) for entry in self.index.values())
+        for key, entry in sorted(self.index.items(), key=lambda item: item[1].get('last_access', 0)):
+            if total <= self.max_bytes:
+                break
+            total -= entry.get('size', 0)
+            try:
+                os.remove(self._entry_path(key))
+            except FileNotFoundError:
+                pass
+            del self.index[key]
+            self.stats['evictions'] += 1
+
+    def save(self):
+        """Evict if needed and persist the index"""
+        self.evict()
+        tmp_path = os.path.join(self.cache_dir, f"{self.INDEX_FILE}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, ensure_ascii=False)
+        os.replace(tmp_path, os.path.join(self.cache_dir, self.INDEX_FILE))
+
+    def hit_rate(self):
+        lookups = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / lookups if lookups else 0.0
+
+    def summary(self):
+        """One-line summary for the run log"""
+        size = sum(entry.get('size', 0) for entry in self.index.values())
+        return (f"Render cache: {self.stats['hits']} hits ({self.stats['header_patches']} header patches), "
+                f"{self.stats['misses']} misses, {self.hit_rate():.0%} hit rate, "
+                f"{len(self.index)} documents ({size / 1024 / 1024:.1f} MB), {self.stats['evictions']} evictions")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Deterministic compatibility scores for the Job Automation System
+Scores are memoized by job content hash and a fingerprint of the scorer
+(name, version and keyword lists), and persisted in the job store, so known
+jobs are not scored again and a keyword change only invalidates the scores
+of the scorer that uses those keywords
+"""
+
+import hashlib
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def scorer_fingerprint(name, version, *keyword_lists):
+    """Fingerprint of everything a scorer's result depends on besides the job text"""
+    payload = json.dumps([name, version, [list(keywords) for keywords in keyword_lists]], ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def stable_variation(content_hash, spread):
+    """Score variation in [-spread, spread] derived from the job content, not the clock"""
+    return int(content_hash[:8], 16) % (2 * spread + 1) - spread
+
+
+class ScoreCache:
+    """Memoized scores of one scorer fingerprint, optionally persisted in a JobStore"""
+
+    def __init__(self, fingerprint, job_store=None):
+        self.fingerprint = fingerprint
+        self.scores = {}
+        self.hits = 0
+        self.misses = 0
+        self.job_store = None
+        self._pending = {}
+        self._lock = threading.Lock()
+        if job_store is not None:
+            self.attach(job_store)
+
+    def attach(self, job_store):
+        """Load the scores persisted for this fingerprint and persist new ones there"""
+        try:
+            stored = job_store.get_cached_scores(self.fingerprint)
+        except Exception as e:
+            logger.warning(f"Could not load cached scores: {e}")
+            return
+        with self._lock:
+            self.job_store = job_store
+            self.scores.update(stored)
+
+    def get(self, content_hash):
+        """Memoized score, or None"""
+        with self._lock:
+            score = self.scores.get(content_hash)
+            if score is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return score
+
+    def put(self, content_hash, score):
+        with self._lock:
+            self.scores[content_hash] = score
+            self._pending[content_hash] = score
+
+    def flush(self):
+        """Persist the scores computed since the last flush"""
+        with self._lock:
+            if self.job_store is None or not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+        try:
+            self.job_store.save_cached_scores(self.fingerprint, pending)
+        except Exception as e:
+            logger.warning(f"Could not save cached scores: {e}")
+
+    def summary(self):
+        """One-line summary for the run log"""
+        return f"Score cache: {self.hits} hits, {self.misses} scored, {len(self.scores)} cached"
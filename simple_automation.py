@@ -6,6 +6,8 @@ This system searches for real job opportunities and sends automated emails
 Specialized in Business Intelligence and Big Data positions
 """
 
+import argparse
+import io
 import json
 import logging
 import os
@@ -31,6 +33,20 @@ from docx.shared import Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from dotenv import load_dotenv
 
+from batch_scoring import score_compatibility
+from bm25 import BM25Ranker
+from document_renderer import DocumentRenderer
+from document_templates import DocumentTemplate
+from job_fields import format_experience, format_salary, get_job_fields, passes_filters
+from job_sources import SourceRegistry, job_board_sources
+from job_store import JobStore
+from job_text import get_job_text
+from keyword_matcher import KeywordIndex
+from near_duplicates import NearDuplicateDetector
+from ooxml_writer import OoxmlTemplate
+from score_cache import ScoreCache, scorer_fingerprint, stable_variation
+from skill_index import SKILL_KEYWORDS, SkillIndex
+
 # Load environment variables
 load_dotenv()
 
@@ -45,6 +61,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Keyword lists of the CV, scoring and report helpers; they are compiled with
+# the config.json keyword lists into one matcher (see keyword_matcher)
+SUMMARY_KEYWORDS = ['machine learning', 'azure', 'tableau']
+
+# Bonus points for key skills in calculate_compatibility
+KEY_SKILLS = ['python', 'sql', 'power bi', 'tableau', 'data', 'analytics', 'business intelligence']
+
+# Bump when calculate_compatibility changes, so memoized scores are recomputed
+SCORER_VERSION = 1
+
+MATCHED_KEYWORD_LISTS = [SUMMARY_KEYWORDS, SKILL_KEYWORDS, KEY_SKILLS]
+
+# Estimates by seniority level (see job_fields) for postings that do not state them
+SALARY_ESTIMATES = {'intern': '25000-35000 EUR', 'junior': '25000-35000 EUR', 'senior': '45000-60000 EUR',
+                    'lead': '50000-70000 EUR'}
+EXPERIENCE_ESTIMATES = {'intern': '0-2 años de experiencia', 'junior': '0-2 años de experiencia',
+                        'senior': '5+ años de experiencia', 'lead': '7+ años de experiencia'}
+
 class JobAutomationSystem:
     """Main class for job automation system"""
     
@@ -54,6 +88,9 @@ class JobAutomationSystem:
         self.config = self.load_config()
         self.jobs_found = []
         self.cvs_generated = []
+        self.document_templates = {}
+        self.keyword_index = self.create_keyword_index()
+        self.score_cache = self.create_score_cache()
         
     def load_config(self):
         """Load configuration from JSON file"""
@@ -114,6 +151,45 @@ class JobAutomationSystem:
                     "https://api.indeed.com/ads/apisearch",
                     "https://api.infojobs.net/api/9/offer"
                 ]
+            },
+            "job_store": {
+                "enabled": True,
+                "path": "job_store.db",
+                "incremental": True
+            },
+            "near_duplicates": {
+                "enabled": True,
+                "threshold": 0.7,
+                "num_perm": 64,
+                "shingle_size": 3
+            },
+            "scoring": {
+                "deterministic": True,
+                "cache": True
+            },
+            "skill_index": {
+                "enabled": True
+            },
+            "ranking": {
+                "enabled": True,
+                "k1": 1.2,
+                "b": 0.75
+            },
+            "filters": {
+                "seniority": [],
+                "contract_types": [],
+                "min_salary": None,
+                "max_experience_years": None
+            },
+            "documents": {
+                "workers": 4,
+                "loose_files": True,
+                "engine": "ooxml"
+            },
+            "render_cache": {
+                "enabled": True,
+                "directory": ".render_cache",
+                "max_bytes": 52428800
             }
         }
         
@@ -122,22 +198,9 @@ class JobAutomationSystem:
         
         logger.info(f"Default configuration created: {self.config_path}")
     
-    def search_jobs_real_sources(self):
-        """Search for jobs using real sources"""
-        jobs = []
-        
-        # Real job search using web scraping (InfoJobs-style)
-        search_urls = [
-            "https://www.infojobs.net/ofertas-trabajo/data-analyst",
-            "https://www.infojobs.net/ofertas-trabajo/business-intelligence", 
-            "https://www.infojobs.net/ofertas-trabajo/big-data",
-            "https://www.infojobs.net/ofertas-trabajo/python-developer",
-            "https://www.tecnoempleo.com/ofertas-trabajo/data-analyst",
-            "https://www.tecnoempleo.com/ofertas-trabajo/business-intelligence"
-        ]
-        
-        # Sample real-looking jobs (these would be replaced with actual scraping)
-        sample_jobs = [
+    def get_sample_jobs(self):
+        """Sample real-looking jobs (these would be replaced with actual scraping)"""
+        return [
             {
                 "title": "Data Analyst - Business Intelligence",
                 "company": "Banco Santander",
@@ -175,88 +238,83 @@ class JobAutomationSystem:
                 "source": "infojobs"
             }
         ]
+    
+    def search_jobs_real_sources(self):
+        """Search for jobs using real sources"""
+        jobs = []
+        
+        # Sample jobs plus the job-board APIs listed in config.json
+        source_configs = [{"name": "sample_jobs", "type": "static", "jobs": self.get_sample_jobs()}]
+        source_configs += job_board_sources(self.config)
+        registry = SourceRegistry.from_config(source_configs, self)
         
-        # Filter jobs based on keywords
-        for job in sample_jobs:
-            if self.is_relevant_job(job):
+        # Filter jobs based on keywords and structured fields as soon as each source yields them
+        seen_urls = set()
+        for _, job in registry.stream():
+            if job['url'] not in seen_urls and self.is_relevant_job(job) and self.matches_filters(job):
                 jobs.append(job)
+                seen_urls.add(job['url'])
+        
+        for line in registry.summary_lines():
+            logger.info(line)
         
         logger.info(f"Found {len(jobs)} unique jobs")
         return jobs
     
+    def create_keyword_index(self):
+        """Compile every keyword list matched against job text into one matcher"""
+        job_search = self.config.get('job_search', {})
+        return KeywordIndex(
+            job_search.get('keywords', []),
+            job_search.get('locations', []),
+            job_search.get('experience_level', []),
+            job_search.get('job_types', []),
+            *MATCHED_KEYWORD_LISTS
+        )
+    
+    def create_score_cache(self):
+        """Memoized compatibility scores for the current keywords and scorer version"""
+        keywords = self.config.get('job_search', {}).get('keywords', [])
+        return ScoreCache(scorer_fingerprint('calculate_compatibility', SCORER_VERSION, keywords, KEY_SKILLS))
+    
+    def get_job_matches(self, job):
+        """Keywords found in a job's title and description, scanned once and shared"""
+        return self.keyword_index.match_job(job)
+    
     def is_relevant_job(self, job):
         """Check if job is relevant based on keywords"""
-        keywords = self.config['job_search']['keywords']
-        
-        text_to_check = f"{job['title']} {job['description']}".lower();
-        
         # Check if at least one keyword is present
-        for keyword in keywords:
-            if keyword.lower() in text_to_check:
-                return True
-        
-        return False
+        return self.get_job_matches(job).any(self.config['job_search']['keywords'])
+    
+    def matches_filters(self, job):
+        """Extract the job's structured fields (stored in job['fields']) and check the config.json filters"""
+        return passes_filters(get_job_fields(job), self.config.get('filters', {}))
+    
+    def get_document_template(self, kind):
+        """Template for 'cv' or 'cover_letter', built on first use (see document_templates and ooxml_writer)"""
+        if kind not in self.document_templates:
+            build = self.build_cv_document if kind == 'cv' else self.build_cover_letter_document
+            if self.config.get('documents', {}).get('engine', 'ooxml') == 'ooxml':
+                self.document_templates[kind] = OoxmlTemplate(build)
+            else:
+                self.document_templates[kind] = DocumentTemplate(build)
+        return self.document_templates[kind]
+    
+    def get_document_filename(self, kind, job):
+        """File name of a job's 'cv' or 'cover_letter'"""
+        prefix = 'CV' if kind == 'cv' else 'Cover_Letter'
+        return f"{prefix}_{job['company'].replace(' ', '_')}_{job['title'].replace(' ', '_')}.docx"
+    
+    def get_document_fields(self, kind, job):
+        """Job-dependent paragraphs of a job's 'cv' or 'cover_letter'"""
+        return self.get_cv_fields(job) if kind == 'cv' else self.get_cover_letter_fields(job)
     
     def generate_cv_for_job(self, job, output_dir):
         """Generate a customized CV for a specific job"""
         try:
-            # Create CV document
-            doc = Document()
-            
-            # Personal Information
-            personal_info = self.config['personal_info']
-            
-            # Name
-            name_para = doc.add_paragraph()
-            name_run = name_para.add_run(personal_info['name'])
-            name_run.font.size = Inches(0.2)
-            name_run.bold = True
-            name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
-            # Contact Info
-            contact_para = doc.add_paragraph()
-            contact_text = f"Email: {personal_info['email']} | Phone: {personal_info['phone']} | Location: {personal_info['location']}"
-            contact_para.add_run(contact_text)
-            contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
-            # LinkedIn and GitHub
-            links_para = doc.add_paragraph()
-            links_text = f"LinkedIn: {personal_info['linkedin']} | GitHub: {personal_info['github']}"
-            links_para.add_run(links_text)
-            links_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
-            doc.add_paragraph()  # Space
-            
-            # Professional Summary
-            doc.add_heading('Professional Summary', level=2)
-            summary_text = self.generate_custom_summary(job)
-            doc.add_paragraph(summary_text)
-            
-            # Skills
-            doc.add_heading('Technical Skills', level=2)
-            skills_text = self.generate_skills_section(job)
-            doc.add_paragraph(skills_text)
-            
-            # Experience
-            doc.add_heading('Professional Experience', level=2)
-            experience_text = self.generate_experience_section(job)
-            doc.add_paragraph(experience_text)
-            
-            # Education
-            doc.add_heading('Education', level=2)
-            education_text = """
-            Master's in Business Intelligence and Big Data Analytics
-            Universidad Politécnica de Madrid (Expected 2025)
-            
-            Bachelor's in Computer Science
-            Universidad del País Vasco (2022)
-            """
-            doc.add_paragraph(education_text)
-            
-            # Save CV
-            cv_filename = f"CV_{job['company'].replace(' ', '_')}_{job['title'].replace(' ', '_')}.docx"
+            cv_filename = self.get_document_filename('cv', job)
             cv_path = os.path.join(output_dir, cv_filename)
-            doc.save(cv_path)
+            self.get_document_template('cv').render(self.get_cv_fields(job), cv_path)
             
             logger.info(f"CV generated: {cv_filename}")
             return cv_path
@@ -265,6 +323,68 @@ class JobAutomationSystem:
             logger.error(f"Error generating CV for {job['title']}: {e}")
             return None
     
+    def get_cv_fields(self, job):
+        """Job-dependent paragraphs of the CV"""
+        return {
+            'summary': self.generate_custom_summary(job),
+            'skills': self.generate_skills_section(job),
+            'experience': self.generate_experience_section(job)
+        }
+    
+    def build_cv_document(self, fields):
+        """Build the CV with python-docx from the job-dependent paragraphs"""
+        # Create CV document
+        doc = Document()
+        
+        # Personal Information
+        personal_info = self.config['personal_info']
+        
+        # Name
+        name_para = doc.add_paragraph()
+        name_run = name_para.add_run(personal_info['name'])
+        name_run.font.size = Inches(0.2)
+        name_run.bold = True
+        name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        
+        # Contact Info
+        contact_para = doc.add_paragraph()
+        contact_text = f"Email: {personal_info['email']} | Phone: {personal_info['phone']} | Location: {personal_info['location']}"
+        contact_para.add_run(contact_text)
+        contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        
+        # LinkedIn and GitHub
+        links_para = doc.add_paragraph()
+        links_text = f"LinkedIn: {personal_info['linkedin']} | GitHub: {personal_info['github']}"
+        links_para.add_run(links_text)
+        links_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        
+        doc.add_paragraph()  # Space
+        
+        # Professional Summary
+        doc.add_heading('Professional Summary', level=2)
+        doc.add_paragraph(fields['summary'])
+        
+        # Skills
+        doc.add_heading('Technical Skills', level=2)
+        doc.add_paragraph(fields['skills'])
+        
+        # Experience
+        doc.add_heading('Professional Experience', level=2)
+        doc.add_paragraph(fields['experience'])
+        
+        # Education
+        doc.add_heading('Education', level=2)
+        education_text = """
+            Master's in Business Intelligence and Big Data Analytics
+            Universidad Politécnica de Madrid (Expected 2025)
+            
+            Bachelor's in Computer Science
+            Universidad del País Vasco (2022)
+            """
+        doc.add_paragraph(education_text)
+        
+        return doc
+    
     def generate_custom_summary(self, job):
         """Generate customized professional summary"""
         base_summary = """
@@ -275,13 +395,14 @@ class JobAutomationSystem:
         """
         
         # Customize based on job requirements
-        if "machine learning" in job['description'].lower():
+        matches = self.get_job_matches(job)
+        if matches.in_description("machine learning"):
             base_summary += " Strong background in machine learning algorithms and predictive modeling."
         
-        if "azure" in job['description'].lower():
+        if matches.in_description("azure"):
             base_summary += " Experienced with Microsoft Azure cloud platform and Azure Data Factory."
         
-        if "tableau" in job['description'].lower():
+        if matches.in_description("tableau"):
             base_summary += " Expert in Tableau for data visualization and dashboard creation."
         
         return base_summary.strip()
@@ -324,25 +445,51 @@ class JobAutomationSystem:
     def generate_cover_letter(self, job, output_dir):
         """Generate a customized cover letter"""
         try:
-            doc = Document()
-            
-            # Header
-            doc.add_paragraph(f"Date: {datetime.now().strftime('%B %d, %Y')}")
-            doc.add_paragraph()
-            
-            # Recipient
-            doc.add_paragraph(f"Dear {job['company']} Hiring Manager,")
-            doc.add_paragraph()
-            
-            # Body
-            intro = f"I am writing to express my strong interest in the {job['title']} position at {job['company']}. "
-            intro += "With my background in data analysis and business intelligence, I am excited about the opportunity "
-            intro += "to contribute to your team's success."
+            cl_filename = self.get_document_filename('cover_letter', job)
+            cl_path = os.path.join(output_dir, cl_filename)
+            self.get_document_template('cover_letter').render(self.get_cover_letter_fields(job), cl_path)
             
-            doc.add_paragraph(intro)
-            doc.add_paragraph()
+            logger.info(f"Cover letter generated: {cl_filename}")
+            return cl_path
             
-            body = """
+        except Exception as e:
+            logger.error(f"Error generating cover letter for {job['title']}: {e}")
+            return None
+    
+    def get_cover_letter_fields(self, job):
+        """Job-dependent paragraphs of the cover letter"""
+        intro = f"I am writing to express my strong interest in the {job['title']} position at {job['company']}. "
+        intro += "With my background in data analysis and business intelligence, I am excited about the opportunity "
+        intro += "to contribute to your team's success."
+        
+        closing = f"I am particularly drawn to {job['company']} because of your commitment to data-driven "
+        closing += "innovation. I would welcome the opportunity to discuss how my skills and experience "
+        closing += "can contribute to your team's objectives."
+        
+        return {
+            'date': f"Date: {datetime.now().strftime('%B %d, %Y')}",
+            'greeting': f"Dear {job['company']} Hiring Manager,",
+            'intro': intro,
+            'closing': closing
+        }
+    
+    def build_cover_letter_document(self, fields):
+        """Build the cover letter with python-docx from the job-dependent paragraphs"""
+        doc = Document()
+        
+        # Header
+        doc.add_paragraph(fields['date'])
+        doc.add_paragraph()
+        
+        # Recipient
+        doc.add_paragraph(fields['greeting'])
+        doc.add_paragraph()
+        
+        # Body
+        doc.add_paragraph(fields['intro'])
+        doc.add_paragraph()
+        
+        body = """
             In my current role as a Senior Data Analyst, I have developed expertise in Python, SQL, and various 
             BI tools including Power BI and Tableau. I have successfully implemented data-driven solutions that 
             have directly contributed to business growth and operational efficiency. My experience includes:
@@ -352,53 +499,54 @@ class JobAutomationSystem:
             • Creating predictive models and performing advanced statistical analysis
             • Collaborating with stakeholders to translate business requirements into technical solutions
             """
-            
-            doc.add_paragraph(body)
-            doc.add_paragraph()
-            
-            closing = f"I am particularly drawn to {job['company']} because of your commitment to data-driven "
-            closing += "innovation. I would welcome the opportunity to discuss how my skills and experience "
-            closing += "can contribute to your team's objectives."
-            
-            doc.add_paragraph(closing)
-            doc.add_paragraph()
-            doc.add_paragraph("Sincerely,")
-            doc.add_paragraph(self.config['personal_info']['name'])
-            
-            # Save cover letter
-            cl_filename = f"Cover_Letter_{job['company'].replace(' ', '_')}_{job['title'].replace(' ', '_')}.docx"
-            cl_path = os.path.join(output_dir, cl_filename)
-            doc.save(cl_path)
-            
-            logger.info(f"Cover letter generated: {cl_filename}")
-            return cl_path
-            
-        except Exception as e:
-            logger.error(f"Error generating cover letter for {job['title']}: {e}")
-            return None
+        
+        doc.add_paragraph(body)
+        doc.add_paragraph()
+        
+        doc.add_paragraph(fields['closing'])
+        doc.add_paragraph()
+        doc.add_paragraph("Sincerely,")
+        doc.add_paragraph(self.config['personal_info']['name'])
+        
+        return doc
     
-    def create_job_applications_zip(self, job_data, output_dir):
-        """Create a ZIP file with all job applications"""
+    def create_job_applications_zip(self, job_data, output_dir, documents=None):
+        """Create a ZIP file with all job applications
+        
+        documents are the RenderResults of the run: their bytes are streamed
+        into the archive (and released) instead of reading the files back.
+        """
         try:
             zip_filename = f"CVs_Generated_{datetime.now().strftime('%Y-%m-%d')}.zip"
             zip_path = os.path.join(output_dir, zip_filename)
             
+            if documents is None:
+                generated = len(self.cvs_generated)
+            else:
+                generated = sum(1 for result in documents if result.error is None)
+            
             with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
                 # Add all generated files
-                for file_path in self.cvs_generated:
-                    if os.path.exists(file_path):
-                        zip_file.write(file_path, os.path.basename(file_path))
+                if documents is None:
+                    for file_path in self.cvs_generated:
+                        if os.path.exists(file_path):
+                            zip_file.write(file_path, os.path.basename(file_path))
+                else:
+                    for result in documents:
+                        if result.data is not None:
+                            with zip_file.open(result.name, 'w') as f:
+                                f.write(result.data)
+                            result.data = None
                 
-                # Add job summary
+                # Add job summary, written straight into the archive
                 summary_filename = f"Job_Summary_{datetime.now().strftime('%Y-%m-%d')}.txt"
-                summary_path = os.path.join(output_dir, summary_filename)
                 
-                with open(summary_path, 'w', encoding='utf-8') as f:
+                with io.TextIOWrapper(zip_file.open(summary_filename, 'w'), encoding='utf-8') as f:
                     f.write("JOB SEARCH AUTOMATION SUMMARY\n")
                     f.write("=" * 40 + "\n\n")
                     f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
                     f.write(f"Total jobs found: {len(job_data)}\n")
-                    f.write(f"CVs generated: {len(self.cvs_generated)}\n\n")
+                    f.write(f"CVs generated: {generated}\n\n")
                     
                     for i, job in enumerate(job_data, 1):
                         f.write(f"Job {i}:\n")
@@ -407,8 +555,6 @@ class JobAutomationSystem:
                         f.write(f"  Location: {job['location']}\n")
                         f.write(f"  URL: {job['url']}\n")
                         f.write(f"  Description: {job['description'][:200]}...\n\n")
-                
-                zip_file.write(summary_path, os.path.basename(summary_path))
             
             logger.info(f"ZIP file created: {zip_filename}")
             return zip_path
@@ -500,41 +646,139 @@ Sistema de Automatización de Búsqueda de Empleo
             logger.error(f"Error sending email: {e}")
             return False
     
-    def run_daily_automation(self):
-        """Run the complete daily automation process"""
+    def open_job_store(self):
+        """Open the persistent job store, if enabled"""
+        store_config = self.config.get('job_store', {})
+        if not store_config.get('enabled', True):
+            return None
+        
+        try:
+            return JobStore(store_config.get('path', 'job_store.db'))
+        except Exception as e:
+            logger.warning(f"Job store disabled: {e}")
+            return None
+    
+    def update_skill_index(self, job_store):
+        """Add the jobs stored by this run to the skill bitmap index"""
+        if job_store is None or not self.config.get('skill_index', {}).get('enabled', True):
+            return None
+        try:
+            return SkillIndex.open(self.config, job_store)
+        except Exception as e:
+            logger.warning(f"Could not update skill index: {e}")
+            return None
+    
+    def rank_jobs(self, jobs, job_store):
+        """Order a run's jobs by BM25 relevance to the config.json keyword profile"""
+        if job_store is None or not jobs or not self.config.get('ranking', {}).get('enabled', True):
+            return jobs
+        try:
+            return BM25Ranker.open(self.config, job_store).rank(jobs)
+        except Exception as e:
+            logger.warning(f"Could not rank jobs: {e}")
+            return jobs
+    
+    def is_already_processed(self, job, job_store, incremental):
+        """Record a job in the store and tell whether this run can skip it"""
+        if job_store is None:
+            return False
+        
+        job_store.record_seen(job)
+        return incremental and job_store.has_artifacts(job['job_id'])
+    
+    def is_near_duplicate(self, job, duplicate_detector):
+        """Check whether a job is a cross-posted copy of one already handled"""
+        if duplicate_detector is None:
+            return False
+        
+        duplicate = duplicate_detector.find_duplicate(job)
+        if duplicate:
+            logger.info(f"Skipping near-duplicate ({duplicate[1]:.0%} similar to {duplicate[0]}): {job['title']}")
+            return True
+        return False
+    
+    def record_document(self, result, job_store, zip_path=None):
+        """Keep a rendered document and record it as an artifact of its job
+        
+        A document that was only written to the archive is recorded by its
+        path inside it (zip_path/name).
+        """
+        if result.error:
+            return
+        path = result.path
+        if path is None:
+            if not zip_path:
+                return
+            path = os.path.join(zip_path, result.name)
+        
+        label = 'CV' if result.kind == 'cv' else 'Cover letter'
+        source = 'from cache' if result.cached else f"{result.seconds * 1000:.0f}ms"
+        logger.info(f"{label} generated: {result.name} ({source})")
+        self.cvs_generated.append(path)
+        if job_store:
+            job_store.record_artifact(result.job['job_id'], result.kind, path)
+    
+    def run_daily_automation(self, incremental=None):
+        """Run the complete daily automation process
+
+        In incremental mode (the default, see job_store.incremental in
+        config.json) jobs that already got documents in a previous run are
+        skipped by the document and email stages.
+        """
+        job_store = None
+        renderer = None
         try:
             logger.info("Starting daily job search automation")
             
+            job_store = self.open_job_store()
+            if job_store:
+                self.score_cache.attach(job_store)
+            if incremental is None:
+                incremental = self.config.get('job_store', {}).get('incremental', True)
+            skipped_jobs = 0
+            duplicate_detector = NearDuplicateDetector.from_config(self.config, job_store, use_history=incremental)
+            
             # Create output directory
             today = datetime.now().strftime('%Y-%m-%d')
             output_dir = os.path.join('job_applications', today)
             os.makedirs(output_dir, exist_ok=True)
+            renderer = DocumentRenderer.from_config(self)
+            
+            # Search for jobs, keeping only those not processed in earlier runs
+            jobs = []
+            for job in self.search_jobs_real_sources():
+                if self.is_already_processed(job, job_store, incremental):
+                    skipped_jobs += 1
+                elif not self.is_near_duplicate(job, duplicate_detector):
+                    jobs.append(job)
             
-            # Search for jobs
-            jobs = self.search_jobs_real_sources()
+            self.update_skill_index(job_store)
+            
+            if incremental and job_store:
+                logger.info(f"Incremental mode: skipped {skipped_jobs} jobs processed in earlier runs")
             
             if not jobs:
-                logger.info("No relevant jobs found today")
+                logger.info("No new relevant jobs found today" if skipped_jobs else "No relevant jobs found today")
                 return
             
-            # Process each job
+            # Process each job, most relevant first
+            jobs = self.rank_jobs(jobs, job_store)
             for i, job in enumerate(jobs, 1):
                 logger.info(f"Processing job {i}/{len(jobs)}: {job['title']}")
                 
-                # Generate CV
-                cv_path = self.generate_cv_for_job(job, output_dir)
-                if cv_path:
-                    self.cvs_generated.append(cv_path)
-                
-                # Generate cover letter
-                cl_path = self.generate_cover_letter(job, output_dir)
-                if cl_path:
-                    self.cvs_generated.append(cl_path)
+                job['score'] = self.calculate_compatibility(job)
+                job['skills'] = self.extract_job_skills(job)
+                if job_store:
+                    job_store.record_score(job['job_id'], job['score'])
                 
-                logger.info(f"Job processed successfully: {job['title']}")
+                # Queue the CV and cover letter (rendered by the worker pool)
+                renderer.submit(job, output_dir)
             
-            # Create ZIP file
-            zip_path = self.create_job_applications_zip(jobs, output_dir)
+            # Collect the rendered documents, in job order, and pack them into the ZIP file
+            documents = renderer.results()
+            zip_path = self.create_job_applications_zip(jobs, output_dir, documents)
+            for result in documents:
+                self.record_document(result, job_store, zip_path)
             
             # Send email report
             if not self.send_email_report(jobs, zip_path):
@@ -545,6 +789,13 @@ Sistema de Automatización de Búsqueda de Empleo
             logger.info(f"Files generated in: {output_dir}")
             logger.info(f"Total jobs processed: {len(jobs)}")
             logger.info(f"CVs generated: {len(self.cvs_generated)}")
+            for line in renderer.summary_lines():
+                logger.info(line)
+            if duplicate_detector:
+                logger.info(duplicate_detector.summary())
+            if job_store:
+                logger.info(job_store.summary())
+            logger.info(self.score_cache.summary())
             
             return True
             
@@ -552,6 +803,13 @@ Sistema de Automatización de Búsqueda de Empleo
             logger.error(f"Error in daily automation: {e}")
             logger.error(traceback.format_exc())
             return False
+        
+        finally:
+            if renderer:
+                renderer.close()
+            if job_store:
+                self.score_cache.flush()
+                job_store.close()
 
     def create_html_email_body(self, job_data):
         """Create HTML email body with beautiful design"""
@@ -958,60 +1216,36 @@ Sistema de Automatización de Búsqueda de Empleo
 
     def extract_job_skills(self, job):
         """Extract technical skills from job description"""
-        skills = []
-        
-        # Common BI and Data skills to look for
-        skill_keywords = {
-            'power bi': 'Power BI',
-            'python': 'Python',
-            'sql': 'SQL',
-            'tableau': 'Tableau',
-            'r ': 'R',
-            'dashboard': 'Dashboard',
-            'excel': 'Excel',
-            'etl': 'ETL',
-            'azure': 'Azure',
-            'aws': 'AWS',
-            'machine learning': 'Machine Learning',
-            'data warehouse': 'Data Warehouse',
-            'spark': 'Spark',
-            'hadoop': 'Hadoop',
-            'qlik': 'QlikView',
-            'looker': 'Looker',
-            'databricks': 'Databricks'
-        }
-        
-        job_text = f"{job['title']} {job['description']}".lower()
-        
-        for keyword, display_name in skill_keywords.items():
-            if keyword in job_text:
-                skills.append(display_name)
+        matches = self.get_job_matches(job)
+        skills = [display_name for keyword, display_name in SKILL_KEYWORDS.items() if keyword in matches]
         
         # Return up to 6 skills to avoid overcrowding
         return skills[:6] if skills else ['Data Analysis', 'SQL', 'Python', 'BI Tools']
     
-    def calculate_compatibility(self, job):
-        """Calculate compatibility percentage based on job requirements"""
-        my_skills = self.config['job_search']['keywords']
-        job_text = f"{job['title']} {job['description']}".lower()
+    def calculate_compatibility(self, job, randomize=True):
+        """Calculate compatibility percentage based on job requirements
+        
+        In deterministic mode (config.json 'scoring') the variation is derived
+        from the job text, and scores are memoized in the score cache.
+        """
+        scoring = self.config.get('scoring', {})
+        deterministic = scoring.get('deterministic', True)
+        memoize = deterministic and randomize and scoring.get('cache', True)
+        content_hash = get_job_text(job).content_hash
+        if memoize:
+            score = self.score_cache.get(content_hash)
+            if score is not None:
+                return score
         
-        # Base scoring
-        matches = 0
-        total_possible = 0
+        my_skills = self.config['job_search']['keywords']
+        job_matches = self.get_job_matches(job)
         
         # Check for exact keyword matches
-        for skill in my_skills:
-            total_possible += 1
-            if skill.lower() in job_text:
-                matches += 1
+        matches = job_matches.count(my_skills)
+        total_possible = len(my_skills)
         
         # Bonus points for key skills
-        key_skills = ['python', 'sql', 'power bi', 'tableau', 'data', 'analytics', 'business intelligence']
-        bonus_points = 0
-        
-        for key_skill in key_skills:
-            if key_skill in job_text:
-                bonus_points += 0.5
+        bonus_points = 0.5 * job_matches.count(KEY_SKILLS)
         
         # Calculate base percentage
         base_percentage = (matches / total_possible) * 100 if total_possible > 0 else 0
@@ -1025,44 +1259,35 @@ Sistema de Automatización de Búsqueda de Empleo
         elif final_percentage > 95:
             final_percentage = 95  # Maximum 95% to be realistic
         
-        # Add some randomization for variety (±5%)
-        import random
-        variation = random.randint(-5, 5)
-        final_percentage = max(35, min(95, final_percentage + variation))
+        # Add some variation for variety (±5%)
+        if randomize:
+            import random
+            variation = stable_variation(content_hash, 5) if deterministic else random.randint(-5, 5)
+            final_percentage = max(35, min(95, final_percentage + variation))
         
-        return int(final_percentage)
+        score = int(final_percentage)
+        if memoize:
+            self.score_cache.put(content_hash, score)
+        return score
     
-    def estimate_salary_range(self, job):
-        """Estimate salary range based on job title and description"""
-        job_text = f"{job['title']} {job['description']}".lower()
+    def calculate_compatibility_batch(self, jobs, randomize=True):
+        """Compatibility of a list or DataFrame of jobs, vectorized (see batch_scoring)
         
-        # Basic salary estimation based on keywords
-        if 'senior' in job_text:
-            return '45000-60000 EUR'
-        elif 'junior' in job_text:
-            return '25000-35000 EUR'
-        elif 'lead' in job_text or 'manager' in job_text:
-            return '50000-70000 EUR'
-        else:
-            return '35000-50000 EUR'
+        Returns an int Series with the same values calculate_compatibility
+        gives for each job.
+        """
+        deterministic = self.config.get('scoring', {}).get('deterministic', True)
+        return score_compatibility(jobs, self.config['job_search']['keywords'], KEY_SKILLS, randomize, deterministic)
+    
+    def estimate_salary_range(self, job):
+        """Salary stated in the posting, or an estimate from its seniority level"""
+        fields = get_job_fields(job)
+        return format_salary(fields) or SALARY_ESTIMATES.get(fields['seniority'], '35000-50000 EUR')
     
     def get_experience_requirement(self, job):
-        """Extract experience requirement from job description"""
-        job_text = job['description'].lower()
-        
-        # Look for experience patterns
-        if 'senior' in job_text:
-            return '5+ años de experiencia'
-        elif 'junior' in job_text:
-            return '0-2 años de experiencia'
-        elif 'lead' in job_text:
-            return '7+ años de experiencia'
-        elif '3' in job_text and 'año' in job_text:
-            return '3+ años de experiencia'
-        elif '2' in job_text and 'año' in job_text:
-            return '2+ años de experiencia'
-        else:
-            return '2-5 años de experiencia'
+        """Experience stated in the posting, or an estimate from its seniority level"""
+        fields = get_job_fields(job)
+        return format_experience(fields) or EXPERIENCE_ESTIMATES.get(fields['seniority'], '2-5 años de experiencia')
     
     def get_cv_files_for_job(self, job, job_index):
         """Get CV files generated for this specific job"""
@@ -1088,9 +1313,16 @@ Sistema de Automatización de Búsqueda de Empleo
 
 def main():
     """Main function to run the automation"""
+    parser = argparse.ArgumentParser(description="Daily job search automation")
+    parser.add_argument('--no-loose-files', action='store_true',
+                        help="Only write the ZIP archive, not each CV and cover letter as a file")
+    args = parser.parse_args()
+    
     try:
         # Initialize automation system
         automation = JobAutomationSystem()
+        if args.no_loose_files:
+            automation.config.setdefault('documents', {})['loose_files'] = False
         
         # Run daily automation
         success = automation.run_daily_automation()
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Skill bitmap index for the Job Automation System
+Every canonical skill (the skills extract_job_skills reports plus the
+config.json keywords) maps to a bitmap of job-store row IDs, so questions
+like "Databricks AND Power BI in the last 90 days" are answered with a few
+bitwise operations instead of rescanning every stored description
+"""
+
+import logging
+import re
+import zlib
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from job_text import fold_keyword, get_job_text
+from keyword_matcher import KeywordIndex
+
+logger = logging.getLogger(__name__)
+
+# Common BI and Data skills to look for (keyword -> skill name)
+SKILL_KEYWORDS = {
+    'power bi': 'Power BI',
+    'python': 'Python',
+    'sql': 'SQL',
+    'tableau': 'Tableau',
+    'r ': 'R',
+    'dashboard': 'Dashboard',
+    'excel': 'Excel',
+    'etl': 'ETL',
+    'azure': 'Azure',
+    'aws': 'AWS',
+    'machine learning': 'Machine Learning',
+    'data warehouse': 'Data Warehouse',
+    'spark': 'Spark',
+    'hadoop': 'Hadoop',
+    'qlik': 'QlikView',
+    'looker': 'Looker',
+    'databricks': 'Databricks'
+}
+
+OPERATORS = ('AND', 'OR', 'NOT')
+QUERY_TOKEN_RE = re.compile(r"\(|\)|[^()\s]+")
+
+
+def bitmap_from_positions(positions):
+    """Bitmap (a Python int) with the given bit positions set"""
+    positions = np.asarray(positions, dtype=np.int64)
+    if not len(positions):
+        return 0
+    bits = np.zeros(int(positions.max()) + 1, dtype=np.uint8)
+    bits[positions] = 1
+    return int.from_bytes(np.packbits(bits, bitorder='little').tobytes(), 'little')
+
+
+def bitmap_positions(bitmap):
+    """Set bit positions of a bitmap, in increasing order"""
+    if not bitmap:
+        return []
+    data = np.frombuffer(bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little'), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(data, bitorder='little')).tolist()
+
+
+def compress_bitmap(bitmap):
+    return zlib.compress(bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little'))
+
+
+def decompress_bitmap(data):
+    return int.from_bytes(zlib.decompress(data), 'little')
+
+
+class SkillIndex:
+    """Bitmaps of job-store row IDs per canonical skill, with boolean queries
+
+    Row IDs grow with first_seen (the job store never deletes jobs), so a
+    time window is a row ID range.
+    """
+
+    def __init__(self, skills):
+        """Initialize the index
+
+        skills maps a skill name to the keywords that indicate it, e.g.
+        {"Power BI": ["power bi"]}. Names are looked up case- and
+        accent-insensitively.
+        """
+        self.names = {}
+        self.patterns = {}
+        for name, keywords in skills.items():
+            key = fold_keyword(name).strip()
+            self.names.setdefault(key, name)
+            for keyword in keywords:
+                self.patterns.setdefault(fold_keyword(keyword), set()).add(key)
+
+        self.keyword_index = KeywordIndex(list(self.patterns), cache_size=0)
+        self.bitmaps = {key: 0 for key in self.names}
+        self.indexed_rowids = {key: 0 for key in self.names}
+
+    @classmethod
+    def from_config(cls, config):
+        """Index the extract_job_skills skills and the config.json keywords"""
+        skills = {}
+        for keyword, name in SKILL_KEYWORDS.items():
+            skills.setdefault(name, []).append(keyword)
+        for keyword in config.get('job_search', {}).get('keywords', []):
+            skills.setdefault(keyword, []).append(keyword)
+        return cls(skills)
+
+    @property
+    def indexed_rowid(self):
+        """Highest row ID every skill has been indexed up to"""
+        return min(self.indexed_rowids.values(), default=0)
+
+    def all_jobs(self):
+        """Bitmap of every indexed row (row IDs start at 1)"""
+        return (1 << (self.indexed_rowid + 1)) - 2
+
+    def skills_of(self, job):
+        """Canonical skill keys found in a job's title and description"""
+        job_text = get_job_text(job)
+        found = self.keyword_index.match(job_text).found
+        return {key for keyword in found for key in self.patterns.get(keyword, ())}
+
+    def add_rows(self, rows):
+        """Index (rowid, job) pairs with rowids above what is already indexed
+
+        Returns the number of rows added. Bits are collected per skill first
+        and merged once, so a large backfill stays linear.
+        """
+        positions = {key: [] for key in self.names}
+        start = self.indexed_rowid
+        last_rowid = start
+        added = 0
+        for rowid, job in rows:
+            if rowid <= start:
+                continue
+            for key in self.skills_of(job):
+                if rowid > self.indexed_rowids[key]:
+                    positions[key].append(rowid)
+            last_rowid = max(last_rowid, rowid)
+            added += 1
+
+        for key, rowids in positions.items():
+            if rowids:
+                self.bitmaps[key] |= bitmap_from_positions(rowids)
+            self.indexed_rowids[key] = max(self.indexed_rowids[key], last_rowid)
+        return added
+
+    def update(self, job_store):
+        """Index the jobs stored since the last update"""
+        return self.add_rows(job_store.iter_job_rows(after_rowid=self.indexed_rowid))
+
+    def load(self, job_store):
+        """Load the persisted bitmaps; skills new to the config start unindexed"""
+        for skill, (data, indexed_rowid) in job_store.get_skill_bitmaps().items():
+            if skill in self.bitmaps:
+                self.bitmaps[skill] = decompress_bitmap(data)
+                self.indexed_rowids[skill] = indexed_rowid
+
+    def save(self, job_store):
+        job_store.save_skill_bitmaps({
+            key: (compress_bitmap(bitmap), self.indexed_rowids[key]) for key, bitmap in self.bitmaps.items()
+        })
+
+    @classmethod
+    def open(cls, config, job_store):
+        """Index from config.json, brought up to date with the job store and saved"""
+        index = cls.from_config(config)
+        index.load(job_store)
+        added = index.update(job_store)
+        if added:
+            index.save(job_store)
+        logger.info(f"Skill index: {added} new jobs indexed, {index.indexed_rowid} in total")
+        return index
+
+    def bitmap(self, skill):
+        """Bitmap of the jobs needing a skill; raises ValueError for unknown skills"""
+        key = fold_keyword(skill).strip()
+        if key not in self.bitmaps:
+            raise ValueError(f"Unknown skill: {skill}")
+        return self.bitmaps[key]
+
+    def query(self, expression, min_rowid=0):
+        """Bitmap of the jobs matching an expression such as
+        "databricks AND (power bi OR tableau) AND NOT aws"
+
+        NOT binds tighter than AND, which binds tighter than OR. Only rows
+        from min_rowid on are kept.
+        """
+        tokens = []
+        words = []
+        for token in QUERY_TOKEN_RE.findall(expression):
+            if token.upper() in OPERATORS or token in '()':
+                if words:
+                    tokens.append(' '.join(words))
+                    words = []
+                tokens.append(token.upper())
+            else:
+                words.append(token)
+        if words:
+            tokens.append(' '.join(words))
+
+        result, position = self._parse_or(tokens, 0)
+        if position != len(tokens):
+            raise ValueError(f"Unexpected '{tokens[position]}' in query: {expression}")
+        return result >> min_rowid << min_rowid if min_rowid else result
+
+    def _parse_or(self, tokens, position):
+        result, position = self._parse_and(tokens, position)
+        while position < len(tokens) and tokens[position] == 'OR':
+            other, position = self._parse_and(tokens, position + 1)
+            result |= other
+        return result, position
+
+    def _parse_and(self, tokens, position):
+        result, position = self._parse_not(tokens, position)
+        while position < len(tokens) and tokens[position] == 'AND':
+            other, position = self._parse_not(tokens, position + 1)
+            result &= other
+        return result, position
+
+    def _parse_not(self, tokens, position):
+        if position >= len(tokens):
+            raise ValueError("Incomplete query")
+        token = tokens[position]
+        if token == 'NOT':
+            result, position = self._parse_not(tokens, position + 1)
+            return self.all_jobs() & ~result, position
+        if token == '(':
+            result, position = self._parse_or(tokens, position + 1)
+            if position >= len(tokens) or tokens[position] != ')':
+                raise ValueError("Missing ')' in query")
+            return result, position + 1
+        if token in OPERATORS or token == ')':
+            raise ValueError(f"Unexpected '{token}' in query")
+        return self.bitmap(token), position + 1
+
+    def search(self, job_store, expression, days=None):
+        """Stored jobs matching a skill query, optionally first seen in the last `days` days"""
+        min_rowid = 0
+        if days:
+            since = (datetime.now() - timedelta(days=days)).isoformat(timespec='seconds')
+            min_rowid = job_store.first_rowid_since(since)
+            if min_rowid is None:
+                return []
+        return job_store.get_jobs_by_rowid(bitmap_positions(self.query(expression, min_rowid)))
+
+    def summary_lines(self):
+        """Jobs per skill, most common first"""
+        counts = sorted(((bitmap.bit_count(), self.names[key]) for key, bitmap in self.bitmaps.items()),
+                        reverse=True)
+        return [f"{name}: {count} jobs" for count, name in counts]
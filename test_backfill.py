@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the parallel backfill of job scores and extraction
+"""
+
+from backfill import run_backfill
+from job_store import JobStore
+
+
+DESCRIPTIONS = ["Senior analista con Power BI y SQL, 5 años de experiencia",
+                "Junior data analyst, Python y Tableau",
+                "Business Intelligence con Databricks en Azure"]
+
+
+def analyses(store):
+    return {job['job_id']: store.get_job_analysis(job['job_id']) for job in store.iter_jobs()}
+
+
+def test_parallel_backfill_matches_serial(tmp_path, make_job):
+    """A 2-worker pool stores the same analysis as the in-process run"""
+    serial = JobStore(str(tmp_path / "serial.db"))
+    parallel = JobStore(str(tmp_path / "parallel.db"))
+    for store in (serial, parallel):
+        store.record_seen_many([make_job(i, description=DESCRIPTIONS[i % len(DESCRIPTIONS)]) for i in range(25)])
+
+    assert run_backfill(serial, workers=1, chunk_size=4)['jobs'] == 25
+    assert run_backfill(parallel, workers=2, chunk_size=4)['jobs'] == 25
+
+    expected = analyses(serial)
+    found = analyses(parallel)
+    assert {job_id: (a['score'], a['skills'], a['experience']) for job_id, a in found.items()} == \
+        {job_id: (a['score'], a['skills'], a['experience']) for job_id, a in expected.items()}
+
+    analysis = next(iter(expected.values()))
+    assert 'Power BI' in analysis['skills'] and analysis['fingerprint']
+    assert serial.get_job(analysis['job_id'])['score'] == analysis['score']
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for vectorized compatibility scoring
+"""
+
+import random
+
+import pandas as pd
+
+from simple_automation import JobAutomationSystem
+
+WORDS = ("python sql power bi tableau data analytics business intelligence etl azure excel "
+         "análisis datos madrid senior junior r equipo dashboard").split()
+
+
+def make_jobs(count, seed=3):
+    rng = random.Random(seed)
+    return [{
+        "title": " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 5))).title(),
+        "description": " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 40))),
+    } for _ in range(count)]
+
+
+def test_batch_matches_per_job_scores():
+    """Without randomness every batch score equals calculate_compatibility"""
+    automation = JobAutomationSystem()
+    jobs = make_jobs(300)
+
+    expected = [automation.calculate_compatibility(job, randomize=False) for job in jobs]
+    assert automation.calculate_compatibility_batch(jobs, randomize=False).tolist() == expected
+
+    frame = pd.DataFrame(jobs, index=[f"job-{i}" for i in range(len(jobs))])
+    scores = automation.calculate_compatibility_batch(frame, randomize=False)
+    assert scores.index.equals(frame.index) and scores.tolist() == expected
+
+
+def test_batch_variation_matches_per_job_scores():
+    """Deterministic variation, and random variation with the same seed, match the per-job loop"""
+    automation = JobAutomationSystem()
+    jobs = make_jobs(50, seed=5)
+
+    automation.config['scoring'] = {"deterministic": True, "cache": False}
+    expected = [automation.calculate_compatibility(job) for job in jobs]
+    assert automation.calculate_compatibility_batch(jobs).tolist() == expected
+
+    automation.config['scoring'] = {"deterministic": False}
+    random.seed(11)
+    expected = [automation.calculate_compatibility(job) for job in jobs]
+    random.seed(11)
+    assert automation.calculate_compatibility_batch(jobs).tolist() == expected
+    assert automation.calculate_compatibility_batch([]).tolist() == []
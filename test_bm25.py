@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for BM25 relevance ranking
+"""
+
+from bm25 import BM25Ranker, query_terms
+from job_store import JobStore
+
+CONFIG = {"job_search": {"keywords": ["python", "power bi", "databricks"]}}
+
+
+def test_query_terms_follow_document_tokens():
+    assert query_terms(["Power BI", "análisis-datos", "predictive analytics platform"]) == \
+        ["power bi", "analisis datos", "predictive analytics", "analytics platform"]
+
+
+def test_rare_terms_and_short_postings_rank_higher():
+    """IDF favours rare keywords and length normalization favours focused postings"""
+    ranker = BM25Ranker(CONFIG["job_search"]["keywords"])
+    for i in range(20):
+        ranker.add_document(f"python developer {i}".split())
+    ranker.add_document("databricks engineer".split())
+
+    rare = {"title": "Databricks", "description": "databricks"}
+    common = {"title": "Python", "description": "python"}
+    long_posting = {"title": "Python", "description": "python " + "equipo " * 40}
+    assert ranker.score(rare) > ranker.score(common) > ranker.score(long_posting) > 0
+    assert [job["title"] for job in ranker.rank([common, rare])] == ["Databricks", "Python"]
+
+
+def test_incremental_statistics_match_full_rebuild(tmp_path, make_job):
+    """Updating run by run gives the same statistics as counting the corpus at once"""
+    store = JobStore(str(tmp_path / "jobs.db"))
+    store.record_seen_many([make_job(1, title="Python", description="Python y Power BI"), make_job(2, title="BI", description="Power BI")])
+    assert BM25Ranker.open(CONFIG, store).doc_count == 2
+
+    store.record_seen_many([make_job(3, title="Data", description="Databricks y Python")])
+    incremental = BM25Ranker.open(CONFIG, store)
+
+    rebuilt = BM25Ranker(CONFIG["job_search"]["keywords"])
+    rebuilt.add_document("python python y power bi".split())
+    rebuilt.add_document("bi power bi".split())
+    rebuilt.add_document("data databricks y python".split())
+
+    assert incremental.doc_count == rebuilt.doc_count == 3
+    assert incremental.total_length == rebuilt.total_length
+    assert incremental.doc_freq == rebuilt.doc_freq == {"python": 2, "power bi": 2, "databricks": 1}
+
+
+def test_only_profile_terms_are_stored(tmp_path, make_job):
+    """The job store keeps profile term counts only; a changed profile is recounted over the stored jobs"""
+    store = JobStore(str(tmp_path / "jobs.db"))
+    store.record_seen_many([make_job(1, title="Python", description="Python y Power BI"), make_job(2, title="Data", description="Databricks y SQL")])
+    BM25Ranker.open(CONFIG, store)
+    stored_terms = {row[0] for row in store.conn.execute("SELECT term FROM term_stats")}
+    assert stored_terms == {"python", "power bi", "databricks"}
+
+    changed = {"job_search": {"keywords": ["python", "sql"]}}
+    ranker = BM25Ranker.open(changed, store)
+    assert ranker.doc_freq == {"python": 1, "sql": 1}
+    assert store.get_term_doc_freqs(["python", "power bi", "databricks", "sql"]) == {"python": 1, "sql": 1}
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the parallel document rendering stage
+"""
+
+import io
+import os
+import zipfile
+
+from docx import Document
+
+from document_renderer import DocumentRenderer
+from job_store import JobStore
+from simple_automation import JobAutomationSystem
+
+JOBS = [
+    {"title": "Data Analyst", "company": "BBVA", "description": "Python y Tableau"},
+    {"title": "BI/Reporting Developer", "company": "Acme", "description": "Power BI"},
+    {"title": "Data Scientist", "company": "Repsol", "description": "machine learning en Azure"},
+]
+
+
+def test_pool_results_are_ordered_and_failures_isolated(tmp_path):
+    """Worker results come back in submission order; a failing document does not stop the rest"""
+    automation = JobAutomationSystem()
+    outcomes = {}
+    for workers in (1, 2):
+        output_dir = tmp_path / f"workers_{workers}"
+        os.makedirs(output_dir)
+        renderer = DocumentRenderer(automation, workers)
+        try:
+            results = renderer.render(JOBS, str(output_dir))
+        finally:
+            renderer.close()
+
+        assert [(result.job['title'], result.kind) for result in results] == \
+            [(job['title'], kind) for job in JOBS for kind in ('cv', 'cover_letter')]
+        # "/" in the title points at a folder that does not exist
+        assert [result.error is not None for result in results] == [False, False, True, True, False, False]
+        assert renderer.rendered == 4 and renderer.failed == 2
+        outcomes[workers] = sorted(os.listdir(output_dir))
+
+    assert outcomes[1] == outcomes[2] and len(outcomes[1]) == 4
+
+
+def test_no_loose_files_leaves_only_the_archive(tmp_path):
+    """Documents and the summary are streamed into the ZIP without touching the output folder"""
+    automation = JobAutomationSystem()
+    output_dir = tmp_path / "output"
+    os.makedirs(output_dir)
+    store = JobStore(str(tmp_path / "jobs.db"))
+    jobs = [dict(job, location="Madrid", url=f"https://example.com/{i}") for i, job in enumerate(JOBS)
+            if '/' not in job['title']]
+    for job in jobs:
+        store.record_seen(job)
+    renderer = DocumentRenderer(automation, 1, loose_files=False)
+    try:
+        documents = renderer.render(jobs, str(output_dir))
+    finally:
+        renderer.close()
+    assert all(result.path is None for result in documents)
+
+    zip_path = automation.create_job_applications_zip(jobs, str(output_dir), documents)
+    for result in documents:
+        automation.record_document(result, store, zip_path)
+
+    assert os.listdir(output_dir) == [os.path.basename(zip_path)]
+    assert all(result.data is None for result in documents)
+    with zipfile.ZipFile(zip_path) as archive:
+        names = archive.namelist()
+        assert sorted(names[:-1]) == sorted(result.name for result in documents)
+        assert names[-1].startswith("Job_Summary_")
+        assert "CVs generated: 4" in archive.read(names[-1]).decode('utf-8')
+        Document(io.BytesIO(archive.read(names[0])))
+
+        # Artifacts point into the archive, not at files that were never written
+        artifacts = store.get_artifacts(jobs[0]['job_id'])
+        assert sorted(kind for kind, _ in artifacts) == ['cover_letter', 'cv']
+        for _, path in artifacts:
+            assert os.path.dirname(path) == zip_path and os.path.basename(path) in names
+    store.close()
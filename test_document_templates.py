@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for template-based CV and cover letter rendering
+"""
+
+import zipfile
+
+from docx import Document
+
+import final_automation
+import simple_automation
+
+JOBS = [
+    {"title": "Senior Data Analyst", "company": "BBVA", "description": "Python, SQL y Tableau en Azure"},
+    {"title": "BI Developer", "company": "Acme & Co", "description": "Power BI <dashboards>"},
+]
+
+
+def document_parts(path):
+    """XML parts that make up what the document shows"""
+    with zipfile.ZipFile(path) as archive:
+        return {name: archive.read(name) for name in archive.namelist() if name.startswith('word/')}
+
+
+def test_templates_render_the_same_documents_as_building_from_scratch(tmp_path):
+    for automation in (simple_automation.JobAutomationSystem(), final_automation.JobAutomationSystem()):
+        automation.config.setdefault('documents', {})['engine'] = 'python-docx'
+        for job in JOBS:
+            for kind, fields, build in (
+                ('cv', automation.get_cv_fields(job), automation.build_cv_document),
+                ('cover_letter', automation.get_cover_letter_fields(job), automation.build_cover_letter_document),
+            ):
+                expected = tmp_path / f"expected_{kind}.docx"
+                build(fields).save(expected)
+                rendered = tmp_path / f"rendered_{kind}.docx"
+                automation.get_document_template(kind).render(fields, rendered)
+                assert document_parts(rendered) == document_parts(expected)
+
+    cv_path = automation.generate_cv_for_job(JOBS[1], str(tmp_path))
+    document = Document(cv_path)
+    assert document.sections[0].header.paragraphs[0].text == "CV for BI Developer - Acme & Co"
+    assert automation.get_document_template('cv').renders == 3
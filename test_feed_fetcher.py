@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the concurrent feed fetcher
+"""
+
+import threading
+import time
+
+from feed_fetcher import ConcurrentFeedFetcher
+
+
+def test_results_keep_feed_order():
+    """Results come back in input order even when later feeds finish first"""
+    delays = {"http://a/1": 0.05, "http://b/2": 0.0, "http://c/3": 0.02}
+
+    def fetch(feed_url):
+        time.sleep(delays[feed_url])
+        return feed_url.upper()
+
+    fetcher = ConcurrentFeedFetcher(fetch, max_workers=3)
+    results = fetcher.fetch_all(list(delays))
+
+    assert [url for url, _, _ in results] == list(delays)
+    assert [result for _, result, _ in results] == [url.upper() for url in delays]
+
+
+def test_per_host_limit_is_respected():
+    """No more than per_host_limit requests run against one host at once"""
+    active = {}
+    peak = {}
+    lock = threading.Lock()
+
+    def fetch(feed_url):
+        host = feed_url.split('/')[2]
+        with lock:
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+        time.sleep(0.02)
+        with lock:
+            active[host] -= 1
+        return host
+
+    feed_urls = [f"http://host{i % 2}/feed-{i}" for i in range(8)]
+    fetcher = ConcurrentFeedFetcher(fetch, max_workers=8, per_host_limit=2)
+    fetcher.fetch_all(feed_urls)
+
+    assert peak == {"host0": 2, "host1": 2}
+
+
+def test_errors_are_captured_per_feed():
+    """A failing feed does not stop the others"""
+    def fetch(feed_url):
+        if feed_url.endswith('bad'):
+            raise ValueError("broken feed")
+        return "ok"
+
+    fetcher = ConcurrentFeedFetcher(fetch)
+    results = fetcher.fetch_all(["http://a/good", "http://a/bad"])
+
+    assert results[0] == ("http://a/good", "ok", None)
+    assert isinstance(results[1][2], ValueError)
+
+
+def test_dispatch_errors_fail_the_remaining_feeds():
+    """An error in the dispatcher (here the rate limiter) is reported for each feed instead of hanging"""
+    class BrokenLimiter:
+        def ready_in(self, feed_url):
+            if "://b/" in feed_url:
+                raise RuntimeError("limiter broken")
+            return 0.0
+
+    fetcher = ConcurrentFeedFetcher(lambda feed_url: "ok", rate_limiter=BrokenLimiter())
+    result = []
+    worker = threading.Thread(target=lambda: result.extend(fetcher.fetch_all(["http://a/1", "http://b/2", "http://b/3"])))
+    worker.start()
+    worker.join(timeout=5)
+
+    assert not worker.is_alive()
+    assert [feed_url for feed_url, _, _ in result] == ["http://a/1", "http://b/2", "http://b/3"]
+    assert all(isinstance(error, RuntimeError) for _, _, error in result)
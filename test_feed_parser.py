@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the streaming feed parser
+"""
+
+import feedparser
+
+from feed_parser import iter_chunks, iter_feed_entries
+from final_automation import JobAutomationSystem
+from http_cache import BodyReader
+from local_feed_server import build_rss_feed
+
+ATOM_FEED = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Jobs</title>
+  <entry>
+    <title>Data Analyst</title>
+    <link href="https://jobs.example.com/atom/1"/>
+    <author><name>Acme</name></author>
+    <summary>SQL and Power BI in Bilbao</summary>
+    <updated>2025-01-06T09:00:00Z</updated>
+  </entry>
+</feed>"""
+
+
+def test_rss_entries_match_feedparser():
+    """Streamed RSS entries carry the same fields feedparser extracts"""
+    data = build_rss_feed("python", items_per_feed=12)
+    entries = list(iter_feed_entries(iter_chunks(data, chunk_size=256)))
+    expected = feedparser.parse(data).entries
+
+    assert len(entries) == len(expected) == 12
+    for entry, reference in zip(entries, expected):
+        assert entry.title == reference.title
+        assert entry.link == reference.link
+        assert entry.author == reference.author
+        assert entry.published == reference.published
+
+
+def test_atom_entries():
+    """Atom links, nested authors and summaries are mapped to entry fields"""
+    entry, = iter_feed_entries([ATOM_FEED])
+
+    assert entry.title == "Data Analyst"
+    assert entry.link == "https://jobs.example.com/atom/1"
+    assert entry.author == "Acme"
+    assert entry.summary == "SQL and Power BI in Bilbao"
+
+
+def test_parse_stops_at_entry_budget():
+    """Only the start of a large feed is read once enough relevant entries are found"""
+    data = build_rss_feed("big-data", items_per_feed=5000)
+    reader = BodyReader(iter_chunks(data))
+
+    automation = JobAutomationSystem()
+    entries = automation.parse_feed_entries("https://jobs.example.com/big-data/", reader, max_entries=5)
+
+    assert len(entries) == 5
+    assert reader.bytes_read < len(data) // 10
+
+
+def test_byte_cap_keeps_complete_entries():
+    """A truncated body still yields the entries that arrived in full"""
+    data = build_rss_feed("python", items_per_feed=100)
+    reader = BodyReader(iter_chunks(data, chunk_size=1024), max_bytes=4096)
+    entries = list(iter_feed_entries(reader))
+
+    assert reader.truncated
+    assert 0 < len(entries) < 100
+    assert all(entry.link.startswith("https://jobs.example.com/python/") for entry in entries)
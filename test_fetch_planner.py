@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the yield-aware fetch planner
+"""
+
+from fetch_planner import FetchPlanner
+from final_automation import JobAutomationSystem
+from job_store import JobStore
+from local_feed_server import LocalFeedServer
+
+
+def history(runs, requested, relevant, new_jobs, fetch_seconds):
+    return {'runs': runs, 'requested': requested, 'relevant': relevant,
+            'new_jobs': new_jobs, 'fetch_seconds': fetch_seconds}
+
+
+def test_budget_follows_historical_yield():
+    """Feeds that brought more new jobs get a larger share of the entry budget"""
+    planner = FetchPlanner(exploration=0, history={
+        "busy": history(5, 50, 50, 40, 5),
+        "quiet": history(5, 50, 50, 2, 5),
+    })
+    budgets = planner.plan({"busy": 10, "quiet": 10, "unknown": 5})
+
+    assert budgets["unknown"] == 5
+    assert budgets["busy"] > budgets["quiet"] >= 1
+    assert planner.decisions["unknown"]["reason"] == "new feed"
+
+
+def test_exhausted_feed_is_capped():
+    """A feed that returned fewer relevant entries than asked is not given many more"""
+    planner = FetchPlanner(exploration=0, history={
+        "small": history(2, 20, 4, 4, 1),
+        "large": history(2, 20, 20, 4, 1),
+    })
+    budgets = planner.plan({"small": 10, "large": 10})
+
+    assert budgets["small"] == 3
+    assert budgets["large"] == 17
+
+
+def test_request_budget_skips_low_yield_feeds_unless_exploring():
+    """Only the best feeds are requested; exploration still tries the others"""
+    feeds = {f"feed-{i}": 5 for i in range(4)}
+    yields = {f"feed-{i}": history(3, 15, 15, 10 - 3 * i, 3) for i in range(4)}
+
+    planner = FetchPlanner(request_budget=2, exploration=0, history=yields)
+    budgets = planner.plan(feeds)
+    assert [url for url, budget in budgets.items() if budget] == ["feed-0", "feed-1"]
+
+    planner = FetchPlanner(request_budget=2, exploration=1, history=yields)
+    budgets = planner.plan(feeds)
+    assert all(budgets.values())
+    assert planner.decisions["feed-3"]["reason"] == "explore"
+
+
+def test_yields_persist_across_runs(tmp_path):
+    """A run's relevant and new counts are saved and planned from in the next run"""
+    with LocalFeedServer(latency=0, items_per_feed=20) as server:
+        feed_urls = [server.url(f"rss/feed-{i}/") for i in range(2)]
+        store = JobStore(str(tmp_path / "jobs.db"))
+
+        automation = JobAutomationSystem()
+        automation.feed_cache = None
+        for job in automation.stream_jobs(feed_urls, job_store=store):
+            automation.is_already_processed(job, store, incremental=True)
+        automation.fetch_planner.save(store)
+
+        yields = store.get_feed_yields()
+        assert set(yields) == set(feed_urls)
+        assert all(stats['relevant'] == 5 and stats['new_jobs'] == 5 for stats in yields.values())
+
+        planner = FetchPlanner.from_config(automation.config, store)
+        planner.plan({url: 5 for url in feed_urls})
+        assert all(decision['reason'] != 'new feed' for decision in planner.decisions.values())
+        store.close()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the HTML to text converter
+"""
+
+import time
+
+from html_text import html_to_text
+
+
+def test_decodes_entities_and_keeps_block_boundaries():
+    markup = ("<div><p>Analista de datos &amp; BI en Bilbao&nbsp;(remoto)</p>"
+              "<script>var tag = '<p>';</script><style>p { color: red }</style>"
+              "<ul><li>SQL</li><li><b>Power</b> BI</li></ul>Salario &gt; 40k<!-- tracking --></div>")
+    assert html_to_text(markup) == "Analista de datos & BI en Bilbao (remoto)\nSQL\nPower BI\nSalario > 40k"
+
+
+def test_keeps_stray_brackets_and_cdata():
+    assert html_to_text("a < b <![CDATA[y <c>]]> fin") == "a < b y <c> fin"
+
+
+def test_stops_at_the_output_budget():
+    markup = "<p>" + "palabra " * 100000 + "</p>" + "<script>" * 1000
+    text = html_to_text(markup, max_chars=500)
+    assert len(text) == 503 and text.endswith("...")
+    assert html_to_text("<p>corto</p>", max_chars=500) == "corto"
+
+
+def test_unclosed_tags_are_text_and_cost_one_pass():
+    assert html_to_text('Hola <b mundo <i>cruel</i> <a href="x y') == 'Hola <b mundo cruel <a href="x y'
+
+    markup = ('palabra <a href="x ' + 'texto ' * 5) * 20000
+    start = time.perf_counter()
+    text = html_to_text(markup, max_chars=500)
+    assert time.perf_counter() - start < 0.1
+    assert text.startswith('palabra <a href="x texto') and text.endswith("...")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the conditional-GET feed cache
+"""
+
+from feed_parser import iter_feed_entries
+from final_automation import JobAutomationSystem
+from http_cache import BodyReader, FeedHttpCache
+from local_feed_server import LocalFeedServer
+
+
+def parse_titles(chunks):
+    return [entry['title'] for entry in iter_feed_entries(chunks)]
+
+
+def test_revalidation_with_etags(tmp_path):
+    """A second fetch is answered with 304 and returns the stored parse"""
+    with LocalFeedServer(latency=0) as server:
+        url = server.url("rss/data-analyst/")
+
+        cache = FeedHttpCache(cache_dir=str(tmp_path))
+        titles, changed = cache.fetch(url, parse_titles)
+        assert changed and titles
+        cache.save()
+
+        cache = FeedHttpCache(cache_dir=str(tmp_path))
+        cached_titles, changed = cache.fetch(url, parse_titles)
+
+        assert not changed
+        assert cached_titles == titles
+        assert server.not_modified_count == 1
+        assert cache.stats['not_modified'] == 1
+
+
+def test_content_hash_fallback_without_validators(tmp_path):
+    """Identical bodies count as unchanged when the server ignores validators"""
+    with LocalFeedServer(latency=0, use_etags=False) as server:
+        url = server.url("rss/python/")
+
+        cache = FeedHttpCache(cache_dir=str(tmp_path))
+        titles, _ = cache.fetch(url, parse_titles)
+        cached_titles, changed = cache.fetch(url, parse_titles)
+
+        assert not changed
+        assert cached_titles == titles
+        assert cache.stats['content_hash_hits'] == 1
+        assert server.not_modified_count == 0
+
+
+def test_eviction_keeps_cache_under_max_bytes(tmp_path):
+    """Least recently used feeds are evicted once the size bound is exceeded"""
+    with LocalFeedServer(latency=0, items_per_feed=20) as server:
+        cache = FeedHttpCache(cache_dir=str(tmp_path), max_bytes=1500)
+        urls = [server.url(f"rss/feed-{i}/") for i in range(4)]
+        for url in urls:
+            cache.fetch(url, parse_titles)
+        cache.save()
+
+        assert cache.stats['evictions'] > 0
+        assert urls[-1] in cache.index
+        assert urls[0] not in cache.index
+
+
+def test_variant_change_forces_a_new_parse(tmp_path):
+    """A parse made with other settings is not reused"""
+    with LocalFeedServer(latency=0) as server:
+        url = server.url("rss/python/")
+
+        cache = FeedHttpCache(cache_dir=str(tmp_path))
+        cache.fetch(url, parse_titles, variant='5')
+        _, changed = cache.fetch(url, parse_titles, variant='10')
+
+        assert changed
+        assert cache.stats['misses'] == 2
+
+
+def test_body_reader_caps_bytes():
+    """Reading stops at max_bytes and the reader reports truncation"""
+    reader = BodyReader([b'a' * 100, b'b' * 100, b'c' * 100], max_bytes=150)
+
+    assert reader.peek(10) == b'a' * 10
+    assert b''.join(reader) == b'a' * 100 + b'b' * 50
+    assert reader.truncated
+    assert reader.bytes_read == 150
+
+
+def test_cached_run_matches_fresh_run(tmp_path):
+    """Jobs rebuilt from the cache are identical to freshly parsed ones"""
+    with LocalFeedServer(latency=0) as server:
+        feed_urls = [server.url(f"rss/feed-{i}/") for i in range(3)]
+
+        automation = JobAutomationSystem()
+        automation.feed_cache = FeedHttpCache(cache_dir=str(tmp_path))
+        fresh_jobs = automation.search_jobs_real_sources(feed_urls)
+        cached_jobs = automation.search_jobs_real_sources(feed_urls)
+
+        assert fresh_jobs
+        assert cached_jobs == fresh_jobs
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the shared HTTP client
+"""
+
+from http_client import HttpClient
+from local_feed_server import LocalFeedServer
+
+
+def make_client(**kwargs):
+    client = HttpClient(**kwargs)
+    client.delays = []
+    client.sleep = client.delays.append
+    return client
+
+
+def test_connections_are_reused_per_host():
+    """Sequential requests to one host share a keep-alive connection"""
+    with LocalFeedServer(latency=0) as server:
+        client = make_client()
+        for i in range(5):
+            response = client.get(server.url(f"rss/feed-{i}/"))
+            assert response.status_code == 200
+            assert response.headers['Content-Encoding'] == 'gzip'
+            assert b'<rss' in response.content
+
+        assert server.request_count == 5
+        assert server.connection_count == 1
+        client.close()
+
+
+def test_retries_honour_retry_after():
+    """503 answers are retried after the server's Retry-After delay"""
+    with LocalFeedServer(latency=0, fail_first=2, retry_after=3) as server:
+        client = make_client()
+        response = client.get(server.url("rss/python/"))
+
+        assert response.status_code == 200
+        assert client.delays == [3.0, 3.0]
+        assert client.stats['retries'] == 2
+        client.close()
+
+
+def test_retries_stop_after_max_retries():
+    """Once retries are exhausted the last error response is returned"""
+    with LocalFeedServer(latency=0, fail_first=10) as server:
+        client = make_client(max_retries=2, backoff_factor=1)
+        response = client.get(server.url("rss/python/"))
+
+        assert response.status_code == 503
+        assert server.request_count == 3
+        client.close()
+
+
+def test_backoff_is_exponential_and_capped():
+    """Without Retry-After the delay doubles per attempt up to backoff_max"""
+    client = HttpClient(backoff_factor=0.5, backoff_max=3)
+
+    assert [client.retry_delay(attempt) for attempt in range(5)] == [0.5, 1.0, 2.0, 3, 3]
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for record/replay of job source responses
+"""
+
+import json
+import zipfile
+
+import pytest
+
+from final_automation import JobAutomationSystem
+from http_replay import (FixtureArchive, RecordingHttpClient, ReplayHttpClient,
+                         create_http_client, fixture_key)
+from local_feed_server import LocalFeedServer
+
+
+def test_replay_matches_recorded_run(tmp_path):
+    """A replayed run produces the same jobs without the server running"""
+    archive_path = str(tmp_path / "fixtures.zip")
+
+    with LocalFeedServer(latency=0) as server:
+        feed_urls = [server.url(f"rss/feed-{i}/") for i in range(3)]
+        automation = JobAutomationSystem()
+        automation.feed_cache = None
+        automation.http = RecordingHttpClient(archive_path)
+        recorded_jobs = automation.search_jobs_real_sources(feed_urls)
+
+    automation = JobAutomationSystem()
+    automation.feed_cache = None
+    automation.http = ReplayHttpClient(archive_path, latency_scale=0)
+    replayed_jobs = automation.search_jobs_real_sources(feed_urls)
+
+    assert recorded_jobs
+    assert replayed_jobs == recorded_jobs
+    assert automation.http.stats['missing'] == 0
+
+
+def test_replay_simulates_recorded_latency(tmp_path):
+    """Replay waits the recorded response time, scaled by latency_scale"""
+    archive = FixtureArchive(str(tmp_path / "fixtures.zip"))
+    archive.add("https://jobs.example.com/rss", 200, {"ETag": '"v1"'}, b"<rss/>", 0.25)
+    archive.save()
+
+    client = ReplayHttpClient(archive.path, latency_scale=2)
+    delays = []
+    client.sleep = delays.append
+
+    response = client.get("https://jobs.example.com/rss")
+    assert response.content == b"<rss/>"
+    assert delays == [0.5]
+
+    revalidated = client.get("https://jobs.example.com/rss", headers={"If-None-Match": '"v1"'})
+    assert revalidated.status_code == 304
+
+
+def test_credentials_are_not_recorded():
+    """Redacted query parameters are left out of fixture keys"""
+    key = fixture_key("https://api.indeed.com/ads/apisearch",
+                      {"q": "data analyst", "publisher": "secret"}, redact_params=("publisher",))
+
+    assert key == "https://api.indeed.com/ads/apisearch?q=data+analyst"
+
+
+def test_unknown_archive_version_is_rejected(tmp_path):
+    """Archives written by another format version are not replayed"""
+    path = tmp_path / "fixtures.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("manifest.json", json.dumps({"format_version": 99, "responses": {}}))
+
+    with pytest.raises(ValueError):
+        FixtureArchive.load(str(path))
+
+
+def test_mode_follows_env_flags(tmp_path, monkeypatch):
+    """USE_REAL_APIS=false replays, DEBUG_MODE=true records"""
+    archive = FixtureArchive(str(tmp_path / "fixtures.zip"))
+    archive.save()
+    config = {"replay": {"archive": archive.path}}
+
+    monkeypatch.setenv("USE_REAL_APIS", "false")
+    assert isinstance(create_http_client(config), ReplayHttpClient)
+
+    monkeypatch.setenv("USE_REAL_APIS", "true")
+    monkeypatch.setenv("DEBUG_MODE", "true")
+    assert isinstance(create_http_client(config), RecordingHttpClient)
+
+    monkeypatch.setenv("DEBUG_MODE", "false")
+    assert type(create_http_client(config)).__name__ == "HttpClient"
+
+
+def test_recording_caps_bodies_like_ingestion(tmp_path):
+    """Recorded bodies are read through the ingestion byte cap"""
+    archive_path = str(tmp_path / "fixtures.zip")
+    with LocalFeedServer(latency=0) as server:
+        url = server.url("rss/feed-0/")
+        client = RecordingHttpClient(archive_path, max_response_bytes=100)
+        response = client.get(url, stream=True)
+
+    assert response.content == b''.join(response.iter_content(16384))
+    assert len(response.content) == 100
+    assert client.archive.bodies[client.archive.responses[url]['body']] == response.content
+
+
+def test_replay_without_an_archive_says_to_record_first(tmp_path, caplog):
+    config = {"replay": {"mode": "replay", "archive": str(tmp_path / "missing.zip")}}
+    with pytest.raises(FileNotFoundError):
+        create_http_client(config)
+    assert "Record one first" in caplog.text
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the structured job field extractor
+"""
+
+from job_fields import extract_fields, get_job_fields, passes_filters
+from job_record import Job
+from job_text import normalize_job_text
+from simple_automation import JobAutomationSystem
+
+
+def fields_of(title, description):
+    return extract_fields(normalize_job_text(title, description))
+
+
+def test_extracts_experience_salary_seniority_and_contract():
+    fields = fields_of("Senior Data Analyst", "Buscamos 3-5 años de experiencia. Salario 40.000 - 50.000 € "
+                                              "brutos anuales. Contrato indefinido, jornada completa.")
+    assert fields == {'experience_min': 3, 'experience_max': 5, 'salary_min': 40000, 'salary_max': 50000,
+                      'salary_currency': 'EUR', 'salary_period': 'year', 'seniority': 'senior',
+                      'contract_type': 'permanent'}
+
+    fields = fields_of("Data Engineer", "$45k-$55k per year, freelance. At least 4 years of experience.")
+    assert (fields['salary_min'], fields['salary_max'], fields['salary_currency']) == (45000, 55000, 'USD')
+    assert (fields['experience_min'], fields['contract_type']) == (4, 'freelance')
+
+    fields = fields_of("Becario BI", "Prácticas de 6 meses, 800 euros al mes")
+    assert (fields['seniority'], fields['contract_type'], fields['salary_period']) == ('intern', 'internship', 'month')
+
+
+def test_extracts_experience_stated_after_the_word():
+    """InfoJobs and Tecnoempleo put the requirement after "experiencia" """
+    for description, expected in (
+        ("Experiencia mínima de 3 años en Power BI", (3, None)),
+        ("Experiencia de 2 años con SQL", (2, None)),
+        ("Requisitos: experiencia: 2 años", (2, None)),
+        ("Experiencia requerida: de 2 a 4 años", (2, 4)),
+        ("Minimum experience of 5 years", (5, None)),
+    ):
+        fields = fields_of("Data Analyst", description)
+        assert (fields['experience_min'], fields['experience_max']) == expected, description
+
+    job = Job("Data Analyst", "Acme", "Madrid", "https://example.com/2", "Experiencia mínima de 3 años")
+    assert JobAutomationSystem().get_experience_requirement(job) == '3+ años de experiencia'
+
+
+def test_ignores_stray_numbers():
+    """A "3" or "20 años" that is not an experience requirement is not reported as one"""
+    fields = fields_of("Analista de datos", "Empresa con 20 años de historia. Python 3 y SQL.")
+    assert fields['experience_min'] is None and fields['salary_min'] is None
+
+
+def test_seniority_comes_from_the_title_only():
+    """Managers and leads named in the description are who the role reports to, not the role"""
+    fields = fields_of("Data Analyst", "Reporta al finance manager y trabaja con el lead de BI y analistas senior.")
+    assert fields['seniority'] is None
+    assert fields_of("Lead Data Analyst", "Equipo junior")['seniority'] == 'lead'
+
+    automation = JobAutomationSystem()
+    job = {"title": "Data Analyst", "company": "Acme", "description": "Reporta al finance manager"}
+    assert automation.estimate_salary_range(job) == '35000-50000 EUR'
+    assert "mentoring" not in automation.generate_custom_summary(job)
+
+
+def test_fields_are_stored_on_the_job_and_read_back():
+    job = Job("Junior Analyst", "Acme", "Madrid", "https://example.com/1", "2+ años de experiencia, 30k €")
+    fields = get_job_fields(job)
+    assert job['fields'] is fields and get_job_fields(job) is fields
+
+    automation = JobAutomationSystem()
+    assert automation.estimate_salary_range(job) == '30000 EUR'
+    assert automation.get_experience_requirement(job) == '2+ años de experiencia'
+    assert automation.estimate_salary_range({"title": "Lead Analyst", "description": ""}) == '50000-70000 EUR'
+
+
+def test_filters_keep_jobs_missing_a_field():
+    fields = fields_of("Senior Analyst", "5+ years of experience, 40.000 €")
+    assert passes_filters(fields, {})
+    assert not passes_filters(fields, {"seniority": ["junior", "mid"]})
+    assert not passes_filters(fields, {"max_experience_years": 3})
+    assert not passes_filters(fields, {"min_salary": 45000})
+    assert passes_filters(fields_of("Analyst", "SQL"), {"seniority": ["junior"], "min_salary": 45000})
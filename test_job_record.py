@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for compact job records
+"""
+
+from datetime import datetime
+
+from job_record import Job
+from job_sources import make_job
+from job_store import JobStore
+
+JOB = {
+    "title": "Data Analyst",
+    "company": "Banco Santander",
+    "location": "Madrid",
+    "url": "https://www.infojobs.net/madrid/data-analyst/of-1",
+    "description": "Python, SQL y Power BI",
+    "posted_date": "2025-03-01T09:30:00",
+    "source": "infojobs",
+}
+
+
+def test_dict_view_round_trips():
+    """A Job reads, writes and copies like the job dict it was built from"""
+    job = Job.from_dict(dict(JOB, notes="extra"))
+
+    assert dict(job) == dict(JOB, notes="extra")
+    assert job == dict(JOB, notes="extra")
+    assert job.get("job_id") is None
+    assert job.setdefault("job_id", "abc") == "abc" and job["job_id"] == "abc"
+
+    job["compatibility_override"] = 87
+    assert job.score == 87 and job["score"] == 87
+    assert job["compatibility_override"] == 87
+
+
+def test_fields_are_typed_and_interned():
+    """Dates are parsed, repeated strings shared and skills stored as IDs"""
+    first = make_job("A", "".join(["Ban", "co"]), "Madrid", "u1", "d", "Sat, 01 Mar 2025 09:30:00 +0000", "feed")
+    second = make_job("B", "".join(["Ban", "co"]), "Madrid", "u2", "d", "not a date", "feed")
+
+    assert first.company is second.company
+    assert first.posted_at == datetime.fromisoformat("2025-03-01T09:30:00+00:00")
+    assert first["posted_date"] == dict(first)["posted_date"] == "Sat, 01 Mar 2025 09:30:00 +0000"
+    assert second.posted_at is None and second["posted_date"] == "not a date"
+
+    first["skills"] = ["Python", "SQL"]
+    second["skills"] = ["SQL"]
+    assert first.skill_ids[1] == second.skill_ids[0]
+    assert first["skills"] == ["Python", "SQL"]
+
+
+def test_job_store_accepts_records(tmp_path):
+    """Existing callers keep working with Job records"""
+    store = JobStore(str(tmp_path / "jobs.db"))
+    job = Job.from_dict(JOB)
+
+    assert store.record_seen(job)
+    assert job["job_id"]
+    assert not store.record_seen(Job.from_dict(JOB))
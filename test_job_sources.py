@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the streaming job-source registry
+"""
+
+import time
+
+from job_sources import SourceAdapter, SourceRegistry, StaticJobsAdapter, job_board_sources
+
+
+class SlowAdapter(SourceAdapter):
+    """Adapter that yields one job after a delay"""
+
+    def __init__(self, name, delay):
+        super().__init__(name)
+        self.delay = delay
+
+    def iter_jobs(self):
+        time.sleep(self.delay)
+        yield {"title": self.name, "url": f"https://jobs.example.com/{self.name}"}
+
+
+class BrokenAdapter(SourceAdapter):
+    """Adapter that fails after its first job"""
+
+    def iter_jobs(self):
+        yield {"title": "first", "url": "https://jobs.example.com/first"}
+        raise RuntimeError("source went away")
+
+
+def test_first_job_arrives_before_slow_sources_finish():
+    """Consumers get the fast source's job without waiting for the slow one"""
+    registry = SourceRegistry([SlowAdapter("slow", 0.3), SlowAdapter("fast", 0.0)])
+
+    start = time.perf_counter()
+    stream = registry.stream()
+    position, job = next(stream)
+    first_latency = time.perf_counter() - start
+    rest = list(stream)
+
+    assert job["title"] == "fast"
+    assert position == (1, 0)
+    assert first_latency < 0.2
+    assert [j["title"] for _, j in rest] == ["slow"]
+
+
+def test_stats_report_yield_and_errors():
+    """Per-adapter stats count jobs and errors"""
+    registry = SourceRegistry([StaticJobsAdapter("static", [{"url": "a"}, {"url": "b"}]), BrokenAdapter("broken")])
+    jobs = list(registry.stream())
+
+    assert len(jobs) == 3
+    assert registry.stats["static"]["jobs"] == 2
+    assert registry.stats["broken"]["jobs"] == 1
+    assert registry.stats["broken"]["errors"] == 1
+    assert len(registry.summary_lines()) == 2
+
+
+def test_from_config_builds_adapters_and_skips_unknown_types():
+    """Sources are created from config.json entries"""
+    registry = SourceRegistry.from_config([
+        {"name": "samples", "type": "static", "jobs": [{"url": "a"}]},
+        {"name": "disabled", "type": "static", "enabled": False},
+        {"name": "mystery", "type": "carrier_pigeon"},
+    ], automation=None)
+
+    assert [adapter.name for adapter in registry.adapters] == ["samples"]
+
+
+def test_job_board_apis_are_skipped_without_keys(monkeypatch):
+    """API adapters derived from apis.job_boards need their key variable"""
+    monkeypatch.delenv("INFOJOBS_API_KEY", raising=False)
+    sources = job_board_sources({"apis": {"job_boards": ["https://api.infojobs.net/api/9/offer"]}})
+
+    assert sources[0]["api_key_env"] == "INFOJOBS_API_KEY"
+
+    registry = SourceRegistry.from_config(sources, automation=None)
+    assert list(registry.stream()) == []
+    assert registry.stats["infojobs_api"]["errors"] == 0
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the persistent job store
+"""
+
+from job_store import JobStore, compute_job_id
+
+
+def test_job_id_ignores_tracking_parameters(make_job):
+    """The same offer with different query strings keeps its ID"""
+    a = compute_job_id(make_job(url="https://www.infojobs.net/madrid/data-analyst/of-123?utm_source=rss"))
+    b = compute_job_id(make_job(url="http://www.infojobs.net/madrid/data-analyst/of-123/"))
+    c = compute_job_id(make_job(url="https://www.infojobs.net/madrid/data-analyst/of-456"))
+
+    assert a == b
+    assert a != c
+
+
+def test_jobs_are_new_only_once_across_runs(tmp_path, make_job):
+    """A job is new the first time and known in later runs"""
+    db_path = str(tmp_path / "jobs.db")
+    job = make_job(url="https://jobs.example.com/1")
+
+    store = JobStore(db_path)
+    assert store.record_seen(dict(job), seen_at="2025-01-06T09:00:00")
+    store.close()
+
+    store = JobStore(db_path)
+    assert not store.record_seen(dict(job), seen_at="2025-01-06T19:00:00")
+    stored = store.get_job(compute_job_id(job))
+    assert stored["first_seen"] == "2025-01-06T09:00:00"
+    assert stored["last_seen"] == "2025-01-06T19:00:00"
+    assert stored["seen_count"] == 2
+    store.close()
+
+
+def test_bulk_insert_returns_only_new_jobs(tmp_path, make_job):
+    """record_seen_many reports just the jobs that were not stored yet"""
+    store = JobStore(str(tmp_path / "jobs.db"))
+    store.record_seen_many([make_job(url="https://jobs.example.com/1")])
+
+    new_jobs = store.record_seen_many([make_job(url="https://jobs.example.com/1"),
+                                       make_job(url="https://jobs.example.com/2")])
+
+    assert [job["url"] for job in new_jobs] == ["https://jobs.example.com/2"]
+    assert store.count() == 2
+
+
+def test_artifacts_and_scores_are_recorded(tmp_path, make_job):
+    """Generated documents and scores are kept per job"""
+    store = JobStore(str(tmp_path / "jobs.db"))
+    job = make_job(url="https://jobs.example.com/1")
+    store.record_seen(job)
+
+    assert not store.has_artifacts(job["job_id"])
+
+    store.record_artifact(job["job_id"], "cv", "CV_Acme.docx")
+    store.record_score(job["job_id"], 72)
+
+    assert store.has_artifacts(job["job_id"])
+    assert store.get_artifacts(job["job_id"]) == [("cv", "CV_Acme.docx")]
+    assert store.get_job(job["job_id"])["score"] == 72
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for normalized job text
+"""
+
+import pickle
+
+from job_record import Job
+from job_text import JobTextCache, fold_text, get_job_text
+from keyword_matcher import KeywordIndex
+
+
+def test_fold_text_strips_accents_and_whitespace():
+    """Case, accents and whitespace runs are normalized"""
+    assert fold_text("  Análisis de  DATOS\n\tEspaña ") == "analisis de datos espana"
+
+
+def test_cache_reuses_text_by_content_hash():
+    """Copies of a job share one JobText; changed content is normalized again"""
+    cache = JobTextCache()
+    job = {"title": "Analista BI", "description": "Análisis   financiero", "url": "https://a.example/1"}
+
+    first = cache.get(job)
+    assert cache.get(dict(job, url="https://b.example/2")) is first
+    assert first.text == "analista bi analisis financiero"
+    assert first.tokens == ("analista", "bi", "analisis", "financiero")
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    assert cache.get(dict(job, description="Otro texto")) is not first
+
+
+def test_job_keeps_its_text_out_of_copies():
+    """A Job normalizes once, again after its description changes, and never serializes the text"""
+    job = Job(title="Analista BI", description="Análisis financiero", url="https://a.example/1")
+
+    first = get_job_text(job)
+    assert get_job_text(job) is first
+    assert "_text" not in dict(job)
+    assert pickle.loads(pickle.dumps(job))._text is None
+
+    job["description"] = "Otro texto"
+    assert get_job_text(job).text == "analista bi otro texto"
+
+
+def test_accented_keywords_match_unaccented_text():
+    """'análisis' and 'analisis' are the same keyword"""
+    index = KeywordIndex(["análisis", "año"])
+    matches = index.match_job({"title": "Analista", "description": "Analisis de datos, 3 anos"})
+
+    assert "análisis" in matches and "analisis" in matches
+    assert matches.in_description("Año")
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the single-pass keyword matcher
+"""
+
+import random
+
+from keyword_matcher import KeywordIndex, KeywordMatcher
+from simple_automation import JobAutomationSystem, SKILL_KEYWORDS
+
+JOB = {
+    "title": "Senior Data Analyst - Power BI",
+    "description": ("Buscamos analista con 3 años de experiencia en SQL, Python y Tableau. "
+                    "Valorable machine learning en Azure."),
+}
+
+
+def test_matches_equal_substring_search():
+    """Every keyword occurrence is found, overlapping ones included"""
+    rng = random.Random(7)
+    keywords = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(60)]
+    matcher = KeywordMatcher(keywords)
+
+    for _ in range(50):
+        text = "".join(rng.choice("abc ") for _ in range(80))
+        found = {keyword for _, keyword in matcher.iter_matches(text)}
+        assert found == {keyword for keyword in keywords if keyword in text}
+        for start, keyword in matcher.iter_matches(text):
+            assert text[start:start + len(keyword)] == keyword
+
+
+def test_description_matches_exclude_title():
+    """in_description only reports keywords found after the title"""
+    index = KeywordIndex(["senior", "sql", "power bi"])
+    matches = index.match_job(JOB)
+
+    assert "senior" in matches and "power bi" in matches
+    assert not matches.in_description("senior")
+    assert matches.in_description("sql")
+    assert index.match_job(dict(JOB)) is matches
+
+
+def test_consumers_match_original_keyword_scans():
+    """Helpers built on the shared match set give the same answers as per-method scans"""
+    automation = JobAutomationSystem()
+    job_text = f"{JOB['title']} {JOB['description']}".lower()
+
+    expected_skills = [name for keyword, name in SKILL_KEYWORDS.items() if keyword in job_text][:6]
+    assert automation.extract_job_skills(JOB) == expected_skills
+    assert automation.is_relevant_job(JOB)
+    assert not automation.is_relevant_job({"title": "Camarero", "description": "Turno de noche"})
+    assert automation.estimate_salary_range(JOB) == '45000-60000 EUR'
+    assert automation.get_experience_requirement({"title": "Senior", "description": "3 años de experiencia"}) == \
+        '3+ años de experiencia'
+    assert "machine learning" in automation.generate_custom_summary(JOB)
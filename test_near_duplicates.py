@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for near-duplicate job detection
+"""
+
+from job_store import JobStore
+from near_duplicates import MinHasher, NearDuplicateDetector, estimate_similarity, optimal_bands
+
+DESCRIPTION = ("Buscamos un Data Analyst con experiencia en Business Intelligence para unirse a nuestro "
+               "equipo en Madrid. Experiencia requerida en Python, SQL, Power BI y análisis de datos financieros.")
+POSTING = {"title": "Data Analyst - Business Intelligence", "company": "Banco Santander", "description": DESCRIPTION}
+
+
+def test_banding_stays_below_threshold():
+    """The LSH candidate threshold never exceeds the similarity threshold"""
+    bands, rows = optimal_bands(64, 0.7)
+    assert bands * rows == 64
+    assert (1.0 / bands) ** (1.0 / rows) <= 0.7
+
+
+def test_signatures_are_stable_and_similar_for_cross_posts():
+    """Slightly edited postings have a high estimated similarity"""
+    hasher = MinHasher()
+    original = hasher.signature(DESCRIPTION)
+
+    assert original == MinHasher().signature(DESCRIPTION)
+    assert estimate_similarity(original, hasher.signature(DESCRIPTION + " Contrato indefinido.")) > 0.7
+    assert estimate_similarity(original, hasher.signature("Camarero para restaurante en Sevilla")) < 0.2
+
+
+def test_cross_posted_job_is_collapsed_within_a_batch(make_job):
+    """The second board's copy of an offer is reported as a duplicate"""
+    detector = NearDuplicateDetector()
+    infojobs = make_job(url="https://www.infojobs.net/madrid/data-analyst/of-1", **POSTING)
+    tecnoempleo = make_job(url="https://www.tecnoempleo.com/data-analyst-bi/of-9",
+                           **dict(POSTING, title="Data Analyst Business Intelligence",
+                                  description=DESCRIPTION + " Contrato indefinido."))
+    unrelated = make_job(url="https://www.infojobs.net/sevilla/camarero/of-2", title="Camarero",
+                         company="Bar Sol", description="Camarero para restaurante en Sevilla")
+
+    assert detector.find_duplicate(infojobs) is None
+    assert detector.find_duplicate(tecnoempleo)[0] == infojobs["job_id"]
+    assert detector.find_duplicate(unrelated) is None
+    assert detector.duplicates_found == 1
+
+
+def test_duplicates_of_earlier_runs_are_found_through_the_store(tmp_path, make_job):
+    """Signatures persisted in the job store are matched in later runs"""
+    db_path = str(tmp_path / "jobs.db")
+    original = make_job(url="https://www.infojobs.net/madrid/data-analyst/of-1", **POSTING)
+    repost = make_job(url="https://www.tecnoempleo.com/data-analyst-bi/of-9", **POSTING)
+
+    store = JobStore(db_path)
+    store.record_seen(original)
+    assert NearDuplicateDetector(job_store=store).find_duplicate(original) is None
+    store.close()
+
+    store = JobStore(db_path)
+    store.record_seen(repost)
+    match = NearDuplicateDetector(job_store=store).find_duplicate(repost)
+    assert match[0] == original["job_id"]
+
+    # Without history only the current batch is checked
+    assert NearDuplicateDetector(job_store=store, use_history=False).find_duplicate(repost) is None
+
+
+def test_replacing_a_signature_uses_the_job_index(tmp_path):
+    """Storing a signature deletes the job's old buckets by index, not by scanning every bucket"""
+    store = JobStore(str(tmp_path / "jobs.db"))
+    plan = store.conn.execute("EXPLAIN QUERY PLAN DELETE FROM lsh_buckets WHERE job_id = ?", ("x",)).fetchall()
+    store.close()
+    assert any("idx_lsh_buckets_job" in row[-1] for row in plan)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the direct OOXML writer
+"""
+
+import io
+import re
+import zipfile
+
+from docx import Document
+from docx.oxml.ns import qn
+
+import final_automation
+import simple_automation
+from ooxml_writer import OoxmlTemplate, run_text
+
+JOBS = [
+    {"title": "Senior Data Analyst", "company": "BBVA", "description": "Python, SQL y Tableau en Azure"},
+    {"title": "BI <Developer>\tRemote", "company": "Acme & Co\x0b", "description": "Power BI <dashboards>"},
+]
+
+
+def paragraphs(document):
+    return [(paragraph.text, paragraph.style.name, paragraph.alignment,
+             [(run.bold, run.font.size) for run in paragraph.runs]) for paragraph in document.paragraphs]
+
+
+def test_documents_read_back_like_python_docx_documents():
+    for automation in (simple_automation.JobAutomationSystem(), final_automation.JobAutomationSystem()):
+        for job in JOBS:
+            for kind, build in (('cv', automation.build_cv_document),
+                                ('cover_letter', automation.build_cover_letter_document)):
+                fields = automation.get_document_fields(kind, job)
+                buffer = io.BytesIO()
+                OoxmlTemplate(build).render(fields, buffer)
+
+                document = Document(io.BytesIO(buffer.getvalue()))
+                expected = build({name: text.replace('\x0b', '') for name, text in fields.items()})
+                assert paragraphs(document) == paragraphs(expected)
+                if 'header' in fields:
+                    assert document.sections[0].header.paragraphs[0].text == \
+                        expected.sections[0].header.paragraphs[0].text
+
+
+def test_generate_entry_points_use_the_writer(tmp_path):
+    automation = final_automation.JobAutomationSystem()
+    cv_path = automation.generate_cv_for_job(JOBS[1], str(tmp_path))
+    assert Document(cv_path).sections[0].header.paragraphs[0].text == "CV for BI <Developer>\tRemote - Acme & Co"
+    cv_path = automation.generate_cv_for_job(JOBS[0], str(tmp_path))
+    letter_path = automation.generate_cover_letter(JOBS[0], str(tmp_path))
+
+    assert isinstance(automation.get_document_template('cv'), OoxmlTemplate)
+    assert Document(cv_path).paragraphs[4].style.name == "Heading 2"
+    assert Document(letter_path).paragraphs[2].text == "Dear BBVA Hiring Manager,"
+
+
+def test_run_text_escapes_and_breaks_lines():
+    assert run_text("a & <b>\nc\td\x00") == ('<w:t xml:space="preserve">a &amp; &lt;b&gt;</w:t><w:br/>'
+                                             '<w:t xml:space="preserve">c</w:t><w:tab/>'
+                                             '<w:t xml:space="preserve">d</w:t>')
+
+
+def test_documents_keep_the_template_styles_and_settings():
+    automation = final_automation.JobAutomationSystem()
+    fields = automation.get_cv_fields(JOBS[0])
+    expected = automation.build_cv_document(fields)
+    buffer = io.BytesIO()
+    OoxmlTemplate(automation.build_cv_document).render(fields, buffer)
+
+    with zipfile.ZipFile(buffer) as archive:
+        styles = archive.read('word/styles.xml')
+        assert re.search(rb'<w:docDefaults>.*</w:docDefaults>', styles).group(0) == \
+            re.search(rb'<w:docDefaults>.*</w:docDefaults>', expected.part._styles_part.blob).group(0)
+        assert b'w:val="14"' in archive.read('word/settings.xml')
+        assert 'word/theme/theme1.xml' in archive.namelist()
+        assert len(styles) < 10000
+
+    document = Document(io.BytesIO(buffer.getvalue()))
+    for style_name in ('Normal', 'Heading 2', 'Header'):
+        style, expected_style = document.styles[style_name], expected.styles[style_name]
+        assert style.font.size == expected_style.font.size
+        assert style.paragraph_format.space_after == expected_style.paragraph_format.space_after
+    spacing = document.styles.element.find(qn('w:docDefaults')).find(f".//{qn('w:spacing')}")
+    assert spacing.get(qn('w:line')) == "276"
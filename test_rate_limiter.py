@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for per-domain rate limiting and cross-domain scheduling
+"""
+
+import threading
+import time
+
+from feed_fetcher import ConcurrentFeedFetcher
+from rate_limiter import DomainRateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bucket_allows_burst_then_paces():
+    """After the burst, reservations queue up at the configured rate"""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+
+    clock.now = 2.0
+    assert bucket.ready_in() == 0.0
+
+
+def test_domains_share_buckets_across_subdomains():
+    """www. and api. hosts of a configured domain draw from one bucket"""
+    limiter = DomainRateLimiter(rate=None, domains={"infojobs.net": {"rate": 1, "burst": 1}},
+                                clock=FakeClock())
+    waits = []
+    limiter.sleep = waits.append
+
+    limiter.acquire("https://www.infojobs.net/rss/python/")
+    limiter.acquire("https://api.infojobs.net/api/9/offer")
+    limiter.acquire("https://www.tecnoempleo.com/rss/python/")
+
+    assert waits == [1.0]
+    assert limiter.stats["infojobs.net"] == {'requests': 2, 'delayed': 1, 'wait_seconds': 1.0, 'max_wait': 1.0}
+    assert limiter.stats["www.tecnoempleo.com"]["delayed"] == 0
+
+
+def test_scheduler_interleaves_rate_limited_hosts():
+    """Feeds of a free host start while a throttled host waits for tokens"""
+    limiter = DomainRateLimiter(rate=None, domains={"slow.example": {"rate": 10, "burst": 1}})
+    started = []
+    lock = threading.Lock()
+
+    def fetch(feed_url):
+        limiter.acquire(feed_url)
+        with lock:
+            started.append(feed_url)
+        time.sleep(0.01)
+        return feed_url
+
+    feed_urls = [f"http://slow.example/{i}" for i in range(3)] + [f"http://fast.example/{i}" for i in range(3)]
+    fetcher = ConcurrentFeedFetcher(fetch, max_workers=2, per_host_limit=2, rate_limiter=limiter)
+    results = fetcher.fetch_all(feed_urls)
+
+    assert [url for url, _, _ in results] == feed_urls
+    assert started.index("http://fast.example/0") < started.index("http://slow.example/1")
+    assert started[-1] == "http://slow.example/2"
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the content-addressed render cache
+"""
+
+import os
+import zipfile
+
+from docx import Document
+
+import final_automation
+from document_renderer import DocumentRenderer
+from render_cache import RenderCache
+
+
+def document_parts(path):
+    with zipfile.ZipFile(path) as archive:
+        return {name: archive.read(name) for name in archive.namelist() if name.startswith('word/')}
+
+
+def render(automation, cache, jobs, output_dir):
+    os.makedirs(output_dir)
+    renderer = DocumentRenderer(automation, 1, cache)
+    try:
+        return renderer.render(jobs, str(output_dir))
+    finally:
+        renderer.close()
+
+
+def test_hits_reuse_documents_and_patch_headers(tmp_path):
+    automation = final_automation.JobAutomationSystem()
+    cache = RenderCache(str(tmp_path / "cache"))
+    job = {"title": "Data Analyst", "company": "BBVA", "description": "Python y Tableau"}
+
+    first = render(automation, cache, [job], tmp_path / "first")
+    assert not any(result.cached for result in first)
+
+    # Same inputs: both documents come from the cache, identical to the first render
+    second = render(automation, RenderCache(str(tmp_path / "cache")), [job], tmp_path / "second")
+    assert all(result.cached for result in second)
+    for before, after in zip(first, second):
+        assert document_parts(before.path) == document_parts(after.path)
+
+    # Same CV body under another company: only the header part is rewritten
+    cache = RenderCache(str(tmp_path / "cache"))
+    other = dict(job, company="Acme & Co")
+    results = render(automation, cache, [other], tmp_path / "third")
+    assert results[0].cached and not results[1].cached
+    assert cache.stats['header_patches'] == 1
+    assert Document(results[0].path).sections[0].header.paragraphs[0].text == "CV for Data Analyst - Acme & Co"
+    fresh = tmp_path / "fresh.docx"
+    automation.get_document_template('cv').render(automation.get_cv_fields(other), fresh)
+    assert document_parts(results[0].path) == document_parts(fresh)
+    assert "hit rate" in cache.summary()
+
+
+def test_evicts_least_recently_used_documents(tmp_path):
+    cache = RenderCache(str(tmp_path / "cache"), max_bytes=250)
+    for i in range(3):
+        cache.store(f"key{i}", {}, b"x" * 100)
+        cache.index[f"key{i}"]['last_access'] = i
+    cache.save()
+
+    assert sorted(cache.index) == ["key1", "key2"]
+    assert not os.path.exists(tmp_path / "cache" / "key0.docx")
+    assert cache.fetch("key0", {}) is None
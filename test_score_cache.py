@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for deterministic, memoized compatibility scores
+"""
+
+from improved_compatibility_test import ImprovedCompatibilityCalculator
+from job_store import JobStore
+from simple_automation import JobAutomationSystem
+
+JOBS = [
+    {"title": "Senior Data Analyst", "description": "Python, SQL, Power BI y análisis de datos"},
+    {"title": "BI Developer", "description": "Tableau, ETL y data warehouse en Azure"},
+    {"title": "Camarero", "description": "Turno de noche"},
+]
+
+
+def test_scores_are_stable_across_instances():
+    """Deterministic mode gives the same score in every run"""
+    first = [JobAutomationSystem().calculate_compatibility(job) for job in JOBS]
+    second = [JobAutomationSystem().calculate_compatibility(job) for job in JOBS]
+    assert first == second
+
+    config = JobAutomationSystem().config
+    assert ([ImprovedCompatibilityCalculator(config).calculate_improved_compatibility(job) for job in JOBS] ==
+            [ImprovedCompatibilityCalculator(config).calculate_improved_compatibility(job) for job in JOBS])
+
+
+def test_persisted_scores_skip_scoring(tmp_path, monkeypatch):
+    """A re-run over known jobs only reads the cache; a keyword change scores again"""
+    store = JobStore(str(tmp_path / "jobs.db"))
+    automation = JobAutomationSystem()
+    automation.score_cache.attach(store)
+    expected = [automation.calculate_compatibility(job) for job in JOBS]
+    automation.score_cache.flush()
+
+    rerun = JobAutomationSystem()
+    rerun.score_cache.attach(store)
+    monkeypatch.setattr(rerun, 'get_job_matches', lambda job: 1 / 0)
+    assert [rerun.calculate_compatibility(job) for job in JOBS] == expected
+    assert rerun.score_cache.hits == len(JOBS)
+
+    changed = JobAutomationSystem()
+    changed.config['job_search']['keywords'] = changed.config['job_search']['keywords'][:3]
+    changed.score_cache = changed.create_score_cache()
+    changed.score_cache.attach(store)
+    assert changed.score_cache.fingerprint != automation.score_cache.fingerprint
+    assert not changed.score_cache.scores
+
+    improved = ImprovedCompatibilityCalculator(changed.config, store)
+    assert improved.score_cache.fingerprint == ImprovedCompatibilityCalculator(automation.config).score_cache.fingerprint
+
+
+def test_disabled_cache_is_not_used():
+    """scoring.cache false turns memoization off in both calculators"""
+    automation = JobAutomationSystem()
+    automation.config.setdefault('scoring', {})['cache'] = False
+    improved = ImprovedCompatibilityCalculator(automation.config)
+    for job in JOBS:
+        automation.calculate_compatibility(job)
+        improved.calculate_improved_compatibility(job)
+
+    assert not automation.score_cache.scores and not improved.score_cache.scores
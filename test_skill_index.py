@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the skill bitmap index
+"""
+
+import pytest
+
+from job_store import JobStore
+from skill_index import SkillIndex, bitmap_from_positions, bitmap_positions
+
+CONFIG = {"job_search": {"keywords": ["Business Intelligence", "análisis"]}}
+
+
+def test_bitmap_round_trip():
+    positions = [1, 2, 9, 64, 1000]
+    assert bitmap_positions(bitmap_from_positions(positions)) == positions
+    assert bitmap_positions(0) == []
+
+
+def test_queries_match_rescanning(tmp_path, make_job):
+    """AND/OR/NOT queries give the same jobs as scanning every description"""
+    store = JobStore(str(tmp_path / "jobs.db"))
+    descriptions = ["Databricks y Power BI", "Power BI, SQL", "Databricks, AWS", "Analisis con Tableau"]
+    store.record_seen_many([make_job(i, description=d) for i, d in enumerate(descriptions)])
+
+    index = SkillIndex.open(CONFIG, store)
+    found = lambda expression: [job['description'] for job in index.search(store, expression)]
+
+    assert found("databricks AND power bi") == ["Databricks y Power BI"]
+    assert found("Databricks AND NOT (power bi OR sql)") == ["Databricks, AWS"]
+    assert found("tableau or AWS") == ["Databricks, AWS", "Analisis con Tableau"]
+    assert found("ANÁLISIS") == ["Analisis con Tableau"]
+    assert index.search(store, "power bi", days=90)
+
+    with pytest.raises(ValueError):
+        index.query("cobol AND sql")
+    with pytest.raises(ValueError):
+        index.query("(sql AND")
+
+
+def test_index_updates_incrementally(tmp_path, make_job):
+    """A later run only indexes the jobs it added, on top of the saved bitmaps"""
+    store = JobStore(str(tmp_path / "jobs.db"))
+    store.record_seen_many([make_job(1, description="Python y SQL")])
+    SkillIndex.open(CONFIG, store)
+
+    store.record_seen_many([make_job(2, description="Python y Spark")])
+    index = SkillIndex.from_config(CONFIG)
+    index.load(store)
+    assert index.update(store) == 1
+    assert bitmap_positions(index.query("python")) == [1, 2]
+    assert bitmap_positions(index.query("python AND NOT sql")) == [2]